@@ -0,0 +1,91 @@
+"""Benchmark of `review.assign_reviews` against the row-wise assignment of the reviewer-assignment notebooks
+
+Submissions have a random track and 0 to 3 remaining reviews, reviewers prefer 1 to 3 of 12 tracks and a few
+reviews are already assigned. The row-wise implementation only runs on the smallest size. Run it with:
+
+```
+python benchmarks/bench_assignment.py
+```
+"""
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from pytanis.review import Col, assign_reviews
+
+BUFFER = 15
+SIZES = [(200, 20), (1_000, 100), (5_000, 500)]  # number of submissions and reviewers
+TRACKS = [f'Track {i}' for i in range(12)]
+
+
+def assign_rowwise(subs_df: pd.DataFrame, reviewers_df: pd.DataFrame, buffer: int) -> pd.DataFrame:
+    """Assignment of the notebooks, see `notebooks/pyconde-pydata-berlin-2024/30_reviewer-assignment_v1.ipynb`"""
+    col_rem_assign, col_n_assigned = 'Remaining Assignments', 'Current #Assignments'
+    subs_df, reviewers_df = subs_df.copy(), reviewers_df.copy()
+    reviewers_df[Col.curr_assignments] = reviewers_df[Col.curr_assignments].map(lambda x: x[:])
+
+    subs_df = subs_df.sort_values(Col.rem_nreviews, ascending=False).set_index(Col.submission)
+    subs_df[col_n_assigned] = reviewers_df[Col.curr_assignments].explode().value_counts()
+    subs_df[col_n_assigned] = subs_df[col_n_assigned].fillna(0)
+    subs_df = subs_df.reset_index()
+    subs_df[col_rem_assign] = subs_df[Col.rem_nreviews].where(
+        subs_df[Col.rem_nreviews] == 0, subs_df[Col.rem_nreviews] + buffer - subs_df[col_n_assigned]
+    )
+    reviewers_df[col_n_assigned] = reviewers_df[Col.curr_assignments].apply(len)
+
+    while subs_df[col_rem_assign].sum() > 0:
+        for row_idx, row in subs_df.iterrows():
+            sub = row[Col.submission]
+            is_preference = reviewers_df[Col.track_prefs].map(lambda x: row[Col.track] in x)  # noqa: B023
+            is_assigned = reviewers_df[Col.curr_assignments].map(lambda x: sub in x)  # noqa: B023
+            if row[col_rem_assign] > 0:
+                mask = is_preference & ~is_assigned
+                if reviewers_df.loc[mask].empty:
+                    reviewer_idx = reviewers_df.loc[~is_assigned, col_n_assigned].idxmin()
+                else:
+                    reviewer_idx = reviewers_df.loc[mask, col_n_assigned].idxmin()
+                reviewers_df.loc[reviewer_idx, Col.curr_assignments].append(sub)
+                reviewers_df.loc[reviewer_idx, col_n_assigned] += 1
+                subs_df.loc[row_idx, col_rem_assign] -= 1
+    return reviewers_df
+
+
+def frames(n_subs: int, n_reviewers: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(42)
+    subs_df = pd.DataFrame({
+        Col.submission: [f'SUB{i}' for i in range(n_subs)],
+        Col.track: rng.choice(TRACKS, n_subs),
+        Col.rem_nreviews: rng.integers(0, 4, n_subs),
+    })
+    reviewers_df = pd.DataFrame({
+        Col.email: [f'reviewer{i}@host.com' for i in range(n_reviewers)],
+        Col.track_prefs: [list(rng.choice(TRACKS, rng.integers(1, 4), replace=False)) for _ in range(n_reviewers)],
+        Col.curr_assignments: [
+            list(dict.fromkeys(f'SUB{j}' for j in rng.integers(0, n_subs, rng.integers(0, 5))))
+            for _ in range(n_reviewers)
+        ],
+    })
+    return subs_df, reviewers_df
+
+
+def main():
+    logging.disable(logging.WARNING)
+    for n_subs, n_reviewers in SIZES:
+        subs_df, reviewers_df = frames(n_subs, n_reviewers)
+        start = time.perf_counter()
+        assign_reviews(subs_df, reviewers_df, buffer=BUFFER, seed=42)
+        secs = time.perf_counter() - start
+        line = f'{n_subs:>6} submissions, {n_reviewers:>4} reviewers: {secs:7.2f} s'
+        if (n_subs, n_reviewers) == SIZES[0]:
+            start = time.perf_counter()
+            assign_rowwise(subs_df, reviewers_df, BUFFER)
+            rowwise_secs = time.perf_counter() - start
+            line += f', row-wise {rowwise_secs:7.2f} s ({rowwise_secs / secs:.0f}x)'
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark of reading HiGHS solution files against the previous line-by-line implementation
+
+The benchmark writes a synthetic solution file of a schedule with binaries for each talk, day, session, slot and
+room combination as the notebooks produce them. Run it with:
+
+```
+python benchmarks/bench_highs.py [n_columns]
+```
+"""
+
+import re
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from pytanis.highs import read_sol_columns, read_sol_file
+
+
+def read_sol_file_by_line(file_name: str) -> dict[str, float]:
+    """Previous implementation of `read_sol_file`"""
+    line_re = re.compile(r'(\w+)(?:\((\w+)\))?(_binary_indicator_var)? ([.\w-]+)')
+    sol = {}
+    with open(file_name, encoding='utf8') as fh:
+        while True:
+            line = fh.readline()
+            if line.startswith('# Columns'):
+                break
+        for line in fh.readlines():
+            if line.startswith('#'):
+                break
+            var_name, idx, binary, val = line_re.match(line.strip()).groups()  # type: ignore[union-attr]
+            binary = binary.replace('_', '.', 1) if binary else ''
+            if idx is None:
+                sol[f'{var_name}{binary}'] = float(val)
+            else:
+                idx = idx.replace('_', ',')
+                sol[f'{var_name}[{idx}]{binary}'] = float(val)
+    return sol
+
+
+def write_sol_file(file_name: Path, n_columns: int):
+    lines = [
+        f'vbSchedule(T{i // 189:03}_D{i % 3}_S{i // 3 % 3}_L{i // 9 % 3}_R{i // 27 % 7}) {int(i % 189 == 0)}'
+        for i in range(n_columns)
+    ]
+    header = [
+        'Model status',
+        'Optimal',
+        '',
+        '# Primal solution values',
+        'Feasible',
+        'Objective 42',
+        f'# Columns {n_columns}',
+    ]
+    footer = ['# Rows 0', '', '# Dual solution values', 'None']
+    file_name.write_text('\n'.join([*header, *lines, *footer]) + '\n', encoding='utf8')
+
+
+def main(n_columns: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = Path(tmp_dir) / 'schedule.sol'
+        write_sol_file(file_name, n_columns)
+        timings = {
+            'by line': min(timeit.repeat(lambda: read_sol_file_by_line(str(file_name)), number=1, repeat=3)),
+            'read_sol_file': min(timeit.repeat(lambda: dict(read_sol_file(file_name)), number=1, repeat=3)),
+            'columns': min(timeit.repeat(lambda: read_sol_columns(file_name), number=1, repeat=3)),
+            'values only': min(timeit.repeat(lambda: read_sol_columns(file_name, names=False), number=1, repeat=3)),
+        }
+    for mode, secs in timings.items():
+        speedup = timings['by line'] / secs
+        print(f'{mode:>13}: {secs * 1000:9.1f} ms ({speedup:6.1f}x)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
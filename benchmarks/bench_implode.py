@@ -0,0 +1,68 @@
+"""Benchmark of `utils.implode` against the previous implementation grouping with a Python aggregator
+
+Imploding is typically done after exploding the speakers of submissions and merging them with speaker details.
+The benchmark mimics this with a frame of 50k rows and 40 columns. Run it with:
+
+```
+python benchmarks/bench_implode.py
+```
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from pytanis.utils import implode
+
+N_ROWS = 50_000
+N_COLS = 40
+
+
+def implode_groupby(df: pd.DataFrame, cols: str | list[str]) -> pd.DataFrame:
+    """Previous implementation of `implode`"""
+    if not isinstance(cols, list):
+        cols = [cols]
+    orig_cols = df.columns
+    grp_cols = [col for col in df.columns if col not in cols]
+    df = df.groupby(grp_cols, group_keys=True, dropna=False).aggregate({col: lambda x: x.tolist() for col in cols})
+    df.reset_index(inplace=True)
+    df = df.loc[:, orig_cols]
+    return df
+
+
+def exploded_frame() -> pd.DataFrame:
+    """Submissions with 1 to 3 speakers each, exploded to one row per speaker"""
+    rng = np.random.default_rng(42)
+    n_speakers = rng.integers(1, 4, N_ROWS)
+    sub_idx = np.repeat(np.arange(len(n_speakers)), n_speakers)[:N_ROWS]
+    n_subs = sub_idx[-1] + 1
+    columns: dict[str, np.ndarray] = {'Submission': np.array([f'SUB{i:06}' for i in range(n_subs)])[sub_idx]}
+    for i in range(N_COLS - 3):
+        if i % 2:
+            columns[f'Col {i}'] = rng.integers(0, 100, n_subs)[sub_idx]
+        else:
+            columns[f'Col {i}'] = np.array([f'value {j}' for j in rng.integers(0, 1000, n_subs)])[sub_idx]
+    columns['Speaker code'] = np.array([f'SPK{i:06}' for i in range(len(sub_idx))])
+    columns['Speaker name'] = np.array([f'Speaker {i}' for i in range(len(sub_idx))])
+    return pd.DataFrame(columns)
+
+
+def main():
+    df = exploded_frame()
+    cols = ['Speaker code', 'Speaker name']
+    print(f'frame of {df.shape[0]} rows and {df.shape[1]} columns')
+    timings = {
+        'groupby + lambda (previous)': lambda: implode_groupby(df, cols),
+        'implode': lambda: implode(df, cols),
+        'implode with key': lambda: implode(df, cols, key='Submission'),
+    }
+    baseline = None
+    for name, func in timings.items():
+        secs = min(timeit.repeat(func, number=1, repeat=3))
+        baseline = baseline or secs
+        print(f'{name:>28}: {secs * 1000:8.1f} ms ({baseline / secs:5.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark of building the scheduling model with `ScheduleModel` against a Pyomo formulation as in the notebooks
+
+Both models have the same constraints and objective, but the Pyomo model is built with `itertools.product` and
+`itertools.combinations` over talks and room slots like the notebook `40_scheduling_v1` and passed to HiGHS with
+`appsi`. Only the time until the solver could start is measured. Run it with:
+
+```
+python benchmarks/bench_schedule.py [n_talks]
+```
+"""
+
+import sys
+import time
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+from pyomo.contrib.appsi.solvers import Highs
+
+from pytanis.schedule import Col, ScheduleModel, parallel_penalty
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday']
+SESSIONS = ['Morning', 'Afternoon1', 'Afternoon2', 'Evening']
+SLOTS = ['First', 'Second', 'Third', 'Fourth']
+TRACKS = ['PyData', 'PyCon', 'MLOps', 'Web', 'Community', 'Science', 'Python', 'Data Handling']
+PARALLEL_THRESHOLD = 0.5
+
+
+def event(n_talks: int) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, int], pd.DataFrame]:
+    """Talks, slots, room capacities and votes of a synthetic event with enough slots for the talks"""
+    rng = np.random.default_rng(42)
+    n_rooms = -(-n_talks // (len(DAYS) * len(SESSIONS) * len(SLOTS)))
+    rooms = [f'Room {i}' for i in range(n_rooms)]
+    slots_df = pd.DataFrame(
+        list(product(DAYS, SESSIONS, SLOTS, rooms)), columns=[Col.day, Col.session, Col.slot, Col.room]
+    )
+    slots_df[Col.duration] = np.where(slots_df[Col.slot].isin(SLOTS[:2]), 45, 30)
+    durations = rng.permutation(slots_df[Col.duration].to_numpy())[:n_talks]
+    talks_df = pd.DataFrame({
+        Col.submission: [f'T{i:04}' for i in range(n_talks)],
+        Col.duration: durations,
+        Col.track: rng.choice(TRACKS, n_talks),
+        Col.popularity: rng.random(n_talks),
+    })
+    votes_df = pd.DataFrame({
+        Col.voter: rng.integers(0, 10 * n_talks, 50 * n_talks),
+        Col.submission: rng.choice(talks_df[Col.submission], 50 * n_talks),
+        Col.vote_score: rng.integers(1, 3, 50 * n_talks),
+    }).drop_duplicates([Col.voter, Col.submission])
+    capacities = dict(zip(rooms, rng.integers(50, 500, n_rooms).tolist(), strict=True))
+    return talks_df, slots_df, capacities, votes_df
+
+
+def build_pyomo(
+    talks_df: pd.DataFrame, slots_df: pd.DataFrame, capacities: dict[str, int], penalty: np.ndarray
+) -> pyo.ConcreteModel:
+    """Pyomo formulation of the model of `ScheduleModel` in the style of the notebook"""
+    model = pyo.ConcreteModel()
+    model.sTalks = pyo.Set(initialize=talks_df[Col.submission].tolist(), ordered=True)
+    model.sDays = pyo.Set(initialize=DAYS, ordered=True)
+    model.sSessions = pyo.Set(initialize=SESSIONS, ordered=True)
+    model.sSlots = pyo.Set(initialize=SLOTS, ordered=True)
+    model.sRooms = pyo.Set(initialize=list(capacities), ordered=True)
+    model.sTracks = pyo.Set(initialize=TRACKS, ordered=True)
+
+    talk2idx = {talk: idx for idx, talk in enumerate(talks_df[Col.submission])}
+    lengths = slots_df.set_index([Col.day, Col.session, Col.slot, Col.room])[Col.duration].to_dict()
+    talk_lengths = dict(zip(talks_df[Col.submission], talks_df[Col.duration], strict=True))
+    talk_tracks = dict(zip(talks_df[Col.submission], talks_df[Col.track], strict=True))
+    pops = (talks_df[Col.popularity] - talks_df[Col.popularity].min()) / np.ptp(talks_df[Col.popularity])
+    pops_dict = dict(zip(talks_df[Col.submission], pops, strict=True))
+    caps = np.array(list(capacities.values()), dtype=float)
+    caps_dict = dict(zip(capacities, (caps - caps.min()) / np.ptp(caps), strict=True))
+
+    model.vbSchedule = pyo.Var(
+        model.sTalks, model.sDays, model.sSessions, model.sSlots, model.sRooms, domain=pyo.Binary
+    )
+    model.vbParallelTalk = pyo.Var(model.sTalks, model.sDays, model.sSessions, model.sSlots, domain=pyo.Binary)
+    model.vbCoOccurences = pyo.Var(
+        model.sTalks, model.sTalks, model.sDays, model.sSessions, model.sSlots, bounds=(0, 1)
+    )
+    model.vbTrackSessionRoom = pyo.Var(model.sDays, model.sSessions, model.sRooms, model.sTracks, domain=pyo.Binary)
+
+    model.ctTalkSlotFit = pyo.ConstraintList()
+    model.ctTalkAssigned = pyo.ConstraintList()
+    for t in model.sTalks:
+        model.ctTalkSlotFit.add(
+            sum(
+                model.vbSchedule[t, d, s, sl, r] * lengths[d, s, sl, r]
+                for d, s, sl, r in product(model.sDays, model.sSessions, model.sSlots, model.sRooms)
+            )
+            == talk_lengths[t]
+        )
+        model.ctTalkAssigned.add(sum(model.vbSchedule[t, :, :, :, :]) == 1)
+    model.ctTimeRoomOccup = pyo.ConstraintList()
+    for d, s, sl, r in product(model.sDays, model.sSessions, model.sSlots, model.sRooms):
+        model.ctTimeRoomOccup.add(sum(model.vbSchedule[:, d, s, sl, r]) <= 1)
+    model.ctParallelTalk = pyo.ConstraintList()
+    for t, d, s, sl in product(model.sTalks, model.sDays, model.sSessions, model.sSlots):
+        model.ctParallelTalk.add(model.vbParallelTalk[t, d, s, sl] == sum(model.vbSchedule[t, d, s, sl, :]))
+    model.ctCoOccurences = pyo.ConstraintList()
+    for d, s, sl in product(model.sDays, model.sSessions, model.sSlots):
+        for t1, t2 in combinations(model.sTalks, 2):
+            if penalty[talk2idx[t1], talk2idx[t2]] > 0:
+                model.ctCoOccurences.add(
+                    model.vbCoOccurences[t1, t2, d, s, sl] + 1
+                    >= model.vbParallelTalk[t1, d, s, sl] + model.vbParallelTalk[t2, d, s, sl]
+                )
+    model.ctTrackSessionRoom = pyo.ConstraintList()
+    for d, s, r, tr in product(model.sDays, model.sSessions, model.sRooms, model.sTracks):
+        model.ctTrackSessionRoom.add(
+            model.vbTrackSessionRoom[d, s, r, tr] * len(model.sSlots)
+            >= sum(
+                model.vbSchedule[t, d, s, sl, r] for t in model.sTalks if talk_tracks[t] == tr for sl in model.sSlots
+            )
+        )
+
+    def objective(model):
+        room_term = sum(
+            model.vbSchedule[t, d, s, sl, r] * (pops_dict[t] - caps_dict[r]) ** 2
+            for t, d, s, sl, r in product(model.sTalks, model.sDays, model.sSessions, model.sSlots, model.sRooms)
+        )
+        parallel_term = sum(
+            model.vbCoOccurences[t1, t2, d, s, sl] * penalty[talk2idx[t1], talk2idx[t2]]
+            for d, s, sl in product(model.sDays, model.sSessions, model.sSlots)
+            for t1, t2 in combinations(model.sTalks, 2)
+            if penalty[talk2idx[t1], talk2idx[t2]] > 0
+        )
+        return -1e6 * room_term - 1e4 * parallel_term - 100 * sum(model.vbTrackSessionRoom[...])
+
+    model.obj = pyo.Objective(sense=pyo.maximize, rule=objective)
+    return model
+
+
+def main(n_talks: int):
+    talks_df, slots_df, capacities, votes_df = event(n_talks)
+    penalty = parallel_penalty(votes_df, talks_df, threshold=PARALLEL_THRESHOLD)
+
+    start = time.perf_counter()
+    model = ScheduleModel(talks_df, slots_df, capacities=capacities, parallel=penalty)
+    schedule_secs = time.perf_counter() - start
+    print(f'ScheduleModel: {schedule_secs:7.2f} s, {model.lp.num_col_} columns, {model.lp.num_row_} rows')
+
+    start = time.perf_counter()
+    pyomo_model = build_pyomo(talks_df, slots_df, capacities, penalty)
+    Highs().set_instance(pyomo_model)
+    pyomo_secs = time.perf_counter() - start
+    print(f'Pyomo:         {pyomo_secs:7.2f} s ({pyomo_secs / schedule_secs:.0f}x)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
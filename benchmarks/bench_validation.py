@@ -0,0 +1,98 @@
+"""Benchmark of the validation modes of the Pretalx clients
+
+Validates synthetic pages of submissions with answers, as returned with `questions=all`, and of reviews
+by each model, page by page with a cached `TypeAdapter` and not at all, i.e. raw JSON. Run it with:
+
+```
+python benchmarks/bench_validation.py [n_results]
+```
+"""
+
+import sys
+import timeit
+from itertools import chain
+
+from pytanis.pretalx.client import _validated  # noqa: PLC2701
+from pytanis.pretalx.types import Review, Submission
+
+PAGE_SIZE = 25
+
+
+def _answer(idx: int, code: str) -> dict:
+    return {
+        'id': idx,
+        'answer': f'Answer {idx}',
+        'answer_file': None,
+        'question': {'id': idx % 20, 'question': {'en': f'Question {idx % 20}', 'de': f'Frage {idx % 20}'}},
+        'submission': code,
+        'review': None,
+        'person': None,
+        'options': [{'id': j, 'answer': {'en': f'Option {j}', 'de': f'Option {j}'}} for j in range(2)],
+    }
+
+
+def _submission(idx: int) -> dict:
+    code = f'SUB{idx}'
+    return {
+        'code': code,
+        'speakers': [{'code': f'SPK{idx}', 'name': 'Ada', 'biography': 'Bio', 'avatar': None}],
+        'created': '2023-01-01T10:00:00+00:00',
+        'title': f'Title {idx}',
+        'submission_type': {'en': 'Talk'},
+        'submission_type_id': 1,
+        'track': {'en': 'PyData'},
+        'track_id': 1,
+        'state': 'submitted',
+        'pending_state': None,
+        'abstract': 'Abstract',
+        'description': 'Description',
+        'duration': 30,
+        'do_not_record': False,
+        'is_featured': False,
+        'content_locale': 'en',
+        'slot': None,
+        'slot_count': 1,
+        'image': None,
+        'answers': [_answer(idx * 20 + j, code) for j in range(20)],
+        'resources': [],
+        'tags': [],
+        'tag_ids': [],
+    }
+
+
+def _review(idx: int) -> dict:
+    return {
+        'id': idx,
+        'submission': f'SUB{idx % 1000}',
+        'user': f'reviewer{idx % 50}',
+        'text': 'Looks good',
+        'score': 3.0,
+        'created': '2023-02-01T10:00:00+00:00',
+        'updated': '2023-02-01T10:00:00+00:00',
+        'answers': [],
+    }
+
+
+def _pages(results: list[dict]) -> list[list[dict]]:
+    return [results[i : i + PAGE_SIZE] for i in range(0, len(results), PAGE_SIZE)]
+
+
+def main(n_results: int):
+    for model, pages in (
+        (Submission, _pages([_submission(i) for i in range(n_results)])),
+        (Review, _pages([_review(i) for i in range(n_results)])),
+    ):
+        timings = {
+            'item': min(timeit.repeat(lambda: list(_validated(model, iter(pages))), number=1, repeat=5)),  # noqa: B023
+            'batch': min(
+                timeit.repeat(lambda: list(_validated(model, iter(pages), batch=True)), number=1, repeat=5)  # noqa: B023
+            ),
+            'raw': min(timeit.repeat(lambda: list(chain.from_iterable(pages)), number=1, repeat=5)),  # noqa: B023
+        }
+        for mode, secs in timings.items():
+            speedup = timings['item'] / secs
+            print(f'{model.__name__:>10} {mode:>5}: {secs * 1000:9.1f} ms ({speedup:6.1f}x)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
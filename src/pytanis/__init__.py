@@ -5,7 +5,7 @@ import structlog.stdlib
 from pytanis.config import get_cfg
 from pytanis.google import GSheetsClient
 from pytanis.helpdesk import HelpDeskClient
-from pytanis.pretalx import PretalxClient
+from pytanis.pretalx import AsyncPretalxClient, PretalxClient
 
 try:
     __version__ = version('pytanis')
@@ -14,7 +14,7 @@ except PackageNotFoundError:  # pragma: no cover
 finally:
     del version, PackageNotFoundError
 
-__all__ = ['GSheetsClient', 'HelpDeskClient', 'PretalxClient', '__version__', 'get_cfg']
+__all__ = ['AsyncPretalxClient', 'GSheetsClient', 'HelpDeskClient', 'PretalxClient', '__version__', 'get_cfg']
 
 # transform structlog into a logging-friendly package
 # use `logging.basicConfig(level=logging.INFO, stream=sys.stdout)` as usual
@@ -6,16 +6,17 @@ ToDo:
     * Transfer more functionality from https://github.com/PYCONDE/py_helpdesk_com
 """
 
+from collections.abc import Callable
 from typing import Any, TypeAlias, cast
 
 import httpx
-from httpx import URL, QueryParams, Response
+from httpx import URL, QueryParams, Response, codes
 from httpx_auth import Basic
 from structlog import get_logger
 
 from pytanis.config import Config, get_cfg
 from pytanis.helpdesk.types import Agent, NewTicket, Team
-from pytanis.utils import throttle
+from pytanis.utils import RateLimiter, TokenBucketLimiter
 
 _logger = get_logger()
 
@@ -26,6 +27,8 @@ JSONLst: TypeAlias = list[JSONObj]
 """Type of a JSON list of JSON objects"""
 JSON: TypeAlias = JSONObj | JSONLst
 """Type of the JSON response as returned by the HelpDesk / LiveChat API"""
+MAX_RATE_LIMITED_RETRIES: int = 5
+"""Maximum number of times a request is repeated after being rate limited by HelpDesk"""
 
 
 class HelpDeskClient:
@@ -37,15 +40,40 @@ class HelpDeskClient:
         # Generic User-Agents are filtered by helpdesk to reduce spam.
         self._headers = {'User-Agent': 'Pytanis'}
 
-        self._get_throttled = self._get
-        self._post_throttled = self._post
+        self.rate_limiter: RateLimiter
         self.set_throttling(calls=1, seconds=10)  # Helpdesk is really strange when it comes to this
 
     def set_throttling(self, calls: int, seconds: int):
-        """Throttle the number of calls per seconds to the Pretalx API"""
+        """Throttle the number of calls per seconds to the HelpDesk API
+
+        Up to `calls` requests may start at once. If HelpDesk signals rate limiting, the rate is decreased and
+        increased again up to `calls / seconds` after a while without being rate limited.
+        """
         _logger.debug('throttling', calls=calls, seconds=seconds)
-        self._get_throttled = throttle(calls, seconds)(self._get)
-        self._post_throttled = throttle(calls, seconds)(self._post)
+        self.set_rate_limiter(TokenBucketLimiter(calls / seconds, burst=calls))
+
+    def set_rate_limiter(self, rate_limiter: RateLimiter):
+        """Use a custom rate limiter for all requests to the HelpDesk API"""
+        self.rate_limiter = rate_limiter
+
+    def _throttled(self, request: Callable[[], Response]) -> Response:
+        """Send a request within the rate limit, repeat it if it was rate limited"""
+        for _ in range(MAX_RATE_LIMITED_RETRIES):
+            self.rate_limiter.acquire()
+            resp = request()
+            self.rate_limiter.update(resp)
+            if resp.status_code != codes.TOO_MANY_REQUESTS:
+                break
+            _logger.warning('rate limited by HelpDesk', url=str(resp.url), rate=self.rate_limiter.rate)
+        return resp
+
+    def _get_throttled(self, endpoint: str, params: QueryParams | None = None) -> Response:
+        """Retrieve data via GET request within the rate limit"""
+        return self._throttled(lambda: self._get(endpoint, params))
+
+    def _post_throttled(self, endpoint: str, data: dict[str, Any], params: QueryParams | None = None) -> Response:
+        """Send data via POST request within the rate limit"""
+        return self._throttled(lambda: self._post(endpoint, data, params))
 
     def _get(self, endpoint: str, params: QueryParams | None = None) -> Response:
         """Retrieve data via raw GET request"""
@@ -1,70 +1,201 @@
 """Some helper functions for HiGHS (https://highs.dev/)
 
-`pyomo` and `highspy` need to be installed, consider `pip install 'pytanis[all]'`.
+A model written with `symbolic_solver_labels` and solved with the `highs` command line tool can be loaded back with:
+
+```
+model.write('schedule.mps', io_options={'symbolic_solver_labels': True})
+# highs schedule.mps --solution_file schedule.sol
+set_solution_from_file(model, 'schedule.sol')
+```
 
-ToDo:
-    * Introduce a function `check_model_vars` that checks the names of variables and sets to be alphanumeric
-      before reading in a solution in `set_solution_from_file`.
+`pyomo` and `highspy` need to be installed, consider `pip install 'pytanis[all]'`.
 """
 
+import hashlib
+import mmap
 import re
 from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
 
-from pyomo.contrib.appsi.solvers import Highs
+import numpy as np
+from pyomo.core.base.label import TextLabeler
 from pyomo.core.base.PyomoModel import ConcreteModel
+from pyomo.core.base.var import Var, VarData
+from pyomo.core.expr.symbol_map import SymbolMap
+
+_MODEL_STATUS_RE = re.compile(rb'^Model status\r?\n(.*?)\r?$', re.MULTILINE)
+_PRIMAL_RE = re.compile(rb'^# Primal solution values\r?\n(.*?)\r?$', re.MULTILINE)
+_COLUMNS_RE = re.compile(rb'^# Columns (\d+)\r?$', re.MULTILINE)
+_OBJECTIVE_RE = re.compile(rb'^Objective (\S+)\r?$', re.MULTILINE)
+_NAMES_RE = re.compile(r'^(.*) ', re.MULTILINE)
+_VALUES_RE = re.compile(r' (\S+)\r?$', re.MULTILINE)
+_PYOMO_NAME_RE = re.compile(r'(\w+)(?:\((\w+)\))?(_binary_indicator_var)?')
+_COLUMN_VARS_ATTR = '_pytanis_column_vars'
+
+
+class HighsSolution(NamedTuple):
+    """Primal values of the columns of a HiGHS solution file in the order of the columns of the model"""
+
+    names: list[str] | None
+    values: np.ndarray
+    objective: float | None
+
+    def as_dict(self) -> dict[str, float]:
+        """Returns the mapping of column names to values"""
+        if self.names is None:
+            msg = 'Solution was read without names'
+            raise ValueError(msg)
+        return dict(zip(self.names, self.values.tolist(), strict=True))
+
 
+def read_sol_columns(file_name: str | Path, *, names: bool = True) -> HighsSolution:
+    """Read the primal values of all columns from a HiGHS solution file with default output style
 
-def read_sol_file(file_name: str) -> Iterator[tuple[str, float]]:
+    The file is memory-mapped and only the columns of its `# Primal solution values` section are decoded,
+    which must hold a feasible solution. The values are parsed in bulk,
+    so that even solution files of several hundred thousand columns are read in a fraction of a second.
+    A name is everything before the last space of its line, i.e. names are not restricted to any characters.
+
+    Args:
+        file_name: path of the solution file, e.g. written with `highs --solution_file`
+        names: also read the names of the columns, otherwise only their values, which is faster
+
+    Returns:
+        the names, values and objective value, with `values[i]` being the value of the column with index `i`
+
+    Raises:
+        ValueError: if the file has no feasible primal solution, e.g. as the model is infeasible
+    """
+    with open(file_name, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        primal = _PRIMAL_RE.search(mm)
+        if primal is None or primal.group(1) != b'Feasible':
+            status = 'missing' if primal is None else primal.group(1).decode('utf8')
+            model = _MODEL_STATUS_RE.search(mm)
+            model_status = 'unknown' if model is None else model.group(1).decode('utf8')
+            msg = f'No primal column values in {file_name}, primal solution is {status}, model status is {model_status}'
+            raise ValueError(msg)
+        if (header := _COLUMNS_RE.search(mm, primal.end())) is None:
+            msg = f'No primal column values found in {file_name}'
+            raise ValueError(msg)
+        ncols = int(header.group(1))
+        obj_match = _OBJECTIVE_RE.search(mm, primal.end(), header.start())
+        objective = float(obj_match.group(1)) if obj_match is not None else None
+        start = header.end() + 1
+        # the next section starts with a comment line, which cannot be a column as names never start with `#`
+        end = mm.find(b'\n#', header.end()) + 1 or mm.size()
+        text = mm[start:end].decode('utf8')
+
+    values = np.array(_VALUES_RE.findall(text), dtype=float)
+    if len(values) != ncols:
+        msg = f'Expected {ncols} columns in {file_name} but found {len(values)}'
+        raise ValueError(msg)
+    return HighsSolution(
+        names=_NAMES_RE.findall(text) if names else None,
+        values=values,
+        objective=objective,
+    )
+
+
+def read_sol_file(file_name: str | Path) -> Iterator[tuple[str, float]]:
     """Read a solution file from HiGHS solver with default output style
 
-    Attention: We assume here that your variable names are alphanumeric!
-               No underscores, no dashes, etc.!
+    The names of the columns are translated back into the names of the Pyomo variables, e.g. `x(a_b)` into `x[a,b]`,
+    assuming that the model was written with `symbolic_solver_labels`. As underscores separate the indices, indices
+    containing underscores or other characters that are no word characters cannot be translated back reliably.
+    Use `read_sol_columns` for the names exactly as given in the file or `set_solution_from_file`, which maps them
+    to the variables by the symbol map of the model.
     """
-    line_re = re.compile(r'(\w+)(?:\((\w+)\))?(_binary_indicator_var)? ([.\w-]+)')
-
-    with open(file_name, encoding='utf8') as fh:
-        while True:
-            line = fh.readline()
-            if line.startswith('# Columns'):
-                break
-        for line in fh.readlines():
-            if line.startswith('#'):
-                break
-            if (match_obj := line_re.match(line.strip())) is None:
-                msg = f'Could not interpret line: {line}'
-                raise RuntimeError(msg)
-            else:
-                var_name, idx, binary, val = match_obj.groups()
-            val = float(val)
-            binary = binary.replace('_', '.', 1) if binary else ''
-
-            if idx is None:
-                yield f'{var_name}{binary}', val
-            else:
-                idx = idx.replace('_', ',')
-                yield f'{var_name}[{idx}]{binary}', val
-
-
-def set_solution_from_file(model: ConcreteModel, file_name: str):
+    sol = read_sol_columns(file_name)
+    for name, val in zip(sol.names or (), sol.values.tolist(), strict=True):
+        if (match_obj := _PYOMO_NAME_RE.fullmatch(name)) is None:
+            msg = f'Could not interpret column: {name}'
+            raise RuntimeError(msg)
+        var_name, idx, binary = match_obj.groups()
+        binary = binary.replace('_', '.', 1) if binary else ''
+
+        if idx is None:
+            yield f'{var_name}{binary}', val
+        else:
+            idx = idx.replace('_', ',')
+            yield f'{var_name}[{idx}]{binary}', val
+
+
+def _latest_symbol_map(model: ConcreteModel) -> SymbolMap | None:
+    """Returns the symbol map of the last written model file if any"""
+    symbol_maps = model.solutions.symbol_map
+    return list(symbol_maps.values())[-1] if symbol_maps else None
+
+
+def _vars_by_label(model: ConcreteModel, symbol_map: SymbolMap | None) -> dict[str, VarData]:
+    """Returns the variables of a model by their labels in files written with `symbolic_solver_labels`"""
+    if symbol_map is not None:
+        # the symbol map of the last written file is authoritative, e.g. if labels were made unique
+        return {label: obj for label, obj in symbol_map.bySymbol.items() if isinstance(obj, VarData)}
+    labeler = TextLabeler()
+    return {labeler(var): var for var in model.component_data_objects(Var, descend_into=True)}
+
+
+def _column_vars(model: ConcreteModel, names: list[str], file_name: str | Path, *, refresh: bool) -> list[VarData]:
+    """Returns the variables of the columns with the given names, see `column_vars`"""
+    symbol_map = _latest_symbol_map(model)
+    digest = hashlib.sha1('\n'.join(names).encode(), usedforsecurity=False).hexdigest()
+    # the symbol map itself is kept, as the id of a garbage-collected one could be reused by a new one
+    cached = getattr(model, _COLUMN_VARS_ATTR, None)
+    if not refresh and cached is not None and cached[0] is symbol_map and cached[1] == digest:
+        return cached[2]
+    vars_by_label = _vars_by_label(model, symbol_map)
+    if missing := [name for name in names if name not in vars_by_label]:
+        msg = f'{len(missing)} columns of {file_name} are no variables of the model, e.g. {missing[0]}'
+        raise ValueError(msg)
+    columns = [vars_by_label[name] for name in names]
+    setattr(model, _COLUMN_VARS_ATTR, (symbol_map, digest, columns))
+    return columns
+
+
+def column_vars(model: ConcreteModel, file_name: str | Path, *, refresh: bool = False) -> list[VarData]:
+    """Returns the variables of a Pyomo model in the order of the columns of a HiGHS solution file
+
+    The columns are matched by their names with the labels of the symbol map of the last written model file or,
+    if the model was not written, e.g. as it was built again, with the labels Pyomo uses for `symbolic_solver_labels`.
+    The mapping is cached on the model together with a digest of the column names and the symbol map it was
+    determined with. It is only determined again if one of them changed, e.g. as the model was written again with
+    another order of the columns.
+
+    Args:
+        model: the Pyomo model the solution file belongs to
+        file_name: path of the solution file
+        refresh: determine the mapping again instead of using the cached one
+
+    Returns:
+        the variables with `vars[i]` being the variable of the column with index `i`
+    """
+    return _column_vars(model, read_sol_columns(file_name).names or [], file_name, refresh=refresh)
+
+
+def set_solution_from_file(
+    model: ConcreteModel, file_name: str | Path, *, nonzero: bool = False, tol: float = 1e-6
+) -> list[VarData]:
     """Given a HiGHS solution file set the variables of a Pyomo model accordingly.
 
-    This is a workaround to set a Pyomo model's variables to the solution
-    from a HiGHS solution file.
+    The variables are matched with the columns of the file by their index using `column_vars`, so only the names
+    and values of the file are read and the values assigned if a solution of the same model was loaded before.
+
+    Args:
+        model: the Pyomo model the solution file belongs to
+        file_name: path of the solution file
+        nonzero: only set the variables with a nonzero value, e.g. the binaries of the chosen slots of a schedule,
+                 and leave all other variables untouched
+        tol: absolute tolerance for a value to be considered as nonzero
+
+    Returns:
+        the variables that were set
     """
-    # just to initialize we read it in using HiGHS. The result is incorrect though,
-    # as the order of variables is mixed up quite often. We fix this below!
-    opt = Highs()
-    opt.set_instance(model)
-    opt._solver_model.readSolution(file_name, 0)
-    opt._sol = opt._solver_model.getSolution()
-    opt.load_vars()
-
-    # read the actual mapping of the variable names to the values
-    file_sol = dict(read_sol_file(file_name))
-
-    # overwrite the values of the variables again using the symbolic names from the file
-    for v, ref_info in opt._referenced_variables.items():
-        using_cons, using_sos, using_obj = ref_info
-        if using_cons or using_sos or (using_obj is not None):
-            var = opt._vars[v][0]
-            var.set_value(file_sol[var.name], skip_validation=True)
+    sol = read_sol_columns(file_name)
+    columns, values = _column_vars(model, sol.names or [], file_name, refresh=False), sol.values
+    if nonzero:
+        idxs = np.flatnonzero(np.abs(values) > tol)
+        columns, values = [columns[idx] for idx in idxs], values[idxs]
+    for var, value in zip(columns, values.tolist(), strict=True):
+        var.set_value(value, skip_validation=True)
+    return columns
@@ -1,6 +1,22 @@
 """Functionality around the Pretalx API"""
 
+from pytanis.pretalx.async_client import AsyncPretalxClient
+from pytanis.pretalx.cache import HTTPCache
 from pytanis.pretalx.client import PretalxClient
-from pytanis.pretalx.utils import reviews_as_df, speakers_as_df, subs_as_df
+from pytanis.pretalx.index import EventIndex
+from pytanis.pretalx.mirror import EventMirror
+from pytanis.pretalx.snapshot import EventSnapshot
+from pytanis.pretalx.utils import event_as_tables, reviews_as_df, speakers_as_df, subs_as_df
 
-__all__ = ['PretalxClient', 'reviews_as_df', 'speakers_as_df', 'subs_as_df']
+__all__ = [
+    'AsyncPretalxClient',
+    'EventIndex',
+    'EventMirror',
+    'EventSnapshot',
+    'HTTPCache',
+    'PretalxClient',
+    'event_as_tables',
+    'reviews_as_df',
+    'speakers_as_df',
+    'subs_as_df',
+]
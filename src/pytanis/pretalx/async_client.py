@@ -0,0 +1,524 @@
+"""Asynchronous client for the Pretalx API
+
+Documentation: https://docs.pretalx.org/api/resources/index.html
+
+The `AsyncPretalxClient` has the same endpoints as the `PretalxClient` but all methods are coroutines
+and the results of list endpoints are asynchronous iterators. This allows overlapping the rather long waiting
+times for several requests to the Pretalx API while still respecting the throttling, e.g.:
+
+```
+async with AsyncPretalxClient(blocking=True) as client:
+    (_, subs), (_, speakers) = await asyncio.gather(
+        client.submissions(event_slug), client.speakers(event_slug)
+    )
+    subs = [sub async for sub in subs]
+```
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import aclosing
+from types import TracebackType
+from typing import Any, TypeAlias, cast
+
+import httpx
+from httpx import URL, Limits, QueryParams, Response, codes
+from httpx_auth import HeaderApiKey
+from structlog import get_logger
+from tqdm.auto import tqdm
+
+from pytanis.config import Config, get_cfg
+from pytanis.pretalx.cache import CacheEntry, HTTPCache
+from pytanis.pretalx.client import (
+    BASE_URL,
+    DEFAULT_LIMITS,
+    JSON,
+    MAX_RATE_LIMITED_RETRIES,
+    TIMEOUT,
+    JSONObj,
+    PaginationCursor,
+    PaginationError,
+    T,
+    Validation,
+    _cache_lookup,
+    _has_http2,
+    _item_endpoint,
+    _list_endpoint,
+    _log_resp,
+    _next_page_urls,
+    _resumable_at,
+    _revalidated,
+    _typed_pagination,
+    _url,
+    _validate_result,
+)
+from pytanis.pretalx.stream import PageDecoder, astream_page
+from pytanis.pretalx.types import Answer, Event, Me, Question, Review, Room, Speaker, Submission, Tag, Talk
+from pytanis.pretalx.utils import list_adapter
+from pytanis.utils import RateLimiter, RetryPolicy, TokenBucketLimiter
+
+_logger = get_logger()
+
+AsyncResults: TypeAlias = tuple[int, AsyncIterator[T] | AsyncIterator[JSONObj]]
+"""Result count and results of a list endpoint, i.e. validated models or JSON objects if the validation is `raw`"""
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:  # noqa: RUF029
+    """Turn a list, e.g. of results or pages, into an asynchronous iterator"""
+    for item in items:
+        yield item
+
+
+async def _alist(page: AsyncIterable[JSONObj] | list[JSONObj]) -> list[JSONObj]:
+    """Collect the results of a page, which is streamed or not"""
+    if isinstance(page, list):
+        return page
+    return [result async for result in page]
+
+
+async def _aclose(iterator: AsyncIterator[Any]):
+    """Close an asynchronous generator, e.g. to cancel the pages it prefetches, instead of leaving it to the GC"""
+    if isinstance(iterator, AsyncGenerator):
+        await iterator.aclose()
+
+
+async def _aflatten(pages: AsyncIterator[AsyncIterable[JSONObj] | list[JSONObj]]) -> AsyncIterator[JSONObj]:
+    """Turn an asynchronous iterator over pages into one over their results"""
+    try:
+        async for page in pages:
+            if isinstance(page, list):
+                for result in page:
+                    yield result
+            else:
+                async for result in page:
+                    yield result
+    finally:
+        await _aclose(pages)
+
+
+async def _aresumable(results: AsyncIterator[JSONObj], cursor: PaginationCursor) -> AsyncIterator[JSONObj]:
+    """Raise a resumable error if the results of a streamed page cannot be received completely"""
+    with _resumable_at(cursor):
+        async for result in results:
+            yield result
+
+
+async def _avalidated(
+    type: type[T],  # noqa: A002
+    pages: AsyncIterator[AsyncIterable[JSONObj] | list[JSONObj]],
+    *,
+    batch: bool = False,
+) -> AsyncIterator[T]:
+    """Validate the results of the pages lazily, making resumption of a failing pagination aware of the type"""
+    try:
+        with _typed_pagination(type):
+            async for page in pages:
+                if batch:
+                    for obj in list_adapter(type).validate_python(await _alist(page)):
+                        yield obj
+                    continue
+                async for result in _aflatten(_aiter([page])):
+                    yield _validate_result(type, result)
+    finally:
+        await _aclose(pages)
+
+
+class AsyncPretalxClient:
+    """Asynchronous client for the Pretalx API
+
+    Use the client as asynchronous context manager or await `aclose` to release the connections in the end.
+
+    Args:
+        config: configuration of Pytanis, read from the default location if `None`
+        blocking: resolve the pagination of results directly
+        limits: limits of the connection pool, `DEFAULT_LIMITS` if `None`
+        http2: use HTTP/2 if available, i.e. the `h2` package is installed
+        concurrency: number of result pages fetched concurrently within the throttling, 1 means that the
+            pages are fetched one after another
+        cache: on-disk cache to revalidate responses with conditional requests, no caching if `None`
+        retry: retrying of requests failing with transient errors, default `RetryPolicy()` if `None`
+        validation: `item` validates each result of a list endpoint by its model, `batch` validates a page of
+            results at once and `raw` returns the JSON objects as dictionaries. Single resources are always validated
+        stream: decode the results of a page while it is received instead of waiting for the whole page, only used
+            without a cache and if pages are not prefetched, i.e. `concurrency` is 1
+    """
+
+    def __init__(
+        self,
+        config: Config | None = None,
+        *,
+        blocking: bool = False,
+        limits: Limits | None = None,
+        http2: bool = True,
+        concurrency: int = 1,
+        cache: HTTPCache | None = None,
+        retry: RetryPolicy | None = None,
+        validation: Validation = 'item',
+        stream: bool = False,
+    ):
+        if config is None:
+            config = get_cfg()
+        self._config = config
+        self._limits = DEFAULT_LIMITS if limits is None else limits
+        self._http2 = http2 and _has_http2()
+        self._client: httpx.AsyncClient | None = None
+        self.rate_limiter: RateLimiter
+        self.blocking = blocking
+        self.concurrency = concurrency
+        self.cache = cache
+        self.retry = RetryPolicy() if retry is None else retry
+        self.validation = validation
+        self.stream = stream
+        self.set_throttling(calls=2, seconds=1)  # we are nice by default and Pretalx doesn't allow many calls at once.
+
+    async def __aenter__(self) -> 'AsyncPretalxClient':
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the HTTP session and all connections of the pool
+
+        The client can still be used afterward as a new session is opened on demand.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The asynchronous HTTP session used for all requests, opened on first use"""
+        if self._client is None:
+            if (api_token := self._config.Pretalx.api_token) is None:
+                msg = 'API token for Pretalx is empty'
+                raise RuntimeError(msg)
+            _logger.debug('opening async http session', http2=self._http2)
+            self._client = httpx.AsyncClient(
+                auth=HeaderApiKey(api_token, header_name='Authorization'),
+                base_url=BASE_URL,
+                limits=self._limits,
+                http2=self._http2,
+                timeout=TIMEOUT,
+            )
+        return self._client
+
+    def set_throttling(self, calls: int, seconds: int):
+        """Throttle the number of calls per seconds to the Pretalx API
+
+        Up to `calls` requests may start at once. If Pretalx signals rate limiting, the rate is decreased and
+        increased again up to `calls / seconds` after a while without being rate limited.
+        """
+        _logger.info('throttling', calls=calls, seconds=seconds)
+        self.set_rate_limiter(TokenBucketLimiter(calls / seconds, burst=calls))
+
+    def set_rate_limiter(self, rate_limiter: RateLimiter):
+        """Use a custom rate limiter for all requests to the Pretalx API"""
+        self.rate_limiter = rate_limiter
+
+    async def _get_throttled(
+        self,
+        endpoint: str,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        """Retrieve data via GET request within the rate limit
+
+        Requests that were rate limited are repeated and transient errors are retried according to `retry`.
+        """
+        attempt = rate_limited = 0
+        while True:
+            await self.rate_limiter.aacquire()
+            try:
+                resp = await self._get(endpoint, params, headers, stream=stream)
+            except httpx.TransportError as exc:  # e.g. timeouts and network errors
+                if attempt >= self.retry.retries:
+                    raise
+                error = repr(exc)
+            else:
+                self.rate_limiter.update(resp)
+                if resp.status_code == codes.TOO_MANY_REQUESTS and rate_limited < MAX_RATE_LIMITED_RETRIES:
+                    rate_limited += 1
+                    _logger.warning('rate limited by Pretalx', url=str(resp.url), rate=self.rate_limiter.rate)
+                    await resp.aclose()
+                    continue
+                if resp.status_code not in self.retry.statuses or attempt >= self.retry.retries:
+                    return resp
+                error = f'HTTP status {resp.status_code}'
+                await resp.aclose()
+            wait = self.retry.wait(attempt)
+            attempt += 1
+            _logger.warning('retrying request', endpoint=endpoint, error=error, attempt=attempt, wait=wait)
+            await asyncio.sleep(wait)
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        """Retrieve data via GET request, don't read the body of the response yet if `stream`"""
+        client = self.http_client
+        url = _url(endpoint, params)
+        _logger.info(f'GET: {url}')
+        return await client.send(client.build_request('GET', url, headers=headers), stream=stream)
+
+    async def _get_one(self, endpoint: str, params: QueryParams | None = None) -> JSON:
+        """Retrieve a single resource result, revalidate the cached response if a cache is used"""
+        if self.cache is None:
+            resp = await self._get_throttled(endpoint, params)
+            resp.raise_for_status()
+            return resp.json()
+
+        key = HTTPCache.key(_url(endpoint, params), self._config.Pretalx.api_token)
+        entry, fresh = _cache_lookup(self.cache, key)
+        if fresh:
+            return cast(CacheEntry, entry).load()
+        resp = await self._get_throttled(endpoint, params, None if entry is None else entry.validators())
+        return _revalidated(self.cache, key, entry, resp)
+
+    async def _get_page(self, url: URL) -> JSONObj:
+        """Retrieve a page of a paginated result given its full URL, raise a resumable error if this fails"""
+        with _resumable_at(PaginationCursor(str(url))):
+            resp = cast(JSONObj, await self._get_one(url.path, url.params))
+        _log_resp(resp)
+        return resp
+
+    async def _iter_pages(self, resp: JSONObj) -> AsyncIterator[list[JSONObj]]:
+        """Resolves the pagination and returns an asynchronous iterator over the results of each page"""
+        if self.concurrency > 1 and (page_urls := _next_page_urls(resp)) is not None:
+            async with aclosing(self._prefetch_pages(resp, page_urls)) as pages:
+                async for page in pages:
+                    yield page
+            return
+        yield resp['results']
+        while (next_page := resp['next']) is not None:
+            resp = await self._get_page(URL(next_page))
+            yield resp['results']
+
+    async def _prefetch_pages(self, resp: JSONObj, page_urls: list[URL]) -> AsyncGenerator[list[JSONObj], None]:
+        """Fetches the pages concurrently ahead of the consumer and returns an iterator over them in order"""
+        _logger.debug('prefetching pages', pages=len(page_urls), concurrency=self.concurrency)
+        yield resp['results']
+        page_urls.reverse()  # to pop them in order
+        pending: deque[asyncio.Task[JSONObj]] = deque()
+        try:
+            while page_urls or pending:
+                while page_urls and len(pending) < self.concurrency:
+                    pending.append(asyncio.create_task(self._get_page(page_urls.pop())))
+                yield (await pending.popleft())['results']
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)  # wait for the cancellations to take effect
+
+    async def _get_many(self, endpoint: str, params: QueryParams | None = None) -> tuple[int, AsyncIterator[JSONObj]]:
+        """Retrieves the result count as well as the results as asynchronous iterator"""
+        count, pages = await self._get_pages(endpoint, params)
+        return count, _aflatten(pages)
+
+    async def _get_pages(
+        self, endpoint: str, params: QueryParams | None = None
+    ) -> tuple[int, AsyncIterator[AsyncIterable[JSONObj] | list[JSONObj]]]:
+        """Retrieves the result count as well as the results page by page as asynchronous iterator"""
+        pages: AsyncIterator[AsyncIterable[JSONObj] | list[JSONObj]]
+        if self.stream and self.cache is None and self.concurrency == 1:
+            count, pages = await self._stream_pages(endpoint, params)
+        else:
+            resp = await self._get_one(endpoint, params)
+            _log_resp(resp)
+            if isinstance(resp, list):
+                return len(resp), _aiter([resp])
+            count, pages = resp['count'], self._iter_pages(resp)
+        if not self.blocking:
+            _logger.debug('non-blocking resolution of pagination...')
+            return count, pages
+
+        _logger.debug('blocking resolution of pagination...')
+        results: list[list[JSONObj]] = []
+        try:
+            with tqdm(total=count) as pbar:
+                async for page in pages:
+                    results.append(await _alist(page))
+                    pbar.update(len(results[-1]))
+        except PaginationError as exc:
+            exc.results = [result for page in results for result in page]
+            raise
+        return count, _aiter(results)
+
+    async def _stream_page(
+        self, endpoint: str, params: QueryParams | None = None
+    ) -> tuple[PageDecoder, AsyncIterator[JSONObj]]:
+        """Request a page and decode its results while they are received, see `astream_page`"""
+        resp = await self._get_throttled(endpoint, params, stream=True)
+        if resp.is_error:
+            await resp.aread()
+            resp.raise_for_status()
+        return await astream_page(resp)
+
+    async def _stream_pages(
+        self, endpoint: str, params: QueryParams | None = None
+    ) -> tuple[int, AsyncIterator[AsyncIterable[JSONObj]]]:
+        """Retrieves the result count as well as the pages, whose results are decoded while they are received"""
+        decoder, results = await self._stream_page(endpoint, params)
+        if 'count' not in decoder.meta:  # e.g. a list instead of a page, so we need to read it completely
+            first_page = await _alist(results)
+            results = _aiter(first_page)
+            decoder.meta.setdefault('count', len(first_page))
+        _log_resp(decoder.meta)
+        return decoder.meta['count'], self._iter_streamed_pages(decoder, results)
+
+    async def _iter_streamed_pages(
+        self, decoder: PageDecoder, results: AsyncIterator[JSONObj]
+    ) -> AsyncIterator[AsyncIterable[JSONObj]]:
+        """Walks through the pages one after another, each is consumed before the next page is known"""
+        while True:
+            yield results
+            async for _ in results:  # consume what is left of the page
+                pass
+            if (next_page := decoder.meta.get('next')) is None:
+                return
+            url = URL(next_page)
+            with _resumable_at(PaginationCursor(next_page)):
+                decoder, results = await self._stream_page(url.path, url.params)
+            results = _aresumable(results, PaginationCursor(next_page))
+
+    async def _endpoint_lst(
+        self,
+        type: type[T],  # noqa: A002
+        event_slug: str,
+        resource: str,
+        *,
+        params: QueryParams | None = None,
+    ) -> AsyncResults[T]:
+        """Queries an endpoint returning a list of resources"""
+        return await self._typed_many(type, _list_endpoint(event_slug, resource), params)
+
+    async def _typed_many(
+        self,
+        type: type[T],  # noqa: A002
+        endpoint: str,
+        params: QueryParams | None = None,
+    ) -> AsyncResults[T]:
+        """Retrieves the result count as well as the results validated according to `validation`"""
+        if self.validation == 'raw':
+            return await self._get_many(endpoint, params)
+        with _typed_pagination(type):
+            count, pages = await self._get_pages(endpoint, params)
+        return count, _avalidated(type, pages, batch=self.validation == 'batch')
+
+    async def resume(self, cursor: PaginationCursor) -> tuple[int, AsyncIterator[Any]]:
+        """Continue a pagination that failed with a `PaginationError` at the page it stopped
+
+        Returns:
+            the total count of results and an asynchronous iterator over the remaining results
+        """
+        url = URL(cursor.url)
+        with _resumable_at(cursor):
+            if cursor.model is None:
+                return await self._get_many(url.path, url.params)
+            return await self._typed_many(cursor.model, url.path, url.params)
+
+    async def _endpoint_id(
+        self,
+        type: type[T],  # noqa: A002
+        event_slug: str,
+        resource: str,
+        id: int | str,  # noqa: A002
+        *,
+        params: QueryParams | None = None,
+    ) -> T:
+        """Query an endpoint returning a single resource, which is always validated"""
+        result = await self._get_one(_item_endpoint(event_slug, resource, id), params)
+        _logger.debug('result', resp=result)
+        return type.model_validate(result)
+
+    async def me(self) -> Me:
+        """Returns what Pretalx knows about myself"""
+        result = await self._get_one('/api/me')
+        return Me.model_validate(result)
+
+    async def event(self, event_slug: str, *, params: QueryParams | None = None) -> Event:
+        """Returns detailed information about a specific event"""
+        endpoint = f'/api/events/{event_slug}/'
+        result = await self._get_one(endpoint, params)
+        _logger.debug('result', resp=result)
+        return Event.model_validate(result)
+
+    async def events(self, *, params: QueryParams | None = None) -> AsyncResults[Event]:
+        """Lists all events and their details"""
+        return await self._typed_many(Event, '/api/events/', params)
+
+    async def submission(self, event_slug: str, code: str, *, params: QueryParams | None = None) -> Submission:
+        """Returns a specific submission"""
+        return await self._endpoint_id(Submission, event_slug, 'submissions', code, params=params)
+
+    async def submissions(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Submission]:
+        """Lists all submissions and their details"""
+        return await self._endpoint_lst(Submission, event_slug, 'submissions', params=params)
+
+    async def talk(self, event_slug: str, code: str, *, params: QueryParams | None = None) -> Talk:
+        """Returns a specific talk"""
+        return await self._endpoint_id(Talk, event_slug, 'talks', code, params=params)
+
+    async def talks(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Talk]:
+        """Lists all talks and their details"""
+        return await self._endpoint_lst(Talk, event_slug, 'talks', params=params)
+
+    async def speaker(self, event_slug: str, code: str, *, params: QueryParams | None = None) -> Speaker:
+        """Returns a specific speaker"""
+        return await self._endpoint_id(Speaker, event_slug, 'speakers', code, params=params)
+
+    async def speakers(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Speaker]:
+        """Lists all speakers and their details"""
+        return await self._endpoint_lst(Speaker, event_slug, 'speakers', params=params)
+
+    async def review(self, event_slug: str, id: int, *, params: QueryParams | None = None) -> Review:  # noqa: A002
+        """Returns a specific review"""
+        return await self._endpoint_id(Review, event_slug, 'reviews', id, params=params)
+
+    async def reviews(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Review]:
+        """Lists all reviews and their details"""
+        return await self._endpoint_lst(Review, event_slug, 'reviews', params=params)
+
+    async def room(self, event_slug: str, id: int, *, params: QueryParams | None = None) -> Room:  # noqa: A002
+        """Returns a specific room"""
+        return await self._endpoint_id(Room, event_slug, 'rooms', id, params=params)
+
+    async def rooms(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Room]:
+        """Lists all rooms and their details"""
+        return await self._endpoint_lst(Room, event_slug, 'rooms', params=params)
+
+    async def question(self, event_slug: str, id: int, *, params: QueryParams | None = None) -> Question:  # noqa: A002
+        """Returns a specific question"""
+        return await self._endpoint_id(Question, event_slug, 'questions', id, params=params)
+
+    async def questions(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Question]:
+        """Lists all questions and their details"""
+        return await self._endpoint_lst(Question, event_slug, 'questions', params=params)
+
+    async def answer(self, event_slug: str, id: int, *, params: QueryParams | None = None) -> Answer:  # noqa: A002
+        """Returns a specific answer"""
+        return await self._endpoint_id(Answer, event_slug, 'answers', id, params=params)
+
+    async def answers(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Answer]:
+        """Lists all answers and their details"""
+        return await self._endpoint_lst(Answer, event_slug, 'answers', params=params)
+
+    async def tag(self, event_slug: str, tag: str, *, params: QueryParams | None = None) -> Tag:
+        """Returns a specific tag"""
+        return await self._endpoint_id(Tag, event_slug, 'tags', tag, params=params)
+
+    async def tags(self, event_slug: str, *, params: QueryParams | None = None) -> AsyncResults[Tag]:
+        """Lists all tags and their details"""
+        return await self._endpoint_lst(Tag, event_slug, 'tags', params=params)
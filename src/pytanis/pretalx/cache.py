@@ -0,0 +1,128 @@
+"""Persistent on-disk cache for responses of the Pretalx API
+
+The cache stores the body of each response together with its `ETag` and `Last-Modified` headers.
+Later requests to the same URL are sent as conditional requests with `If-None-Match` and `If-Modified-Since`,
+so that an unchanged resource is answered by the server with `304 Not Modified` and served from disk.
+With a `ttl`, entries younger than `ttl` seconds are served directly without asking the server at all,
+use `ttl=math.inf` for fully offline re-runs.
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from httpx import URL, Response
+from pydantic import BaseModel
+from structlog import get_logger
+
+_logger = get_logger()
+
+CACHE_PATH: Path = Path.home() / '.pytanis' / 'cache' / 'pretalx'
+"""Default directory of the cache"""
+
+
+class CacheEntry(BaseModel):
+    """Metadata of a cached response, the body is stored in a separate file"""
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float
+    body_path: Path
+
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated"""
+        return time.time() - self.stored_at
+
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional request to revalidate the entry"""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def read_bytes(self) -> bytes:
+        """Raw body of the cached response"""
+        return self.body_path.read_bytes()
+
+    def load(self) -> Any:
+        """Decoded JSON body of the cached response"""
+        return json.loads(self.read_bytes())
+
+
+class HTTPCache:
+    """Persistent on-disk cache for responses of the Pretalx API
+
+    Args:
+        path: directory of the cache, `CACHE_PATH` if `None`
+        ttl: seconds an entry is served without revalidation, `None` to always revalidate
+    """
+
+    def __init__(self, path: Path | str | None = None, *, ttl: float | None = None):
+        self.path = CACHE_PATH if path is None else Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(url: URL, api_token: str | None = None) -> str:
+        """Key of a URL, the API token is part of it as results depend on the permissions"""
+        token_hash = hashlib.sha256((api_token or '').encode()).hexdigest()
+        return hashlib.sha256(f'{token_hash} {url}'.encode()).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.path / f'{key}.json'
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write to a temporary file first so that concurrent readers never see partial files"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry of a key if it exists"""
+        try:
+            entry = CacheEntry.model_validate_json(self._meta_path(key).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        if not entry.body_path.exists():
+            return None
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check if the entry can be served without revalidation"""
+        return self.ttl is not None and (math.isinf(self.ttl) or entry.age() < self.ttl)
+
+    def set(self, key: str, resp: Response) -> CacheEntry:
+        """Store a successful response"""
+        body_path = self.path / f'{key}.body'
+        self._write_atomic(body_path, resp.content)
+        entry = CacheEntry(
+            url=str(resp.request.url),
+            etag=resp.headers.get('ETag'),
+            last_modified=resp.headers.get('Last-Modified'),
+            stored_at=time.time(),
+            body_path=body_path,
+        )
+        self._write_atomic(self._meta_path(key), entry.model_dump_json().encode())
+        return entry
+
+    def touch(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Mark an entry as revalidated, e.g. after a `304 Not Modified` response"""
+        entry = entry.model_copy(update={'stored_at': time.time()})
+        self._write_atomic(self._meta_path(key), entry.model_dump_json().encode())
+        return entry
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        _logger.info('clearing cache', path=str(self.path))
+        shutil.rmtree(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
@@ -6,19 +6,30 @@ ToDo:
     * add additional parameters explicitly like querying according to the API
 """
 
-from collections.abc import Iterator
-from typing import Any, TypeAlias, TypeVar, cast
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from importlib.util import find_spec
+from itertools import chain
+from types import TracebackType
+from typing import Any, Literal, NamedTuple, TypeAlias, TypeVar, cast
 
 import httpx
-from httpx import URL, QueryParams, Response
+from httpx import URL, Limits, QueryParams, Response, codes
 from httpx_auth import HeaderApiKey
 from pydantic import BaseModel
 from structlog import get_logger
 from tqdm.auto import tqdm
 
 from pytanis.config import Config, get_cfg
+from pytanis.pretalx.cache import CacheEntry, HTTPCache
+from pytanis.pretalx.stream import PageDecoder, stream_page
 from pytanis.pretalx.types import Answer, Event, Me, Question, Review, Room, Speaker, Submission, Tag, Talk
-from pytanis.utils import rm_keys, throttle
+from pytanis.pretalx.utils import list_adapter
+from pytanis.utils import RateLimiter, RetryPolicy, TokenBucketLimiter, rm_keys
 
 _logger = get_logger()
 
@@ -30,64 +41,451 @@ JSONLst: TypeAlias = list[JSONObj]
 """Type of a JSON list of JSON objects"""
 JSON: TypeAlias = JSONObj | JSONLst
 """Type of the JSON response as returned by the Pretalx API"""
+Validation: TypeAlias = Literal['item', 'batch', 'raw']
+"""How results of list endpoints are validated: each item by its model, a whole page at once or not at all"""
+Results: TypeAlias = tuple[int, Iterator[T] | Iterator[JSONObj]]
+"""Result count and results of a list endpoint, i.e. validated models or JSON objects if the validation is `raw`"""
 
+BASE_URL: str = 'https://pretalx.com/'
+"""Base URL of the Pretalx API"""
+TIMEOUT: float = 60.0
+"""Timeout in seconds, quite high as the Pretalx API is quite slow"""
+DEFAULT_LIMITS: Limits = Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+"""Default limits of the connection pool, keep connections alive for a while as we throttle"""
+MAX_RATE_LIMITED_RETRIES: int = 5
+"""Maximum number of times a request is repeated after being rate limited by Pretalx"""
+
+
+def _has_http2() -> bool:
+    """Check if HTTP/2 is available, i.e. the `h2` package is installed"""
+    return find_spec('h2') is not None
+
+
+def _url(endpoint: str, params: QueryParams | None = None) -> URL:
+    """Full URL of an endpoint with query parameters"""
+    if params is None:
+        params = cast(QueryParams, {})
+    return URL(BASE_URL).join(endpoint).copy_merge_params(params)
+
+
+def _next_page_urls(resp: JSONObj) -> list[URL] | None:
+    """Compute the URLs of all remaining pages from the first page of a paginated response
+
+    Returns `None` if the pagination style of the `next` URL is unknown.
+    """
+    if (next_page := resp['next']) is None:
+        return []
+    url = URL(next_page)
+    page_size = len(resp['results'])
+    if page_size == 0:
+        return None
+    if 'offset' in url.params:  # limit-offset pagination
+        limit = int(url.params.get('limit', page_size))
+        offsets = range(int(url.params['offset']), resp['count'], limit)
+        return [url.copy_set_param('offset', offset) for offset in offsets]
+    elif 'page' in url.params:  # page number pagination
+        n_pages = -(-resp['count'] // page_size)
+        pages = range(int(url.params['page']), n_pages + 1)
+        return [url.copy_set_param('page', page) for page in pages]
+    else:
+        return None
+
+
+class PaginationCursor(NamedTuple):
+    """Position within a pagination to continue it with `resume` of a client"""
+
+    url: str  # URL of the next page to retrieve
+    model: type[BaseModel] | None = None  # type of the results, raw JSON if `None`
+
+
+class PaginationError(RuntimeError):
+    """A page of a paginated result could not be retrieved, even after retrying
+
+    Continue with `client.resume(err.cursor)` instead of starting all over again. In blocking mode, `results`
+    holds the results retrieved before the error occurred, otherwise they were already yielded by the iterator.
+    """
+
+    def __init__(self, cursor: PaginationCursor, results: list[Any] | None = None):
+        super().__init__(f'Failed to retrieve page {cursor.url}')
+        self.cursor = cursor
+        self.results = [] if results is None else results
+
+    def with_type(self, type: type[BaseModel]) -> 'PaginationError':  # noqa: A002
+        """Set the type of the results in the cursor and validate the already retrieved results"""
+        self.cursor = self.cursor._replace(model=type)
+        self.results = [type.model_validate(r) for r in self.results]
+        return self
+
+
+def _resumable(results: Iterator[JSONObj], cursor: PaginationCursor) -> Iterator[JSONObj]:
+    """Raise a resumable error if the results of a streamed page cannot be received completely"""
+    try:
+        yield from results
+    except httpx.HTTPError as exc:
+        raise PaginationError(cursor) from exc
+
+
+# The helpers below hold everything of a request except the I/O itself, so that `PretalxClient` and
+# `AsyncPretalxClient` only differ in how they wait for responses.
+
+
+def _list_endpoint(event_slug: str, resource: str) -> str:
+    """Path of the endpoint listing the resources of an event"""
+    return f'/api/events/{event_slug}/{resource}/'
+
+
+def _item_endpoint(event_slug: str, resource: str, id: int | str) -> str:  # noqa: A002
+    """Path of the endpoint of a single resource of an event"""
+    return f'/api/events/{event_slug}/{resource}/{id}/'
+
+
+def _cache_lookup(cache: HTTPCache, key: str) -> tuple[CacheEntry | None, bool]:
+    """Cached entry of a request and whether it is fresh enough to be served without asking the server"""
+    entry = cache.get(key)
+    fresh = entry is not None and cache.is_fresh(entry)
+    if fresh:
+        _logger.debug('serving from cache', url=cast(CacheEntry, entry).url)
+    return entry, fresh
+
+
+def _revalidated(cache: HTTPCache, key: str, entry: CacheEntry | None, resp: Response) -> JSON:
+    """Result of a read response to a conditional request, served from the cache if not modified, else cached"""
+    if resp.status_code == codes.NOT_MODIFIED and entry is not None:
+        _logger.debug('not modified, serving from cache', url=entry.url)
+        return cache.touch(key, entry).load()
+    resp.raise_for_status()
+    cache.set(key, resp)
+    return resp.json()
+
+
+@contextmanager
+def _resumable_at(cursor: PaginationCursor) -> Iterator[None]:
+    """Raise a resumable error at `cursor` if a request within the context fails"""
+    try:
+        yield
+    except httpx.HTTPError as exc:
+        raise PaginationError(cursor) from exc
+
+
+@contextmanager
+def _typed_pagination(type: type[BaseModel]) -> Iterator[None]:  # noqa: A002
+    """Make a failing pagination within the context aware of the type of its results"""
+    try:
+        yield
+    except PaginationError as exc:
+        raise exc.with_type(type) from exc.__cause__
 
-class PretalxClient:
-    """Client for the Pretalx API"""
 
-    def __init__(self, config: Config | None = None, *, blocking: bool = False):
+def _validate_result(type: type[T], result: JSONObj) -> T:  # noqa: A002
+    """Validate a single result of a list endpoint by its model"""
+    _logger.debug('result', resp=result)
+    return type.model_validate(result)
+
+
+def _validated(type: type[T], pages: Iterator[Iterable[JSONObj]], *, batch: bool = False) -> Iterator[T]:  # noqa: A002
+    """Validate the results of the pages lazily, making resumption of a failing pagination aware of the type"""
+    with _typed_pagination(type):
+        for page in pages:
+            if batch:
+                yield from list_adapter(type).validate_python(page)
+                continue
+            for result in page:
+                yield _validate_result(type, result)
+
+
+class PretalxClient:
+    """Client for the Pretalx API
+
+    A single HTTP session with a pool of keep-alive connections is used for all requests.
+    Use the client as context manager or call `close` to release the connections in the end, e.g.:
+
+    ```
+    with PretalxClient() as client:
+        count, subs = client.submissions(event_slug)
+        subs = list(subs)
+    ```
+
+    Args:
+        config: configuration of Pytanis, read from the default location if `None`
+        blocking: resolve the pagination of results directly
+        limits: limits of the connection pool, `DEFAULT_LIMITS` if `None`
+        http2: use HTTP/2 if available, i.e. the `h2` package is installed
+        concurrency: number of result pages fetched concurrently within the throttling, 1 means that the
+            pages are fetched one after another
+        cache: on-disk cache to revalidate responses with conditional requests, no caching if `None`
+        retry: retrying of requests failing with transient errors, default `RetryPolicy()` if `None`
+        validation: `item` validates each result of a list endpoint by its model, `batch` validates a page of
+            results at once, which is considerably faster for large events, and `raw` skips the validation and
+            returns the JSON objects as dictionaries. Single resources, e.g. of `submission` or `me`, are always
+            validated
+        stream: decode the results of a page while it is received instead of waiting for the whole page, only used
+            without a cache and if pages are not prefetched, i.e. `concurrency` is 1
+    """
+
+    def __init__(
+        self,
+        config: Config | None = None,
+        *,
+        blocking: bool = False,
+        limits: Limits | None = None,
+        http2: bool = True,
+        concurrency: int = 1,
+        cache: HTTPCache | None = None,
+        retry: RetryPolicy | None = None,
+        validation: Validation = 'item',
+        stream: bool = False,
+    ):
         if config is None:
             config = get_cfg()
         self._config = config
-        self._get_throttled = self._get
+        self._limits = DEFAULT_LIMITS if limits is None else limits
+        self._http2 = http2 and _has_http2()
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self.rate_limiter: RateLimiter
         self.blocking = blocking
+        self.concurrency = concurrency
+        self.cache = cache
+        self.retry = RetryPolicy() if retry is None else retry
+        self.validation = validation
+        self.stream = stream
         self.set_throttling(calls=2, seconds=1)  # we are nice by default and Pretalx doesn't allow many calls at once.
 
+    def __enter__(self) -> 'PretalxClient':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and all connections of the pool
+
+        The client can still be used afterward as a new session is opened on demand.
+        """
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The HTTP session used for all requests, opened on first use
+
+        The session is opened under a lock, so threads using the client at once, e.g. to prefetch pages, share it.
+        """
+        if (client := self._client) is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                if (api_token := self._config.Pretalx.api_token) is None:
+                    msg = 'API token for Pretalx is empty'
+                    raise RuntimeError(msg)
+                _logger.debug('opening http session', http2=self._http2)
+                self._client = httpx.Client(
+                    auth=HeaderApiKey(api_token, header_name='Authorization'),
+                    base_url=BASE_URL,
+                    limits=self._limits,
+                    http2=self._http2,
+                    timeout=TIMEOUT,
+                )
+            return self._client
+
     def set_throttling(self, calls: int, seconds: int):
-        """Throttle the number of calls per seconds to the Pretalx API"""
+        """Throttle the number of calls per seconds to the Pretalx API
+
+        Up to `calls` requests may start at once. If Pretalx signals rate limiting, the rate is decreased and
+        increased again up to `calls / seconds` after a while without being rate limited.
+        """
         _logger.info('throttling', calls=calls, seconds=seconds)
-        self._get_throttled = throttle(calls, seconds)(self._get)
-
-    def _get(self, endpoint: str, params: QueryParams | None = None) -> Response:
-        """Retrieve data via GET request"""
-        if params is None:
-            params = cast(QueryParams, {})
-        if (api_token := self._config.Pretalx.api_token) is None:
-            msg = 'API token for Pretalx is empty'
-            raise RuntimeError(msg)
-        auth = HeaderApiKey(api_token, header_name='Authorization')
-        url = URL('https://pretalx.com/').join(endpoint).copy_merge_params(params)
+        self.set_rate_limiter(TokenBucketLimiter(calls / seconds, burst=calls))
+
+    def set_rate_limiter(self, rate_limiter: RateLimiter):
+        """Use a custom rate limiter for all requests to the Pretalx API"""
+        self.rate_limiter = rate_limiter
+
+    def _get_throttled(
+        self,
+        endpoint: str,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        """Retrieve data via GET request within the rate limit
+
+        Requests that were rate limited are repeated and transient errors are retried according to `retry`.
+        """
+        attempt = rate_limited = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                resp = self._get(endpoint, params, headers, stream=stream)
+            except httpx.TransportError as exc:  # e.g. timeouts and network errors
+                if attempt >= self.retry.retries:
+                    raise
+                error = repr(exc)
+            else:
+                self.rate_limiter.update(resp)
+                if resp.status_code == codes.TOO_MANY_REQUESTS and rate_limited < MAX_RATE_LIMITED_RETRIES:
+                    rate_limited += 1
+                    _logger.warning('rate limited by Pretalx', url=str(resp.url), rate=self.rate_limiter.rate)
+                    resp.close()
+                    continue
+                if resp.status_code not in self.retry.statuses or attempt >= self.retry.retries:
+                    return resp
+                error = f'HTTP status {resp.status_code}'
+                resp.close()
+            wait = self.retry.wait(attempt)
+            attempt += 1
+            _logger.warning('retrying request', endpoint=endpoint, error=error, attempt=attempt, wait=wait)
+            time.sleep(wait)
+
+    def _get(
+        self,
+        endpoint: str,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        """Retrieve data via GET request, don't read the body of the response yet if `stream`"""
+        client = self.http_client
+        url = _url(endpoint, params)
         _logger.info(f'GET: {url}')
-        # we set the timeout to 60 seconds as the Pretalx API is quite slow
-        return httpx.get(url, auth=auth, timeout=60.0)
+        return client.send(client.build_request('GET', url, headers=headers), stream=stream)
 
     def _get_one(self, endpoint: str, params: QueryParams | None = None) -> JSON:
-        """Retrieve a single resource result"""
-        resp = self._get_throttled(endpoint, params)
-        resp.raise_for_status()
-        return resp.json()
+        """Retrieve a single resource result, revalidate the cached response if a cache is used"""
+        if self.cache is None:
+            resp = self._get_throttled(endpoint, params)
+            resp.raise_for_status()
+            return resp.json()
+
+        key = HTTPCache.key(_url(endpoint, params), self._config.Pretalx.api_token)
+        entry, fresh = _cache_lookup(self.cache, key)
+        if fresh:
+            return cast(CacheEntry, entry).load()
+        resp = self._get_throttled(endpoint, params, None if entry is None else entry.validators())
+        return _revalidated(self.cache, key, entry, resp)
+
+    def _get_page(self, url: URL) -> JSONObj:
+        """Retrieve a page of a paginated result given its full URL, raise a resumable error if this fails"""
+        with _resumable_at(PaginationCursor(str(url))):
+            resp = cast(JSONObj, self._get_one(url.path, url.params))
+        _log_resp(resp)
+        return resp
 
     def _resolve_pagination(self, resp: JSONObj) -> Iterator[JSONObj]:
         """Resolves the pagination and returns an iterator over all results"""
-        yield from resp['results']
+        for page in self._iter_pages(resp):
+            yield from page
+
+    def _iter_pages(self, resp: JSONObj) -> Iterator[list[JSONObj]]:
+        """Resolves the pagination and returns an iterator over the results of each page"""
+        if self.concurrency > 1 and (page_urls := _next_page_urls(resp)) is not None:
+            yield from self._prefetch_pages(resp, page_urls)
+            return
+        yield resp['results']
         while (next_page := resp['next']) is not None:
-            endpoint = URL(next_page).path
-            resp = cast(JSONObj, self._get_one(endpoint, URL(next_page).params))
-            _log_resp(resp)
-            yield from resp['results']
+            resp = self._get_page(URL(next_page))
+            yield resp['results']
+
+    def _prefetch_pages(self, resp: JSONObj, page_urls: list[URL]) -> Iterator[list[JSONObj]]:
+        """Fetches the pages concurrently ahead of the consumer and returns an iterator over them in order"""
+        _logger.debug('prefetching pages', pages=len(page_urls), concurrency=self.concurrency)
+        yield resp['results']
+        page_urls.reverse()  # to pop them in order
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='pretalx')
+        pending: deque[Future[JSONObj]] = deque()
+        try:
+            while page_urls or pending:
+                while page_urls and len(pending) < self.concurrency:
+                    pending.append(executor.submit(self._get_page, page_urls.pop()))
+                yield pending.popleft().result()['results']
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _get_many(self, endpoint: str, params: QueryParams | None = None) -> tuple[int, Iterator[JSONObj]]:
         """Retrieves the result count as well as the results as iterator"""
+        count, pages = self._get_pages(endpoint, params)
+        return count, chain.from_iterable(pages)
+
+    def raw_pages(self, endpoint: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Iterable[JSONObj]]]:
+        """Retrieves the result count as well as the raw JSON results of an endpoint page by page as iterator
+
+        The pages are always requested lazily, even if the client is `blocking`, so that a walk through them can
+        stop early, e.g. when results are ordered by a timestamp and older ones show up.
+
+        Args:
+            endpoint: path of the endpoint, e.g. `/api/events/{event_slug}/reviews/`
+            params: query parameters, e.g. for ordering
+
+        Returns:
+            the total count of results and an iterator over the pages of results
+        """
+        if self.stream and self.cache is None and self.concurrency == 1:
+            return self._stream_pages(endpoint, params)
         resp = self._get_one(endpoint, params)
         _log_resp(resp)
         if isinstance(resp, list):
-            return len(resp), iter(resp)
-        elif self.blocking:
-            _logger.debug('blocking resolution of pagination...')
-            return resp['count'], iter(list(tqdm(self._resolve_pagination(resp), total=resp['count'])))
-        else:
+            return len(resp), iter([resp])
+        return resp['count'], self._iter_pages(resp)
+
+    def _get_pages(self, endpoint: str, params: QueryParams | None = None) -> tuple[int, Iterator[Iterable[JSONObj]]]:
+        """Retrieves the result count as well as the results page by page as iterator"""
+        count, pages = self.raw_pages(endpoint, params=params)
+        if not self.blocking:
             _logger.debug('non-blocking resolution of pagination...')
-            return resp['count'], self._resolve_pagination(resp)
+            return count, pages
+
+        _logger.debug('blocking resolution of pagination...')
+        results: list[list[JSONObj]] = []
+        try:
+            with tqdm(total=count) as pbar:
+                for page in pages:
+                    results.append(list(page))
+                    pbar.update(len(results[-1]))
+        except PaginationError as exc:
+            exc.results = list(chain.from_iterable(results))
+            raise
+        return count, iter(results)
+
+    def _stream_page(self, endpoint: str, params: QueryParams | None = None) -> tuple[PageDecoder, Iterator[JSONObj]]:
+        """Request a page and decode its results while they are received, see `stream_page`"""
+        resp = self._get_throttled(endpoint, params, stream=True)
+        if resp.is_error:
+            resp.read()
+            resp.raise_for_status()
+        return stream_page(resp)
+
+    def _stream_pages(
+        self, endpoint: str, params: QueryParams | None = None
+    ) -> tuple[int, Iterator[Iterable[JSONObj]]]:
+        """Retrieves the result count as well as the pages, whose results are decoded while they are received"""
+        decoder, results = self._stream_page(endpoint, params)
+        if 'count' not in decoder.meta:  # e.g. a list instead of a page, so we need to read it completely
+            first_page = list(results)
+            results = iter(first_page)
+            decoder.meta.setdefault('count', len(first_page))
+        _log_resp(decoder.meta)
+        return decoder.meta['count'], self._iter_streamed_pages(decoder, results)
+
+    def _iter_streamed_pages(self, decoder: PageDecoder, results: Iterator[JSONObj]) -> Iterator[Iterator[JSONObj]]:
+        """Walks through the pages one after another, each is consumed before the next page is known"""
+        while True:
+            yield results
+            deque(results, maxlen=0)  # consume what is left of the page
+            if (next_page := decoder.meta.get('next')) is None:
+                return
+            url = URL(next_page)
+            with _resumable_at(PaginationCursor(next_page)):
+                decoder, results = self._stream_page(url.path, url.params)
+            results = _resumable(results, PaginationCursor(next_page))
 
     def _endpoint_lst(
         self,
@@ -96,12 +494,34 @@ class PretalxClient:
         resource: str,
         *,
         params: QueryParams | None = None,
-    ) -> tuple[int, Iterator[T]]:
+    ) -> Results[T]:
         """Queries an endpoint returning a list of resources"""
-        endpoint = f'/api/events/{event_slug}/{resource}/'
-        count, results = self._get_many(endpoint, params)
-        t_results = iter(_logger.debug('result', resp=r) or type.model_validate(r) for r in results)
-        return count, t_results
+        return self._typed_many(type, _list_endpoint(event_slug, resource), params)
+
+    def _typed_many(
+        self,
+        type: type[T],  # noqa: A002
+        endpoint: str,
+        params: QueryParams | None = None,
+    ) -> Results[T]:
+        """Retrieves the result count as well as the results, validated according to `validation`, as iterator"""
+        if self.validation == 'raw':
+            return self._get_many(endpoint, params)
+        with _typed_pagination(type):
+            count, pages = self._get_pages(endpoint, params)
+        return count, _validated(type, pages, batch=self.validation == 'batch')
+
+    def resume(self, cursor: PaginationCursor) -> tuple[int, Iterator[Any]]:
+        """Continue a pagination that failed with a `PaginationError` at the page it stopped
+
+        Returns:
+            the total count of results and an iterator over the remaining results
+        """
+        url = URL(cursor.url)
+        with _resumable_at(cursor):
+            if cursor.model is None:
+                return self._get_many(url.path, url.params)
+            return self._typed_many(cursor.model, url.path, url.params)
 
     def _endpoint_id(
         self,
@@ -112,9 +532,8 @@ class PretalxClient:
         *,
         params: QueryParams | None = None,
     ) -> T:
-        """Query an endpoint returning a single resource"""
-        endpoint = f'/api/events/{event_slug}/{resource}/{id}/'
-        result = self._get_one(endpoint, params)
+        """Query an endpoint returning a single resource, which is always validated"""
+        result = self._get_one(_item_endpoint(event_slug, resource, id), params)
         _logger.debug('result', resp=result)
         return type.model_validate(result)
 
@@ -130,17 +549,15 @@ class PretalxClient:
         _logger.debug('result', resp=result)
         return Event.model_validate(result)
 
-    def events(self, *, params: QueryParams | None = None) -> tuple[int, Iterator[Event]]:
+    def events(self, *, params: QueryParams | None = None) -> Results[Event]:
         """Lists all events and their details"""
-        count, results = self._get_many('/api/events/', params)
-        events = iter(_logger.debug('result', resp=r) or Event.model_validate(r) for r in results)
-        return count, events
+        return self._typed_many(Event, '/api/events/', params)
 
     def submission(self, event_slug: str, code: str, *, params: QueryParams | None = None) -> Submission:
         """Returns a specific submission"""
         return self._endpoint_id(Submission, event_slug, 'submissions', code, params=params)
 
-    def submissions(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Submission]]:
+    def submissions(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Submission]:
         """Lists all submissions and their details"""
         return self._endpoint_lst(Submission, event_slug, 'submissions', params=params)
 
@@ -148,7 +565,7 @@ class PretalxClient:
         """Returns a specific talk"""
         return self._endpoint_id(Talk, event_slug, 'talks', code, params=params)
 
-    def talks(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Talk]]:
+    def talks(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Talk]:
         """Lists all talks and their details"""
         return self._endpoint_lst(Talk, event_slug, 'talks', params=params)
 
@@ -156,7 +573,7 @@ class PretalxClient:
         """Returns a specific speaker"""
         return self._endpoint_id(Speaker, event_slug, 'speakers', code, params=params)
 
-    def speakers(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Speaker]]:
+    def speakers(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Speaker]:
         """Lists all speakers and their details"""
         return self._endpoint_lst(Speaker, event_slug, 'speakers', params=params)
 
@@ -164,7 +581,7 @@ class PretalxClient:
         """Returns a specific review"""
         return self._endpoint_id(Review, event_slug, 'reviews', id, params=params)
 
-    def reviews(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Review]]:
+    def reviews(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Review]:
         """Lists all reviews and their details"""
         return self._endpoint_lst(Review, event_slug, 'reviews', params=params)
 
@@ -172,7 +589,7 @@ class PretalxClient:
         """Returns a specific room"""
         return self._endpoint_id(Room, event_slug, 'rooms', id, params=params)
 
-    def rooms(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Room]]:
+    def rooms(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Room]:
         """Lists all rooms and their details"""
         return self._endpoint_lst(Room, event_slug, 'rooms', params=params)
 
@@ -180,7 +597,7 @@ class PretalxClient:
         """Returns a specific question"""
         return self._endpoint_id(Question, event_slug, 'questions', id, params=params)
 
-    def questions(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Question]]:
+    def questions(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Question]:
         """Lists all questions and their details"""
         return self._endpoint_lst(Question, event_slug, 'questions', params=params)
 
@@ -188,7 +605,7 @@ class PretalxClient:
         """Returns a specific answer"""
         return self._endpoint_id(Answer, event_slug, 'answers', id, params=params)
 
-    def answers(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Answer]]:
+    def answers(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Answer]:
         """Lists all answers and their details"""
         return self._endpoint_lst(Answer, event_slug, 'answers', params=params)
 
@@ -196,7 +613,7 @@ class PretalxClient:
         """Returns a specific tag"""
         return self._endpoint_id(Tag, event_slug, 'tags', tag, params=params)
 
-    def tags(self, event_slug: str, *, params: QueryParams | None = None) -> tuple[int, Iterator[Tag]]:
+    def tags(self, event_slug: str, *, params: QueryParams | None = None) -> Results[Tag]:
         """Lists all tags and their details"""
         return self._endpoint_lst(Tag, event_slug, 'tags', params=params)
 
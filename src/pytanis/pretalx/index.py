@@ -0,0 +1,197 @@
+"""In-memory index of the resources of an event for fast lookups across them
+
+Instead of merging dataframes or scanning lists, e.g. to find the submissions of a speaker or the reviews of a
+submission, the index keeps hash maps from keys to the related objects, e.g.:
+
+```
+index = EventIndex(subs, speakers, reviews)
+for sub in index.submissions_of(speaker_code):
+    scores = [review.score for review in index.reviews_of(sub.code)]
+```
+
+The index can be updated incrementally. Adding an object with the code or id of an already indexed one replaces it
+and updates all lookups accordingly.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from pytanis.pretalx.types import Answer, Review, Speaker, Submission
+
+
+def _link(links: dict[Any, dict[Any, None]], key: Hashable, value: Hashable):
+    """Add a value to the ordered set of a key"""
+    links.setdefault(key, {})[value] = None
+
+
+def _unlink(links: dict[Any, dict[Any, None]], key: Hashable, value: Hashable):
+    """Remove a value from the ordered set of a key and the key if its set is empty"""
+    values = links.get(key)
+    if values is not None:
+        values.pop(value, None)
+        if not values:
+            del links[key]
+
+
+class EventIndex:
+    """Index of submissions, speakers, reviews and answers of an event
+
+    Answers are taken from the submissions and speakers as well as added directly. An answer is kept as long as
+    one of its sources still has it.
+
+    Args:
+        submissions: submissions to index
+        speakers: speakers to index
+        reviews: reviews to index
+        answers: answers to index, additionally to the ones of submissions and speakers
+    """
+
+    def __init__(
+        self,
+        submissions: Iterable[Submission] = (),
+        speakers: Iterable[Speaker] = (),
+        reviews: Iterable[Review] = (),
+        answers: Iterable[Answer] = (),
+    ):
+        self._subs: dict[str, Submission] = {}
+        self._speakers: dict[str, Speaker] = {}
+        self._reviews: dict[int, Review] = {}
+        self._answers: dict[int, Answer] = {}
+        self._answer_sources: dict[int, dict[Hashable, None]] = {}
+        self._subs_by_speaker: dict[str, dict[str, None]] = {}
+        self._subs_by_tag: dict[int, dict[str, None]] = {}
+        self._reviews_by_sub: dict[str, dict[int, None]] = {}
+        self._reviews_by_user: dict[str, dict[int, None]] = {}
+        self._answers_by_question: dict[int, dict[int, None]] = {}
+        self.add_submissions(submissions)
+        self.add_speakers(speakers)
+        self.add_reviews(reviews)
+        self.add_answers(answers)
+
+    def __repr__(self) -> str:
+        return (
+            f'EventIndex(submissions={len(self._subs)}, speakers={len(self._speakers)}, '
+            f'reviews={len(self._reviews)}, answers={len(self._answers)})'
+        )
+
+    def add_submissions(self, subs: Iterable[Submission]):
+        """Add or replace submissions"""
+        for sub in subs:
+            self.remove_submission(sub.code)
+            self._subs[sub.code] = sub
+            for speaker in sub.speakers:
+                _link(self._subs_by_speaker, speaker.code, sub.code)
+            for tag_id in sub.tag_ids or ():
+                _link(self._subs_by_tag, tag_id, sub.code)
+            self._add_answers(sub.answers or (), ('submission', sub.code))
+
+    def add_speakers(self, speakers: Iterable[Speaker]):
+        """Add or replace speakers"""
+        for speaker in speakers:
+            self.remove_speaker(speaker.code)
+            self._speakers[speaker.code] = speaker
+            self._add_answers(speaker.answers or (), ('speaker', speaker.code))
+
+    def add_reviews(self, reviews: Iterable[Review]):
+        """Add or replace reviews"""
+        for review in reviews:
+            self.remove_review(review.id)
+            self._reviews[review.id] = review
+            _link(self._reviews_by_sub, review.submission, review.id)
+            _link(self._reviews_by_user, review.user, review.id)
+
+    def add_answers(self, answers: Iterable[Answer]):
+        """Add or replace answers independent of submissions and speakers"""
+        self._add_answers(answers, 'answers')
+
+    def _add_answers(self, answers: Iterable[Answer], source: Hashable):
+        for answer in answers:
+            if (old := self._answers.get(answer.id)) is not None and old.question.id != answer.question.id:
+                _unlink(self._answers_by_question, old.question.id, answer.id)
+            self._answers[answer.id] = answer
+            _link(self._answer_sources, answer.id, source)
+            _link(self._answers_by_question, answer.question.id, answer.id)
+
+    def _remove_answers(self, answers: Iterable[Answer], source: Hashable):
+        for answer in answers:
+            _unlink(self._answer_sources, answer.id, source)
+            if answer.id not in self._answer_sources and (current := self._answers.pop(answer.id, None)) is not None:
+                _unlink(self._answers_by_question, current.question.id, answer.id)
+
+    def remove_submission(self, code: str):
+        """Remove a submission, if it is indexed, with its answers"""
+        if (sub := self._subs.pop(code, None)) is None:
+            return
+        for speaker in sub.speakers:
+            _unlink(self._subs_by_speaker, speaker.code, code)
+        for tag_id in sub.tag_ids or ():
+            _unlink(self._subs_by_tag, tag_id, code)
+        self._remove_answers(sub.answers or (), ('submission', code))
+
+    def remove_speaker(self, code: str):
+        """Remove a speaker, if it is indexed, with its answers"""
+        if (speaker := self._speakers.pop(code, None)) is not None:
+            self._remove_answers(speaker.answers or (), ('speaker', code))
+
+    def remove_review(self, id: int):  # noqa: A002
+        """Remove a review if it is indexed"""
+        if (review := self._reviews.pop(id, None)) is not None:
+            _unlink(self._reviews_by_sub, review.submission, id)
+            _unlink(self._reviews_by_user, review.user, id)
+
+    @property
+    def submissions(self) -> tuple[Submission, ...]:
+        return tuple(self._subs.values())
+
+    @property
+    def speakers(self) -> tuple[Speaker, ...]:
+        return tuple(self._speakers.values())
+
+    @property
+    def reviews(self) -> tuple[Review, ...]:
+        return tuple(self._reviews.values())
+
+    @property
+    def answers(self) -> tuple[Answer, ...]:
+        return tuple(self._answers.values())
+
+    def submission(self, code: str) -> Submission:
+        """Returns a submission by its code"""
+        return self._subs[code]
+
+    def speaker(self, code: str) -> Speaker:
+        """Returns a speaker by its code"""
+        return self._speakers[code]
+
+    def review(self, id: int) -> Review:  # noqa: A002
+        """Returns a review by its id"""
+        return self._reviews[id]
+
+    def answer(self, id: int) -> Answer:  # noqa: A002
+        """Returns an answer by its id"""
+        return self._answers[id]
+
+    def submissions_of(self, speaker_code: str) -> tuple[Submission, ...]:
+        """Returns the submissions of a speaker"""
+        return tuple(self._subs[code] for code in self._subs_by_speaker.get(speaker_code, ()))
+
+    def submissions_tagged(self, tag_id: int) -> tuple[Submission, ...]:
+        """Returns the submissions with a tag"""
+        return tuple(self._subs[code] for code in self._subs_by_tag.get(tag_id, ()))
+
+    def reviews_of(self, submission_code: str) -> tuple[Review, ...]:
+        """Returns the reviews of a submission"""
+        return tuple(self._reviews[review_id] for review_id in self._reviews_by_sub.get(submission_code, ()))
+
+    def reviews_by(self, user: str) -> tuple[Review, ...]:
+        """Returns the reviews of a reviewer"""
+        return tuple(self._reviews[review_id] for review_id in self._reviews_by_user.get(user, ()))
+
+    def submissions_reviewed_by(self, user: str) -> tuple[Submission, ...]:
+        """Returns the indexed submissions reviewed by a reviewer"""
+        codes = dict.fromkeys(review.submission for review in self.reviews_by(user))
+        return tuple(self._subs[code] for code in codes if code in self._subs)
+
+    def answers_to(self, question_id: int) -> tuple[Answer, ...]:
+        """Returns all answers to a question"""
+        return tuple(self._answers[answer_id] for answer_id in self._answers_by_question.get(question_id, ()))
@@ -0,0 +1,298 @@
+"""Local SQLite mirror of a Pretalx event with incremental synchronisation
+
+The mirror stores the raw JSON of submissions, speakers, reviews, answers and tags of an event in a SQLite database.
+Each table has a `key` (code, id or tag), the JSON `data` and some generated columns for convenient SQL queries,
+e.g. `state` of submissions or `submission`, `user`, `score` and `updated` of reviews.
+
+A sync only writes what changed. Reviews are synchronised incrementally, i.e. they are requested ordered by
+`updated` descending and the walk through the result pages stops as soon as reviews older than the last checkpoint
+show up. Reviews at the checkpoint are fetched again, as others might have been saved with the same timestamp in
+the meantime. The order is checked on every page and the walk continues through all pages if it is broken. The
+other resources do not allow filtering by modification time, so they are walked completely. Unchanged
+objects are detected by a digest and not rewritten. Pass a client with an `HTTPCache` to avoid
+downloading unchanged pages again. Deleted objects are only detected with a full sync, i.e. `sync(full=True)`.
+
+Analytics can then query the mirror instead of the API, e.g.:
+
+```
+mirror = EventMirror(PretalxClient(), event_slug, 'event.sqlite')
+mirror.sync()
+df = mirror.query('SELECT submission, COUNT(*) AS n FROM reviews GROUP BY submission')
+```
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import chain, pairwise
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pandas as pd
+from httpx import QueryParams
+from pydantic import BaseModel
+from structlog import get_logger
+
+from pytanis.pretalx.client import JSONObj, PretalxClient
+from pytanis.pretalx.types import Answer, Review, Speaker, Submission, Tag
+from pytanis.pretalx.utils import parse_timestamp
+
+_logger = get_logger()
+
+
+class _Resource(NamedTuple):
+    """Description of how a resource is mirrored"""
+
+    type: type[BaseModel]
+    key: str  # field used as primary key
+    columns: dict[str, str]  # generated column -> JSON path
+    delta_field: str | None = None  # field allowing an incremental sync
+
+
+RESOURCES: dict[str, _Resource] = {
+    'submissions': _Resource(Submission, 'code', {'state': '$.state', 'track_id': '$.track_id', 'title': '$.title'}),
+    'speakers': _Resource(Speaker, 'code', {'name': '$.name', 'email': '$.email'}),
+    'reviews': _Resource(
+        Review,
+        'id',
+        {'submission': '$.submission', 'user': '$.user', 'score': '$.score', 'updated': '$.updated'},
+        delta_field='updated',
+    ),
+    'answers': _Resource(
+        Answer,
+        'id',
+        {'question_id': '$.question.id', 'submission': '$.submission', 'person': '$.person', 'review': '$.review'},
+    ),
+    'tags': _Resource(Tag, 'tag', {'color': '$.color'}),
+}
+"""Mirrored resources, i.e. endpoints of the Pretalx API, and their tables"""
+
+
+class SyncStats(BaseModel):
+    """Statistics about the synchronisation of a resource"""
+
+    resource: str
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    incremental: bool = False
+    changed: list[str] = []  # keys of inserted and updated objects
+
+
+def _digest(obj: JSONObj) -> str:
+    """Digest of a JSON object to detect changes"""
+    return hashlib.sha1(json.dumps(obj, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
+
+
+def _is_sorted_desc(timestamps: list[datetime]) -> bool:
+    """Check if timestamps are sorted in descending order"""
+    return all(a >= b for a, b in pairwise(timestamps))
+
+
+class DeltaResults:
+    """Iterator over the raw results of a resource that changed after a checkpoint, see `fetch_since`
+
+    The results can only be walked once. While they are walked, `latest` is updated to the latest timestamp of the
+    walked results, i.e. the checkpoint of the next fetch, and `incremental` is unset if the walk continues through
+    all pages as the API does not keep the order.
+
+    Args:
+        pages: pages of results, ordered by `field` descending for an incremental walk
+        field: timestamp field of the results, e.g. `updated`, no checkpoint is tracked if `None`
+        since: timestamp as returned by the API, the walk stops at results before it, all results are walked if `None`
+    """
+
+    def __init__(self, pages: Iterator[Iterable[JSONObj]], field: str | None = None, since: str | None = None):
+        self._pages = pages
+        self.field = field
+        self.latest = since
+        self.incremental = field is not None and since is not None
+
+    def __iter__(self) -> Iterator[JSONObj]:
+        if (field := self.field) is None:
+            yield from chain.from_iterable(self._pages)
+            return
+
+        checkpoint = latest = None if self.latest is None else parse_timestamp(self.latest)
+        prev: list[datetime] = []  # timestamp of the last result of the previous page
+        for page in self._pages:
+            results = list(page)
+            timestamps = [parse_timestamp(result[field]) for result in results]
+            if self.incremental and not _is_sorted_desc(prev + timestamps):
+                _logger.warning('ordering not supported by API, fetching completely', field=field)
+                self.incremental = False
+            for result, timestamp in zip(results, timestamps, strict=True):
+                if self.incremental and checkpoint is not None and timestamp < checkpoint:
+                    return  # everything else is older
+                if latest is None or timestamp > latest:
+                    latest, self.latest = timestamp, result[field]
+                yield result
+            prev = timestamps[-1:] or prev
+
+
+def fetch_since(
+    client: PretalxClient, event_slug: str, resource: str, field: str | None = None, since: str | None = None
+) -> DeltaResults:
+    """Fetch the raw results of a resource of an event that changed after a timestamp if possible
+
+    The results are requested ordered by the timestamp `field`, e.g. `updated` of reviews, descending and the walk
+    through the result pages stops as soon as results before `since` show up. Results at `since` are returned again
+    as others might have been saved with the same timestamp after the last fetch. The pages are requested lazily,
+    even if the client is blocking. If a page breaks the order, e.g. as the API does not support it, the walk
+    continues through all pages.
+
+    Args:
+        client: client used for the requests
+        event_slug: slug of the event
+        resource: name of the resource, e.g. `reviews`
+        field: timestamp field of the results to track the checkpoint, all results are fetched if `None`
+        since: timestamp as returned by the API, all results are fetched if `None`
+
+    Returns:
+        iterator over the results, which tracks the checkpoint for the next fetch
+    """
+    endpoint = f'/api/events/{event_slug}/{resource}/'
+    params = None if field is None or since is None else QueryParams({'ordering': f'-{field}'})
+    _, pages = client.raw_pages(endpoint, params=params)
+    return DeltaResults(pages, field, since)
+
+
+class EventMirror:
+    """Local SQLite mirror of a Pretalx event
+
+    Args:
+        client: client used to synchronise the mirror
+        event_slug: slug of the event to mirror
+        db_path: path of the SQLite database, created if it does not exist
+    """
+
+    def __init__(self, client: PretalxClient, event_slug: str, db_path: Path | str):
+        self.client = client
+        self.event_slug = event_slug
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+
+    def close(self):
+        """Close the connection to the database"""
+        self.conn.close()
+
+    def _create_tables(self):
+        with self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints ('
+                'event TEXT, resource TEXT, delta TEXT, synced_at REAL, PRIMARY KEY (event, resource))'
+            )
+            for name, resource in RESOURCES.items():
+                columns = ''.join(
+                    f", {col} GENERATED ALWAYS AS (json_extract(data, '{path}')) VIRTUAL"
+                    for col, path in resource.columns.items()
+                )
+                self.conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {name} ('
+                    f'event TEXT, key TEXT, data TEXT NOT NULL, digest TEXT NOT NULL, synced_at REAL{columns}, '
+                    f'PRIMARY KEY (event, key))'
+                )
+
+    def checkpoint(self, resource: str) -> tuple[str | None, float | None]:
+        """Returns the delta checkpoint, e.g. the latest `updated` of reviews, and time of the last sync"""
+        row = self.conn.execute(
+            'SELECT delta, synced_at FROM checkpoints WHERE event = ? AND resource = ?', (self.event_slug, resource)
+        ).fetchone()
+        return (None, None) if row is None else row
+
+    def _set_checkpoint(self, resource: str, delta: str | None, synced_at: float):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO checkpoints (event, resource, delta, synced_at) VALUES (?, ?, ?, ?)',
+            (self.event_slug, resource, delta, synced_at),
+        )
+
+    def _walk(self, name: str, *, full: bool) -> DeltaResults:
+        """Walk the results of a resource, stop early for an incremental sync if possible"""
+        field = RESOURCES[name].delta_field
+        since = None if full else self.checkpoint(name)[0]
+        return fetch_since(self.client, self.event_slug, name, field, since)
+
+    def sync_resource(self, name: str, *, full: bool = False) -> SyncStats:
+        """Synchronise a single resource, see `RESOURCES` for the available ones"""
+        resource = RESOURCES[name]
+        sync_time = time.time()
+        results = self._walk(name, full=full)
+        stats = SyncStats(resource=name)
+        digests = dict(
+            self.conn.execute(f'SELECT key, digest FROM {name} WHERE event = ?', (self.event_slug,)).fetchall()  # noqa: S608
+        )
+        seen = set()
+        with self.conn:
+            for result in results:
+                stats.fetched += 1
+                key = str(result[resource.key])
+                seen.add(key)
+                digest = _digest(result)
+                if (old_digest := digests.get(key)) == digest:
+                    continue
+                elif old_digest is None:
+                    stats.inserted += 1
+                else:
+                    stats.updated += 1
+                stats.changed.append(key)
+                self.conn.execute(
+                    f'INSERT OR REPLACE INTO {name} (event, key, data, digest, synced_at) VALUES (?, ?, ?, ?, ?)',  # noqa: S608
+                    (self.event_slug, key, json.dumps(result), digest, sync_time),
+                )
+            stats.incremental = results.incremental
+            if not results.incremental:
+                deleted = [(self.event_slug, key) for key in digests.keys() - seen]
+                self.conn.executemany(f'DELETE FROM {name} WHERE event = ? AND key = ?', deleted)  # noqa: S608
+                stats.deleted = len(deleted)
+            self._set_checkpoint(name, results.latest, sync_time)
+        _logger.info('synced', **stats.model_dump(exclude={'changed'}))
+        return stats
+
+    def sync(self, resources: Iterable[str] | None = None, *, full: bool = False) -> list[SyncStats]:
+        """Synchronise the mirror with Pretalx
+
+        Args:
+            resources: names of the resources to sync, all of `RESOURCES` if `None`
+            full: walk all results, even if an incremental sync is possible, and remove deleted objects
+
+        Returns:
+            statistics of the synchronisation per resource
+        """
+        if resources is None:
+            resources = RESOURCES.keys()
+        return [self.sync_resource(name, full=full) for name in resources]
+
+    def _load(self, name: str) -> list[Any]:
+        """Validate the mirrored objects of a resource by its type"""
+        resource = RESOURCES[name]
+        rows = self.conn.execute(f'SELECT data FROM {name} WHERE event = ?', (self.event_slug,))  # noqa: S608
+        return [resource.type.model_validate_json(data) for (data,) in rows]
+
+    def submissions(self) -> list[Submission]:
+        """Mirrored submissions"""
+        return self._load('submissions')
+
+    def speakers(self) -> list[Speaker]:
+        """Mirrored speakers"""
+        return self._load('speakers')
+
+    def reviews(self) -> list[Review]:
+        """Mirrored reviews"""
+        return self._load('reviews')
+
+    def answers(self) -> list[Answer]:
+        """Mirrored answers"""
+        return self._load('answers')
+
+    def tags(self) -> list[Tag]:
+        """Mirrored tags"""
+        return self._load('tags')
+
+    def query(self, sql: str, params: Any = ()) -> pd.DataFrame:
+        """Run an SQL query against the mirror and return the result as dataframe"""
+        return pd.read_sql_query(sql, self.conn, params=params)
@@ -0,0 +1,171 @@
+"""Persistence of fetched resources and dataframes of an event as Parquet or Arrow files
+
+Resources like submissions are stored with their nested fields, e.g. speakers, answers and slots, as Arrow structs
+and lists, so that they can be loaded again as models or analysed column-wise without validating them, e.g.:
+
+```
+save_models(subs, 'subs.parquet')
+subs = load_models(Submission, 'subs.parquet')
+titles = load_table('subs.parquet', columns=['code', 'title']).to_pandas()
+```
+
+The format is determined by the file suffix, i.e. `.parquet` for Parquet and `.arrow` or `.feather` for the Arrow IPC
+file format. Arrow files are stored uncompressed and thus loaded without copying if they are memory-mapped, whereas
+Parquet files are smaller. All values are stored as in the JSON of the Pretalx API, e.g. timestamps as ISO strings.
+
+Note: `pyarrow` needs to be installed, consider `pip install 'pytanis[all]'`.
+"""
+
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from pytanis.pretalx.snapshot import RESOURCE_PARAMS, EventSnapshot
+from pytanis.pretalx.utils import list_adapter
+
+M = TypeVar('M', bound=BaseModel)
+
+ARROW_SUFFIXES = ('.arrow', '.feather')
+PARQUET_SUFFIX = '.parquet'
+_SNAPSHOT_KEY = b'pytanis.snapshot'
+
+
+def _is_arrow(path: Path) -> bool:
+    if path.suffix in ARROW_SUFFIXES:
+        return True
+    elif path.suffix == PARQUET_SUFFIX:
+        return False
+    msg = f'Unknown file format of {path}, use one of {(PARQUET_SUFFIX, *ARROW_SUFFIXES)}'
+    raise ValueError(msg)
+
+
+def save_table(table: pa.Table, path: str | Path):
+    """Save an Arrow table as Parquet or Arrow file depending on the suffix of the path"""
+    path = Path(path)
+    if _is_arrow(path):
+        with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        pq.write_table(table, path)
+
+
+def load_table(path: str | Path, *, columns: Sequence[str] | None = None, memory_map: bool = True) -> pa.Table:
+    """Load an Arrow table from a Parquet or Arrow file
+
+    Args:
+        path: path of the file
+        columns: only load these columns, all if `None`
+        memory_map: map the file into memory instead of reading it
+
+    Returns:
+        the table
+    """
+    path = Path(path)
+    if not _is_arrow(path):
+        return pq.read_table(path, columns=columns, memory_map=memory_map)
+    source = pa.memory_map(str(path)) if memory_map else pa.OSFile(str(path))
+    with source:
+        table = pa.ipc.open_file(source).read_all()
+    return table if columns is None else table.select(columns)
+
+
+def models_as_table(models: Iterable[BaseModel]) -> pa.Table:
+    """Convert models into an Arrow table with a column for each field and nested fields as structs and lists"""
+    return pa.Table.from_pylist([model.model_dump(mode='json') for model in models])
+
+
+def save_models(models: Iterable[BaseModel], path: str | Path):
+    """Save models, e.g. submissions or reviews, as Parquet or Arrow file depending on the suffix of the path"""
+    save_table(models_as_table(models), path)
+
+
+def load_models(type: type[M], path: str | Path, *, memory_map: bool = True) -> list[M]:  # noqa: A002
+    """Load and validate models saved with `save_models`
+
+    Args:
+        type: model of the saved objects, e.g. `Submission`
+        path: path of the file
+        memory_map: map the file into memory instead of reading it
+
+    Returns:
+        the models
+    """
+    rows = load_table(path, memory_map=memory_map).to_pylist()
+    return list_adapter(type).validate_python(rows)
+
+
+def save_df(df: pd.DataFrame, path: str | Path):
+    """Save a dataframe, e.g. from `subs_as_df`, as Parquet or Arrow file depending on the suffix of the path"""
+    save_table(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def load_df(path: str | Path, *, columns: Sequence[str] | None = None, memory_map: bool = True) -> pd.DataFrame:
+    """Load a dataframe saved with `save_df`
+
+    Columns of lists, e.g. the speaker codes of `subs_as_df`, hold lists again instead of arrays.
+
+    Args:
+        path: path of the file
+        columns: only load these columns, all if `None`
+        memory_map: map the file into memory instead of reading it
+
+    Returns:
+        the dataframe
+    """
+    table = load_table(path, columns=columns, memory_map=memory_map)
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            values = table.column(field.name).to_pylist()
+            df[field.name] = pd.Series(pd.array(values, dtype=object), index=df.index)
+    return df
+
+
+def save_snapshot(snapshot: EventSnapshot, directory: str | Path, *, suffix: str = PARQUET_SUFFIX):
+    """Save each resource of a snapshot as a file in a directory
+
+    Args:
+        snapshot: snapshot of an event
+        directory: directory of the files, created if it does not exist
+        suffix: suffix of the files and thus their format
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    meta = json.dumps({'event_slug': snapshot.event_slug, 'fetched_at': snapshot.fetched_at.isoformat()})
+    for resource in RESOURCE_PARAMS:
+        table = models_as_table(getattr(snapshot, resource))
+        save_table(table.replace_schema_metadata({_SNAPSHOT_KEY: meta}), directory / f'{resource}{suffix}')
+
+
+def load_snapshot(directory: str | Path, *, memory_map: bool = True) -> EventSnapshot:
+    """Load a snapshot saved with `save_snapshot`
+
+    Args:
+        directory: directory of the files
+        memory_map: map the files into memory instead of reading them
+
+    Returns:
+        the snapshot
+    """
+    directory = Path(directory)
+    resources = {}
+    meta = None
+    for resource in RESOURCE_PARAMS:
+        paths = [directory / f'{resource}{suffix}' for suffix in (PARQUET_SUFFIX, *ARROW_SUFFIXES)]
+        path = next((path for path in paths if path.exists()), None)
+        if path is None:
+            msg = f'No file of resource {resource} found in {directory}'
+            raise FileNotFoundError(msg)
+        table = load_table(path, memory_map=memory_map)
+        meta = (table.schema.metadata or {}).get(_SNAPSHOT_KEY, meta)
+        resources[resource] = table.to_pylist()
+    if meta is None:
+        msg = f'No snapshot found in {directory}'
+        raise ValueError(msg)
+    return EventSnapshot.model_validate({**json.loads(meta), **resources})
@@ -0,0 +1,132 @@
+"""Immutable snapshot of all relevant resources of an event
+
+Instead of fetching submissions, speakers, reviews and questions one after another, the snapshot fetches them
+concurrently with a single client, so that all requests share its throttling, i.e. rate budget, e.g.:
+
+```
+snapshot = EventSnapshot.fetch(PretalxClient(), event_slug)
+for sub in snapshot.submissions_of(speaker_code):
+    reviews = snapshot.reviews_of(sub.code)
+```
+
+In a notebook with an `AsyncPretalxClient` use `snapshot = await EventSnapshot.afetch(client, event_slug)`.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any
+
+from httpx import QueryParams
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from structlog import get_logger
+
+from pytanis.pretalx.async_client import AsyncPretalxClient
+from pytanis.pretalx.client import PretalxClient
+from pytanis.pretalx.index import EventIndex
+from pytanis.pretalx.types import Answer, Question, Review, Speaker, Submission
+from pytanis.pretalx.utils import EventTables, event_as_tables
+
+_logger = get_logger()
+
+RESOURCE_PARAMS: dict[str, QueryParams] = {
+    'submissions': QueryParams({'questions': 'all'}),
+    'speakers': QueryParams({'questions': 'all'}),
+    'reviews': QueryParams(),
+    'questions': QueryParams(),
+}
+"""Resources of a snapshot and the query parameters used to fetch them"""
+
+
+class EventSnapshot(BaseModel):
+    """Immutable snapshot of the submissions, speakers, reviews and questions of an event
+
+    Lookups across resources are answered by indexes built when the snapshot is created.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    event_slug: str
+    fetched_at: datetime
+    submissions: tuple[Submission, ...]
+    speakers: tuple[Speaker, ...]
+    reviews: tuple[Review, ...]
+    questions: tuple[Question, ...]
+
+    _index: EventIndex = PrivateAttr()
+    _questions_by_id: MappingProxyType[int, Question] = PrivateAttr()
+
+    def model_post_init(self, __context: Any):
+        self._index = EventIndex(self.submissions, self.speakers, self.reviews)
+        self._questions_by_id = MappingProxyType({question.id: question for question in self.questions})
+
+    def submission(self, code: str) -> Submission:
+        """Returns a submission by its code"""
+        return self._index.submission(code)
+
+    def speaker(self, code: str) -> Speaker:
+        """Returns a speaker by its code"""
+        return self._index.speaker(code)
+
+    def question(self, id: int) -> Question:  # noqa: A002
+        """Returns a question by its id"""
+        return self._questions_by_id[id]
+
+    def submissions_of(self, speaker_code: str) -> tuple[Submission, ...]:
+        """Returns the submissions of a speaker"""
+        return self._index.submissions_of(speaker_code)
+
+    def reviews_of(self, submission_code: str) -> tuple[Review, ...]:
+        """Returns the reviews of a submission"""
+        return self._index.reviews_of(submission_code)
+
+    def answers_to(self, question_id: int) -> tuple[Answer, ...]:
+        """Returns all answers of submissions and speakers to a question"""
+        return self._index.answers_to(question_id)
+
+    def as_index(self) -> EventIndex:
+        """Returns a new, independent index of the snapshot that can be updated incrementally"""
+        return EventIndex(self.submissions, self.speakers, self.reviews)
+
+    def as_tables(self) -> EventTables:
+        """Returns the submissions, speakers, answers and reviews as normalized tables, see `event_as_tables`"""
+        return event_as_tables(self.submissions, self.speakers, self.reviews)
+
+    @classmethod
+    def fetch(cls, client: PretalxClient, event_slug: str) -> 'EventSnapshot':
+        """Fetch all resources of an event concurrently within the throttling of the client
+
+        Each resource is walked in its own thread, so the waiting times for the responses overlap.
+        Use `concurrency` of the client to also fetch the pages of a single resource concurrently.
+        """
+
+        def fetch_all(resource: str) -> tuple[Any, ...]:
+            _, results = getattr(client, resource)(event_slug, params=RESOURCE_PARAMS[resource])
+            t_results = tuple(results)
+            _logger.debug('fetched resource', resource=resource, count=len(t_results))
+            return t_results
+
+        # open the HTTP session once before the threads share it
+        client.http_client  # noqa: B018
+        with ThreadPoolExecutor(max_workers=len(RESOURCE_PARAMS), thread_name_prefix='snapshot') as executor:
+            futures = {resource: executor.submit(fetch_all, resource) for resource in RESOURCE_PARAMS}
+            resources = {resource: future.result() for resource, future in futures.items()}
+        return cls(event_slug=event_slug, fetched_at=datetime.now(timezone.utc), **resources)
+
+    @classmethod
+    async def afetch(cls, client: AsyncPretalxClient, event_slug: str) -> 'EventSnapshot':
+        """Fetch all resources of an event concurrently within the throttling of the asynchronous client"""
+
+        async def fetch_all(resource: str) -> tuple[Any, ...]:
+            _, results = await getattr(client, resource)(event_slug, params=RESOURCE_PARAMS[resource])
+            t_results = tuple([result async for result in results])  # noqa: C409
+            _logger.debug('fetched resource', resource=resource, count=len(t_results))
+            return t_results
+
+        results = await asyncio.gather(*(fetch_all(resource) for resource in RESOURCE_PARAMS))
+        return cls(
+            event_slug=event_slug,
+            fetched_at=datetime.now(timezone.utc),
+            **dict(zip(RESOURCE_PARAMS, results, strict=True)),
+        )
@@ -0,0 +1,264 @@
+"""Incremental decoding of result pages of the Pretalx API
+
+A page like `{"count": 2, "next": null, "previous": null, "results": [{...}, {...}]}` is decoded while its text
+is received, so that the first results can be processed before the whole page arrived and the text and the decoded
+page never need to be held in memory at once. The `PageDecoder` is push-based, i.e. it is fed the chunks of text,
+and thus works with synchronous as well as asynchronous responses, e.g.:
+
+```
+decoder = PageDecoder()
+for chunk in resp.iter_text():
+    for result in decoder.feed(chunk):
+        ...
+results = decoder.close()
+```
+"""
+
+import json
+import re
+from collections.abc import AsyncIterator, Generator, Iterator
+from typing import Any
+
+from httpx import Response
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,:\]} \t\n\r]')
+_DECODER = json.JSONDecoder()
+
+_Parser = Generator[None, None, Any]
+"""Generator that yields whenever it needs more text and returns the parsed value"""
+
+
+class _ValueScanner:
+    """Finds the end of a JSON value that is fed chunk by chunk, scanning each character only once
+
+    Only the nesting depth as well as the string and escape state are tracked, the value is decoded when complete.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.scalar: bool | None = None  # number, `true`, `false` or `null`, which end only with a delimiter
+
+    def scan(self, text: str, pos: int) -> int | None:
+        """Returns the end of the value in the text or `None` if it continues in the next chunk"""
+        if self.scalar is None:
+            self.scalar = text[pos] not in '{["'
+        if self.scalar:
+            match = _SCALAR_END.search(text, pos)
+            return None if match is None else match.start()
+        while pos < len(text):
+            if self.escaped:
+                self.escaped = False
+                pos += 1
+            elif self.in_string:
+                if (match := _STRING_END.search(text, pos)) is None:
+                    return None
+                pos = match.end()
+                if match.group() == '\\':
+                    self.escaped = True
+                else:
+                    self.in_string = False
+                    if self.depth == 0:
+                        return pos
+            else:
+                if (match := _STRUCTURAL.search(text, pos)) is None:
+                    return None
+                pos = match.end()
+                if (char := match.group()) == '"':
+                    self.in_string = True
+                elif char in '{[':
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        return pos
+        return None
+
+
+class PageDecoder:
+    """Push decoder of a page returning the results decoded so far for each chunk of text it is fed
+
+    All fields of the page except of `results` are collected in `meta`. If the page is a JSON list instead of
+    an object, its elements are the results.
+    """
+
+    def __init__(self) -> None:
+        self.meta: dict[str, Any] = {}
+        self.started = False  # the results started or the page was completely decoded
+        self.done = False
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._results: list[dict[str, Any]] = []
+        self._parser = self._parse()
+        next(self._parser)  # run until text is needed
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Decode the next chunk of text and return the results completed by it"""
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return self._resume()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal the end of the text and return the remaining results"""
+        self._eof = True
+        results = self._resume()
+        if not self.done:
+            msg = 'Unexpected end of page'
+            raise json.JSONDecodeError(msg, self._buf, self._pos)
+        return results
+
+    def _resume(self) -> list[dict[str, Any]]:
+        if not self.done:
+            try:
+                self._parser.send(None)
+            except StopIteration:
+                self.started = self.done = True
+        results, self._results = self._results, []
+        return results
+
+    def _more(self) -> _Parser:
+        """Wait for more text, returns `False` if the end of the text was reached"""
+        if self._eof:
+            return False
+        yield
+        return not self._eof  # noqa: B901
+
+    def _char(self) -> _Parser:
+        """Returns the current character"""
+        while self._pos >= len(self._buf):
+            if not (yield from self._more()):
+                msg = 'Unexpected end of page'
+                raise json.JSONDecodeError(msg, self._buf, self._pos)
+        return self._buf[self._pos]
+
+    def _expect(self, char: str) -> _Parser:
+        if (yield from self._char()) != char:
+            msg = f'Expecting {char!r}'
+            raise json.JSONDecodeError(msg, self._buf, self._pos)
+        self._pos += 1
+
+    def _skip_whitespace(self) -> _Parser:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf) or not (yield from self._more()):
+                return
+
+    def _value(self) -> _Parser:
+        """Returns the next complete JSON value, which is decoded once its end was found"""
+        yield from self._char()
+        scanner = _ValueScanner()
+        parts = []  # text of the value in previous chunks, moved out of the buffer to avoid copying it again
+        while (end := scanner.scan(self._buf, self._pos)) is None:
+            parts.append(self._buf[self._pos :])
+            self._pos = len(self._buf)
+            if not (yield from self._more()):
+                if scanner.scalar:
+                    end = self._pos
+                    break
+                msg = 'Unexpected end of page'
+                raise json.JSONDecodeError(msg, ''.join(parts), 0)
+        parts.append(self._buf[self._pos : end])
+        self._pos = end
+        text = ''.join(parts)
+        value, value_end = _DECODER.raw_decode(text)
+        if value_end != len(text):
+            msg = 'Extra data'
+            raise json.JSONDecodeError(msg, text, value_end)
+        return value  # noqa: B901
+
+    def _array(self) -> _Parser:
+        """Parse the elements of an array as results after its opening bracket"""
+        self.started = True
+        while True:
+            yield from self._skip_whitespace()
+            char = yield from self._char()
+            if char == ']':
+                self._pos += 1
+                return
+            elif char == ',':
+                self._pos += 1
+            else:
+                result = yield from self._value()
+                self._results.append(result)  # not before, `_resume` replaces the list while waiting for text
+
+    def _parse(self) -> _Parser:
+        yield from self._skip_whitespace()
+        if (yield from self._char()) == '[':
+            self._pos += 1
+            yield from self._array()
+            return
+        yield from self._expect('{')
+        while True:
+            yield from self._skip_whitespace()
+            char = yield from self._char()
+            if char == '}':
+                self._pos += 1
+                return
+            elif char == ',':
+                self._pos += 1
+                continue
+            key = yield from self._value()
+            yield from self._skip_whitespace()
+            yield from self._expect(':')
+            yield from self._skip_whitespace()
+            if key == 'results' and (yield from self._char()) == '[':
+                self._pos += 1
+                yield from self._array()
+            else:
+                self.meta[key] = yield from self._value()
+
+
+def stream_page(resp: Response) -> tuple[PageDecoder, Iterator[dict[str, Any]]]:
+    """Decode a streamed response until its results start and return the decoder and an iterator over the results
+
+    The fields of the page before its results, e.g. `count` and `next`, are thus already available in `meta` of
+    the decoder. The response is closed when the iterator is exhausted.
+    """
+    decoder = PageDecoder()
+    chunks = resp.iter_text()
+    head: list[dict[str, Any]] = []
+    for chunk in chunks:
+        head.extend(decoder.feed(chunk))
+        if decoder.started:
+            break
+
+    def results() -> Iterator[dict[str, Any]]:
+        try:
+            yield from head
+            for chunk in chunks:
+                yield from decoder.feed(chunk)
+            yield from decoder.close()
+        finally:
+            resp.close()
+
+    return decoder, results()
+
+
+async def astream_page(resp: Response) -> tuple[PageDecoder, AsyncIterator[dict[str, Any]]]:
+    """Decode an asynchronously streamed response like `stream_page`"""
+    decoder = PageDecoder()
+    chunks = resp.aiter_text()
+    head: list[dict[str, Any]] = []
+    async for chunk in chunks:
+        head.extend(decoder.feed(chunk))
+        if decoder.started:
+            break
+
+    async def results() -> AsyncIterator[dict[str, Any]]:
+        try:
+            for result in head:
+                yield result
+            async for chunk in chunks:
+                for result in decoder.feed(chunk):
+                    yield result
+            for result in decoder.close():
+                yield result
+        finally:
+            await resp.aclose()
+
+    return decoder, results()
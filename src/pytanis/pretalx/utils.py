@@ -1,10 +1,15 @@
 """Utilities related to Pretalx"""
 
+import functools
 from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, TypeVar
 
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel, TypeAdapter
 
-from pytanis.pretalx.types import Review, Speaker, Submission
+from pytanis.pretalx.types import Answer, Review, Speaker, State, Submission, SubmissionSpeaker
 
 
 class Col:
@@ -33,6 +38,61 @@ class Col:
 
     nreviews = '#Reviews'
     review_score = 'Review Score'
+    review_text = 'Review text'
+    updated = 'Updated'
+
+    # integer surrogate keys and columns of the normalized tables of `event_as_tables`
+    submission_id = 'Submission id'
+    speaker_id = 'Speaker id'
+    speaker_position = 'Speaker position'
+    question_id = 'Question id'
+    question = 'Question'
+    answer_id = 'Answer id'
+    answer = 'Answer'
+    review_id = 'Review id'
+
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def parse_timestamp(ts: str) -> datetime:
+    """Parse an ISO timestamp of the Pretalx API and make it comparable, i.e. timezone-aware"""
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@functools.cache
+def list_adapter(type: type[M]) -> TypeAdapter[list[M]]:  # noqa: A002
+    """Cached adapter to validate a list of objects, e.g. a whole page of results, at once"""
+    return TypeAdapter(list[type])  # type: ignore[valid-type]
+
+
+def _add_answer_columns(
+    columns: dict[str, list[Any]],
+    answers_per_row: Iterable[list[Answer] | None],
+    question_prefix: str,
+    *,
+    person_only: bool = False,
+):
+    """Pivot the answers of each row into one column per question in a single pass
+
+    New columns are added in the order of the first appearance of their question, missing answers are NaN.
+    """
+    n_rows = len(next(iter(columns.values())))
+    by_question: dict[int, list[Any]] = {}  # question id -> column
+    for idx, answers in enumerate(answers_per_row):
+        if not answers:
+            continue
+        for answer in answers:
+            if person_only and answer.person is None:
+                continue
+            question = answer.question
+            if (column := by_question.get(question.id)) is None:
+                name = f'{question_prefix}{question.question.en}'
+                column = by_question[question.id] = columns.setdefault(name, [np.nan] * n_rows)
+            column[idx] = answer.answer
 
 
 def subs_as_df(
@@ -42,26 +102,25 @@ def subs_as_df(
 
     Make sure to have `params={"questions": "all"}` for the PretalxAPI if `with_questions` is True.
     """
-    rows = []
-    for sub in subs:
-        row = {
-            Col.submission: sub.code,
-            Col.title: sub.title,
-            Col.track: sub.track.en if sub.track else None,
-            Col.speaker_code: [speaker.code for speaker in sub.speakers],
-            Col.speaker_name: [speaker.name for speaker in sub.speakers],
-            Col.duration: sub.duration,
-            Col.submission_type: sub.submission_type.en,
-            Col.submission_type_id: sub.submission_type_id,
-            Col.state: sub.state.value,
-            Col.pending_state: None if sub.pending_state is None else sub.pending_state.value,
-            Col.created: sub.created,
-        }
-        if with_questions and sub.answers is not None:
-            for answer in sub.answers:
-                row[f'{question_prefix}{answer.question.question.en}'] = answer.answer
-        rows.append(row)
-    return pd.DataFrame(rows)
+    subs = list(subs)
+    if not subs:
+        return pd.DataFrame()
+    columns: dict[str, list[Any]] = {
+        Col.submission: [sub.code for sub in subs],
+        Col.title: [sub.title for sub in subs],
+        Col.track: [sub.track.en if sub.track else None for sub in subs],
+        Col.speaker_code: [[speaker.code for speaker in sub.speakers] for sub in subs],
+        Col.speaker_name: [[speaker.name for speaker in sub.speakers] for sub in subs],
+        Col.duration: [sub.duration for sub in subs],
+        Col.submission_type: [sub.submission_type.en for sub in subs],
+        Col.submission_type_id: [sub.submission_type_id for sub in subs],
+        Col.state: [sub.state.value for sub in subs],
+        Col.pending_state: [None if sub.pending_state is None else sub.pending_state.value for sub in subs],
+        Col.created: [sub.created for sub in subs],
+    }
+    if with_questions:
+        _add_answer_columns(columns, (sub.answers for sub in subs), question_prefix)
+    return _as_df(columns, [Col.speaker_code, Col.speaker_name])
 
 
 def speakers_as_df(
@@ -71,23 +130,30 @@ def speakers_as_df(
 
     Make sure to have `params={"questions": "all"}` for the PretalxAPI if `with_questions` is True.
     """
-    rows = []
-    for speaker in speakers:
-        row = {
-            Col.speaker_code: speaker.code,
-            Col.speaker_name: speaker.name,
-            Col.email: speaker.email,
-            Col.biography: speaker.biography,
-            Col.submission: speaker.submissions,
-        }
-        if with_questions and speaker.answers is not None:
-            for answer in speaker.answers:
-                # The API returns also questions that are 'per proposal/submission', we get these using the
-                # submission endpoint and don't want them here due to ambiguity if several submission were made.
-                if answer.person is not None:
-                    row[f'{question_prefix}{answer.question.question.en}'] = answer.answer
-        rows.append(row)
-    return pd.DataFrame(rows)
+    speakers = list(speakers)
+    if not speakers:
+        return pd.DataFrame()
+    columns: dict[str, list[Any]] = {
+        Col.speaker_code: [speaker.code for speaker in speakers],
+        Col.speaker_name: [speaker.name for speaker in speakers],
+        Col.email: [speaker.email for speaker in speakers],
+        Col.biography: [speaker.biography for speaker in speakers],
+        Col.submission: [speaker.submissions for speaker in speakers],
+    }
+    if with_questions:
+        # The API returns also questions that are 'per proposal/submission', we get these using the
+        # submission endpoint and don't want them here due to ambiguity if several submission were made.
+        _add_answer_columns(columns, (speaker.answers for speaker in speakers), question_prefix, person_only=True)
+    return _as_df(columns, [Col.submission])
+
+
+def _as_df(columns: dict[str, list[Any]], list_columns: Iterable[str]) -> pd.DataFrame:
+    """Create a dataframe from columns, inferring the dtype of each like `pd.DataFrame` does for a list of rows"""
+    data: dict[str, Any] = dict(columns)
+    for name in list_columns:
+        data[name] = np.empty(len(columns[name]), dtype=object)
+        data[name][:] = columns[name]  # keeps lists as elements instead of creating a 2-d array
+    return pd.DataFrame(data)
 
 
 def reviews_as_df(reviews: Iterable[Review]) -> pd.DataFrame:
@@ -99,3 +165,115 @@ def reviews_as_df(reviews: Iterable[Review]) -> pd.DataFrame:
     df.rename(columns={'User': Col.pretalx_user, 'Score': Col.review_score}, inplace=True)
 
     return df
+
+
+class EventTables(NamedTuple):
+    """Normalized tables of an event, linked by the integer keys `Col.submission_id` and `Col.speaker_id`"""
+
+    submissions: pd.DataFrame
+    speakers: pd.DataFrame
+    submission_speakers: pd.DataFrame  # link table of submissions and their speakers
+    answers: pd.DataFrame  # answers of submissions and speakers in long format
+    reviews: pd.DataFrame
+
+
+_STATES = [state.value for state in State]
+
+
+def _ints(values: Iterable[int]) -> np.ndarray:
+    return np.fromiter(values, dtype=np.int64)
+
+
+def _nullable_ints(values: Iterable[int | None]) -> pd.api.extensions.ExtensionArray:
+    """Nullable integers, e.g. keys of references that might not be resolved"""
+    return pd.array(list(values), dtype='Int64')
+
+
+def _timestamps(values: Iterable[Any]) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(pd.to_datetime(list(values), utc=True))
+
+
+def event_as_tables(
+    subs: Iterable[Submission], speakers: Iterable[Speaker] = (), reviews: Iterable[Review] = ()
+) -> EventTables:
+    """Convert submissions, speakers and reviews into normalized tables
+
+    In contrast to `subs_as_df` with lists of speakers per cell, submissions and speakers are linked by the table
+    `submission_speakers`, so joins are cheap merges on integer keys without `explode` and `implode`, e.g.:
+
+    ```
+    tables = event_as_tables(subs, speakers, reviews)
+    df = tables.submission_speakers.merge(tables.speakers, on=Col.speaker_id)
+    df = df.merge(tables.submissions, on=Col.submission_id)
+    ```
+
+    Repeated strings like tracks, states, questions and reviewers are categorical. Speakers of submissions that are
+    missing in `speakers` are added with the details given in the submission. Make sure to have
+    `params={"questions": "all"}` for the PretalxAPI to get the answers.
+    """
+    subs = list(subs)
+    reviews = list(reviews)
+    sub_ids = {sub.code: idx for idx, sub in enumerate(subs)}
+    all_speakers: dict[str, SubmissionSpeaker] = {speaker.code: speaker for speaker in speakers}
+    for sub in subs:
+        for speaker in sub.speakers:
+            all_speakers.setdefault(speaker.code, speaker)
+    speaker_ids = {code: idx for idx, code in enumerate(all_speakers)}
+    answers: dict[int, Answer] = {}  # the same answer is returned for a submission and its speakers
+    for sub in subs:
+        for answer in sub.answers or ():
+            answers.setdefault(answer.id, answer)
+    for speaker in all_speakers.values():
+        if isinstance(speaker, Speaker):
+            for answer in speaker.answers or ():
+                answers.setdefault(answer.id, answer)
+    links = [
+        (sub_ids[sub.code], speaker_ids[speaker.code], pos) for sub in subs for pos, speaker in enumerate(sub.speakers)
+    ]
+
+    return EventTables(
+        submissions=pd.DataFrame({
+            Col.submission_id: np.arange(len(subs)),
+            Col.submission: [sub.code for sub in subs],
+            Col.title: [sub.title for sub in subs],
+            Col.track: pd.Categorical([sub.track.en if sub.track else None for sub in subs]),
+            Col.duration: _nullable_ints(sub.duration for sub in subs),
+            Col.submission_type: pd.Categorical([sub.submission_type.en for sub in subs]),
+            Col.submission_type_id: _ints(sub.submission_type_id for sub in subs),
+            Col.state: pd.Categorical([sub.state.value for sub in subs], categories=_STATES),
+            Col.pending_state: pd.Categorical(
+                [None if sub.pending_state is None else sub.pending_state.value for sub in subs],
+                categories=_STATES,
+            ),
+            Col.created: _timestamps(sub.created for sub in subs),
+        }),
+        speakers=pd.DataFrame({
+            Col.speaker_id: np.arange(len(all_speakers)),
+            Col.speaker_code: list(all_speakers),
+            Col.speaker_name: [speaker.name for speaker in all_speakers.values()],
+            Col.email: [speaker.email for speaker in all_speakers.values()],
+            Col.biography: [speaker.biography for speaker in all_speakers.values()],
+        }),
+        submission_speakers=pd.DataFrame({
+            Col.submission_id: _ints(link[0] for link in links),
+            Col.speaker_id: _ints(link[1] for link in links),
+            Col.speaker_position: _ints(link[2] for link in links),
+        }),
+        answers=pd.DataFrame({
+            Col.answer_id: _ints(answers),
+            Col.question_id: _ints(answer.question.id for answer in answers.values()),
+            Col.question: pd.Categorical([answer.question.question.en for answer in answers.values()]),
+            Col.submission_id: _nullable_ints(sub_ids.get(answer.submission or '') for answer in answers.values()),
+            Col.speaker_id: _nullable_ints(speaker_ids.get(answer.person or '') for answer in answers.values()),
+            Col.answer: [answer.answer for answer in answers.values()],
+        }),
+        reviews=pd.DataFrame({
+            Col.review_id: _ints(review.id for review in reviews),
+            Col.submission_id: _nullable_ints(sub_ids.get(review.submission) for review in reviews),
+            Col.pretalx_user: pd.Categorical([review.user for review in reviews]),
+            Col.review_score: np.array([np.nan if r.score is None else r.score for r in reviews], dtype=float),
+            Col.review_text: [review.text for review in reviews],
+            Col.created: _timestamps(review.created for review in reviews),
+            Col.updated: _timestamps(review.updated for review in reviews),
+        }),
+    )
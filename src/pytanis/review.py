@@ -16,11 +16,23 @@ columns.
 """
 
 import json
+import time
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from typing import Any, NamedTuple
 
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel
+from structlog import get_logger
 
+from pytanis.pretalx.client import JSONObj, PretalxClient
+from pytanis.pretalx.mirror import fetch_since
 from pytanis.pretalx.utils import Col as PretalxCol
+from pytanis.pretalx.utils import parse_timestamp
+from pytanis.utils import implode
+
+_logger = get_logger()
 
 
 class Col(PretalxCol):
@@ -44,25 +56,704 @@ class Col(PretalxCol):
     nvotes = '#Votes'
     vote_score = 'Vote Score'
 
+    reviewer_mean_score = 'Reviewer Mean Score'
+    reviewer_std_score = 'Reviewer Std Score'
+    debiased_review_score = 'Debiased Review Score'
+    z_review_score = 'Z Review Score'
+    rank_review_score = 'Rank Review Score'
+    avg_review_score = 'Avg Review Score'
+    avg_debiased_review_score = 'Avg Debiased Review Score'
+    avg_z_review_score = 'Avg Z Review Score'
+    avg_rank_review_score = 'Avg Rank Review Score'
 
-def read_assignment_as_df(file_path: Path) -> pd.DataFrame:
-    """Reads an assignment and returns a dataframe."""
+
+REVIEW_ID = 'Id'
+"""Column of the review id in `reviews_as_df`"""
+NORMALIZED_COLS = [Col.debiased_review_score, Col.z_review_score, Col.rank_review_score]
+"""Columns of the scores normalized per reviewer by `normalize_scores`"""
+_NO_PREFERENCE_COST = 1e9  # added to the number of assignments of a reviewer not preferring the track
+
+
+Assignments = Mapping[str, Iterable[str]]
+"""Assignment of submission codes to reviewers identified by their email"""
+
+
+class AssignmentDiff(NamedTuple):
+    """Submission codes added to and removed from the assignments of reviewers identified by their email"""
+
+    added: dict[str, list[str]]
+    removed: dict[str, list[str]]
+
+    @property
+    def nchanges(self) -> int:
+        """Total number of added and removed assignments"""
+        return sum(map(len, self.added.values())) + sum(map(len, self.removed.values()))
+
+
+def diff_assignments(old: Assignments, new: Assignments) -> AssignmentDiff:
+    """Returns the submission codes added to and removed from each reviewer from the `old` to the `new` assignment"""
+    added: dict[str, list[str]] = {}
+    removed: dict[str, list[str]] = {}
+    for email in [*new, *(email for email in old if email not in new)]:
+        old_codes, new_codes = dict.fromkeys(old.get(email, ())), dict.fromkeys(new.get(email, ()))
+        if codes := [code for code in new_codes if code not in old_codes]:
+            added[email] = codes
+        if codes := [code for code in old_codes if code not in new_codes]:
+            removed[email] = codes
+    return AssignmentDiff(added=added, removed=removed)
+
+
+def read_assignments(file_path: Path | str) -> dict[str, list[str]]:
+    """Reads an assignment file, e.g. written by `save_assignments`, as mapping of emails to submission codes"""
     with open(file_path, encoding='utf8') as fh:
-        curr_assign = json.load(fh)
-    df = pd.DataFrame({k: [v] for k, v in curr_assign.items()})
-    df = df.T.rename_axis(index=Col.email).rename(columns={0: Col.curr_assignments}).reset_index()
-    return df
+        return json.load(fh)
+
+
+def save_assignments(
+    assignments: Assignments | Iterable[tuple[str, Iterable[str]]],
+    file_path: Path | str,
+    *,
+    previous: Assignments | Path | str | None = None,
+) -> AssignmentDiff:
+    """Save an assignment as proposal assignment JSON file and return its difference to a previous assignment
+
+    The assignments are written one after another with one line per reviewer, so they are human-editable
+    if reviewers need to be dropped later, e.g.:
+
+    ```
+    {
+    "ada@host.com": ["SUB1", "SUB2"],
+    "bob@host.com": ["SUB3"]
+    }
+    ```
+
+    Args:
+        assignments: mapping of emails to submission codes or an iterable of pairs of them, e.g. a generator
+        file_path: path of the file
+        previous: previous assignment or the path of its file, e.g. `file_path` before it is overwritten
+
+    Returns:
+        the difference to `previous`, i.e. all assignments are added if it is `None`
+    """
+    if isinstance(previous, Path | str):
+        previous = read_assignments(previous)
+    pairs = assignments.items() if isinstance(assignments, Mapping) else assignments
+    written: dict[str, list[str]] = {}
+    with open(file_path, 'w', encoding='utf8') as fh:
+        fh.write('{')
+        sep = '\n'
+        for email, codes in pairs:
+            written[email] = list(codes)
+            fh.write(f'{sep}{json.dumps(email)}: {json.dumps(written[email])}')
+            sep = ',\n'
+        fh.write('\n}')
+    if previous is None:
+        return AssignmentDiff(added={email: codes for email, codes in written.items() if codes}, removed={})
+    return diff_assignments(previous, written)
+
+
+def read_assignment_as_df(file_path: Path | str) -> pd.DataFrame:
+    """Reads an assignment and returns a dataframe."""
+    assignments = read_assignments(file_path)
+    return pd.DataFrame({
+        Col.email: list(assignments),
+        Col.curr_assignments: pd.Series(list(assignments.values()), dtype=object),
+    })
 
 
 def save_assignments_as_json(df: pd.DataFrame, file_path: Path | str):
     """Save the dataframe as proposal assignment JSON file.
 
-    We expect `df` to have the columns `Col.email` and `Col.curr_assignments`.
+    We expect `df` to have the columns `Col.email` and `Col.curr_assignments`, see `save_assignments`.
     """
-    file_path = Path(file_path)
-    df = df.loc[:, [Col.email, Col.curr_assignments]]
-    json_dct = json.loads(df.set_index(Col.email).to_json())[Col.curr_assignments]
-    # prettify the json string for human-edit-ability if reviewers need to be dropped later
-    json_str = json.dumps(json_dct).replace('{', '{\n').replace('], ', '],\n').replace(']}', ']\n}')
-    with open(file_path, 'w', encoding='utf8') as fh:
-        fh.write(json_str)
+    save_assignments(zip(df[Col.email], df[Col.curr_assignments], strict=True), file_path)
+
+
+def reviewer_stats(revs_df: pd.DataFrame) -> pd.DataFrame:
+    """Returns the number of scores, mean and standard deviation of the scores of each reviewer
+
+    We expect `revs_df` to be like the output of `reviews_as_df`. Missing scores are ignored.
+    """
+    grouped = revs_df[Col.review_score].astype(float).groupby(revs_df[Col.pretalx_user], sort=False)
+    return pd.DataFrame({
+        Col.nreviews: grouped.count(),
+        Col.reviewer_mean_score: grouped.mean(),
+        Col.reviewer_std_score: grouped.std(ddof=0),
+    }).reset_index()
+
+
+def normalize_scores(revs_df: pd.DataFrame) -> pd.DataFrame:
+    """Add the scores of the reviews normalized per reviewer to remove the bias of lenient or strict reviewers
+
+    The normalized scores are:
+
+     * `Col.debiased_review_score`: the score minus the mean score of the reviewer,
+     * `Col.z_review_score`: the debiased score divided by the standard deviation of the scores of the reviewer,
+       or 0 if the reviewer always gave the same score,
+     * `Col.rank_review_score`: the percentile rank of the score among the scores of the reviewer in (0, 1]
+       with the average rank for ties, which is robust against outliers and differently used score ranges.
+
+    Missing scores are ignored for the statistics of the reviewers and have missing normalized scores.
+
+    Args:
+        revs_df: reviews like the output of `reviews_as_df`
+
+    Returns:
+        reviews with the additional columns `NORMALIZED_COLS`
+    """
+    scores = revs_df[Col.review_score].astype(float)
+    grouped = scores.groupby(revs_df[Col.pretalx_user], sort=False)
+    std = grouped.transform('std', ddof=0)
+    debiased = scores - grouped.transform('mean')
+    z_scores = (debiased / std.where(std > 0)).mask(std.eq(0) & scores.notna(), 0.0)
+    return revs_df.assign(**{
+        Col.debiased_review_score: debiased,
+        Col.z_review_score: z_scores,
+        Col.rank_review_score: grouped.rank(pct=True),
+    })
+
+
+def aggregate_scores(revs_df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate the scores of the reviews per submission
+
+    For each submission, the lists of scores and debiased scores, the mean of all scores and normalized scores
+    and the number of scores are returned. Missing scores are ignored except of the lists.
+
+    Args:
+        revs_df: reviews like the output of `reviews_as_df`, normalized if they have the columns `NORMALIZED_COLS`
+
+    Returns:
+        dataframe with one row per reviewed submission in order of appearance
+    """
+    if not set(NORMALIZED_COLS).issubset(revs_df.columns):
+        revs_df = normalize_scores(revs_df)
+    score_cols = [Col.review_score, *NORMALIZED_COLS]
+    avg_cols = [
+        Col.avg_review_score,
+        Col.avg_debiased_review_score,
+        Col.avg_z_review_score,
+        Col.avg_rank_review_score,
+    ]
+    revs_df = revs_df[[Col.submission, *score_cols]].astype(dict.fromkeys(score_cols, float))
+    grouped = revs_df.groupby(Col.submission, sort=False)
+    df = grouped[score_cols].mean().set_axis(avg_cols, axis=1)
+    df[Col.nreviews] = grouped[Col.review_score].count()
+    lists = implode(revs_df, [Col.review_score, Col.debiased_review_score], key=Col.submission)
+    lists = lists[[Col.submission, Col.review_score, Col.debiased_review_score]]
+    return lists.merge(df, left_on=Col.submission, right_index=True)
+
+
+class ReviewScores:
+    """Normalized scores of reviews and their aggregation per submission that can be updated incrementally
+
+    When new or updated reviews arrived, e.g. after syncing an `EventMirror`, only the reviews of their reviewers are
+    normalized again and only the submissions reviewed by these reviewers are aggregated again, e.g.:
+
+    ```
+    scores = ReviewScores(reviews_as_df(reviews))
+    scores.update(reviews_as_df(new_reviews))
+    subs_df = subs_df.merge(scores.per_submission, on=Col.submission, how='left')
+    ```
+
+    Args:
+        revs_df: reviews like the output of `reviews_as_df`
+    """
+
+    def __init__(self, revs_df: pd.DataFrame | None = None):
+        self._reviews = pd.DataFrame()
+        self._per_sub = pd.DataFrame()
+        if revs_df is not None:
+            self.update(revs_df)
+
+    def update(self, revs_df: pd.DataFrame):
+        """Add new reviews or replace reviews with the same id, i.e. column `REVIEW_ID`"""
+        if revs_df.empty:
+            return
+        new = revs_df.set_index(REVIEW_ID)
+        if self._reviews.empty:
+            self._reviews = normalize_scores(new.sort_index())
+            self._per_sub = aggregate_scores(self._reviews).set_index(Col.submission).sort_index()
+            return
+
+        old = self._reviews.loc[self._reviews.index.intersection(new.index)]
+        reviews = pd.concat([self._reviews.drop(index=old.index), new]).sort_index()
+        # the normalized scores change only for the reviewers of the new reviews
+        users = pd.concat([old[Col.pretalx_user], new[Col.pretalx_user]]).unique()
+        mask = reviews[Col.pretalx_user].isin(users).to_numpy()
+        normalized = normalize_scores(reviews.loc[mask, [Col.pretalx_user, Col.review_score]])
+        for col in NORMALIZED_COLS:
+            reviews.loc[mask, col] = normalized[col].to_numpy()
+        self._reviews = reviews
+
+        # and thus the aggregation only for the submissions reviewed by them
+        subs = pd.concat([old[Col.submission], reviews.loc[mask, Col.submission]]).unique()
+        per_sub = aggregate_scores(reviews[reviews[Col.submission].isin(subs).to_numpy()]).set_index(Col.submission)
+        self._per_sub = pd.concat([self._per_sub.drop(index=subs, errors='ignore'), per_sub]).sort_index()
+
+    @property
+    def reviews(self) -> pd.DataFrame:
+        """All reviews with their normalized scores, see `normalize_scores`"""
+        return self._reviews.reset_index()
+
+    @property
+    def per_submission(self) -> pd.DataFrame:
+        """Aggregated scores per reviewed submission, see `aggregate_scores`"""
+        return self._per_sub.rename_axis(Col.submission).reset_index()
+
+    @property
+    def per_reviewer(self) -> pd.DataFrame:
+        """Statistics of the scores per reviewer, see `reviewer_stats`"""
+        return reviewer_stats(self._reviews)
+
+
+def _code_matrix(lists: pd.Series, codes: pd.Index) -> np.ndarray:
+    """Boolean matrix with a row for each list and a column for each code that is true if the list contains it"""
+    exploded = lists.explode()
+    rows = np.repeat(np.arange(len(lists)), lists.str.len().fillna(1).clip(lower=1).astype(int).to_numpy())
+    cols = codes.get_indexer(exploded.to_numpy())
+    matrix = np.zeros((len(lists), len(codes)), dtype=bool)
+    matrix[rows[cols >= 0], cols[cols >= 0]] = True
+    return matrix
+
+
+def preference_matrix(subs_df: pd.DataFrame, reviewers_df: pd.DataFrame) -> np.ndarray:
+    """Returns a boolean matrix of reviewers and submissions, true if a reviewer prefers the track of a submission
+
+    We expect `subs_df` to have the columns `Col.submission` and `Col.track` and `reviewers_df` to have the column
+    `Col.track_prefs` with lists of tracks. The matrix is built from the much smaller matrix of reviewers and tracks.
+    """
+    tracks = pd.Index(subs_df[Col.track].dropna().unique())
+    prefers_track = _code_matrix(reviewers_df[Col.track_prefs], tracks)
+    # submissions without a track, i.e. index -1, get the last column, which is preferred by no reviewer
+    prefers_track = np.column_stack([prefers_track, np.zeros(len(reviewers_df), dtype=bool)])
+    return prefers_track[:, tracks.get_indexer(subs_df[Col.track].to_numpy())]
+
+
+def _assign_greedily(
+    cost: np.ndarray, load: np.ndarray, need: np.ndarray, order: np.ndarray, codes: pd.Index
+) -> np.ndarray:
+    """Assign each submission in `order` round by round to the reviewer with the least cost plus load
+
+    The matrices are dense, i.e. they take about 10 bytes per pair of submission and reviewer, e.g. 10 MB for 2000
+    submissions and 500 reviewers, which is fine for conferences but not meant for much larger problems. Each
+    assignment is a single `argmin` over the reviewers, but the assignments are sequential as each one changes the
+    load that decides the next one.
+
+    Args:
+        cost: cost of assigning a submission to a reviewer, `np.inf` if not possible, updated in place
+        load: number of assignments of each reviewer, updated in place
+        need: number of reviewers each submission needs, updated in place
+        order: order of the submissions within each round
+        codes: codes of the submissions for logging
+
+    Returns:
+        boolean matrix of submissions and reviewers that is true for new assignments
+    """
+    new = np.zeros(cost.shape, dtype=bool)
+    unpreferred: dict[str, None] = {}
+    pending = order[need[order] > 0]
+    while len(pending):
+        for sub in pending:
+            sub_cost = cost[sub] + load
+            reviewer = sub_cost.argmin()
+            if sub_cost[reviewer] == np.inf:
+                _logger.warning('not enough reviewers for submission', submission=codes[sub])
+                need[sub] = 0
+                continue
+            if sub_cost[reviewer] >= _NO_PREFERENCE_COST:
+                unpreferred[codes[sub]] = None
+            cost[sub, reviewer] = np.inf
+            new[sub, reviewer] = True
+            load[reviewer] += 1
+            need[sub] -= 1
+        pending = pending[need[pending] > 0]
+    if unpreferred:
+        _logger.warning('no suitable reviewer found', submissions=list(unpreferred))
+    return new
+
+
+def assign_reviews(
+    subs_df: pd.DataFrame, reviewers_df: pd.DataFrame, *, buffer: int = 0, seed: int | None = None
+) -> pd.DataFrame:
+    """Assign submissions to reviewers balancing the number of assignments of the reviewers
+
+    Each submission with remaining reviews gets as many additional reviewers as it needs reviews plus `buffer`,
+    minus the reviewers it is already assigned to. Round by round, each of these submissions, in order of decreasing
+    remaining reviews, is assigned to the reviewer with the least assignments among the ones preferring its track and
+    not being assigned to it yet. Only if no such reviewer exists, it is assigned to one without this preference.
+    Reviewers wanting all proposals, i.e. with a non-empty `Col.all_proposals`, are assigned all submissions and
+    not considered otherwise.
+
+    We expect `subs_df` to have the columns `Col.submission`, `Col.track` and `Col.rem_nreviews`, and `reviewers_df`
+    to have the columns `Col.track_prefs` and `Col.curr_assignments` with lists of tracks and submission codes,
+    which are kept, and optionally `Col.all_proposals`.
+
+    Preferences and assignments are held in dense matrices of submissions and reviewers, which limits this to
+    events of conference size, i.e. a few thousand submissions and reviewers.
+
+    Args:
+        subs_df: submissions to assign
+        reviewers_df: reviewers with their preferences and current assignments
+        buffer: number of additional reviewers per submission with remaining reviews
+        seed: seed of the random order of reviewers with the same number of assignments
+
+    Returns:
+        `reviewers_df` with the updated `Col.curr_assignments` and their number `Col.nassignments`
+    """
+    codes = pd.Index(subs_df[Col.submission])
+    reviewers_df = reviewers_df.reset_index(drop=True)
+    if Col.all_proposals in reviewers_df:
+        wants_all = reviewers_df[Col.all_proposals].fillna('').astype(bool).to_numpy()
+    else:
+        wants_all = np.zeros(len(reviewers_df), dtype=bool)
+    # the random order of the reviewers decides between the ones with the same number of assignments
+    pool = np.random.default_rng(seed).permutation(np.flatnonzero(~wants_all))
+
+    curr_assignments = reviewers_df[Col.curr_assignments]
+    assigned = _code_matrix(curr_assignments, codes)[pool].T  # submissions x reviewers
+    cost = np.where(preference_matrix(subs_df, reviewers_df)[pool].T, 0.0, _NO_PREFERENCE_COST)
+    cost[assigned] = np.inf
+    load = curr_assignments.str.len().fillna(0).to_numpy(dtype=float)[pool]
+    rem = subs_df[Col.rem_nreviews].to_numpy()
+    need = np.where(rem > 0, rem + buffer - assigned.sum(axis=1), 0).clip(min=0)
+
+    new = _assign_greedily(cost, load, need, np.argsort(-rem, kind='stable'), codes)
+    subs_per_reviewer = np.zeros((len(reviewers_df), len(codes)), dtype=bool)
+    subs_per_reviewer[pool] = new.T
+    subs_per_reviewer[wants_all] = True
+    assignments = []
+    for curr, row in zip(curr_assignments.tolist(), subs_per_reviewer, strict=True):
+        curr = curr if isinstance(curr, list) else []
+        known = set(curr)
+        assignments.append(curr + [code for code in codes[row] if code not in known])
+    reviewers_df[Col.curr_assignments] = pd.Series(assignments, dtype=object)
+    reviewers_df[Col.nassignments] = reviewers_df[Col.curr_assignments].str.len()
+    return reviewers_df
+
+
+class Reassignment:
+    """Assignment of submissions to reviewers that is updated with the progress of the reviews
+
+    Instead of assigning everything again, each update only looks at the submissions with new reviews and the ones
+    that lacked reviewers before. The open assignments of a submission, i.e. the ones not reviewed yet, are removed
+    as soon as it has `Col.target_nreviews` reviews with a score. A submission still lacking reviews is assigned to
+    as many new reviewers as `assign_reviews` would, i.e. the remaining reviews plus `buffer` minus the reviewers it
+    is already assigned to, picking the reviewers with the least open assignments preferring its track, e.g.:
+
+    ```
+    reassignment = Reassignment(read_assignment_as_df(path), subs_df, reviewers_df, buffer=2)
+    diff = reassignment.update(reviews_as_df(reviews))
+    save_assignments_as_json(reassignment.assignments, new_path)
+    ```
+
+    We expect `subs_df` to have the columns `Col.submission`, `Col.track` and `Col.target_nreviews`, and
+    `reviewers_df` to have the columns `Col.email`, `Col.pretalx_user` and `Col.track_prefs` and optionally
+    `Col.all_proposals` for reviewers whose assignments are kept as they are.
+
+    Args:
+        assign_df: previous assignment with the columns `Col.email` and `Col.curr_assignments`
+        subs_df: submissions to assign
+        reviewers_df: reviewers with their preferences
+        buffer: number of additional reviewers per submission with remaining reviews
+        seed: seed of the random order of reviewers with the same number of open assignments
+    """
+
+    def __init__(
+        self,
+        assign_df: pd.DataFrame,
+        subs_df: pd.DataFrame,
+        reviewers_df: pd.DataFrame,
+        *,
+        buffer: int = 0,
+        seed: int | None = None,
+    ):
+        self.buffer = buffer
+        self._codes = pd.Index(subs_df[Col.submission])
+        self._targets = subs_df[Col.target_nreviews].to_numpy()
+        tracks = pd.Index(subs_df[Col.track].dropna().unique())
+        self._tracks = tracks.get_indexer(subs_df[Col.track].to_numpy())  # -1 for no track
+
+        if Col.all_proposals in reviewers_df:
+            wants_all = reviewers_df[Col.all_proposals].fillna('').astype(bool).to_numpy()
+        else:
+            wants_all = np.zeros(len(reviewers_df), dtype=bool)
+        # the random order of the reviewers decides between the ones with the same number of open assignments
+        pool = reviewers_df.iloc[np.random.default_rng(seed).permutation(np.flatnonzero(~wants_all))]
+        self._emails: list[str] = pool[Col.email].tolist()
+        self._reviewer_idx = {email: idx for idx, email in enumerate(self._emails)}
+        self._users = dict(zip(reviewers_df[Col.pretalx_user], reviewers_df[Col.email], strict=True))
+        prefers_track = _code_matrix(pool[Col.track_prefs], tracks)
+        self._prefers_track = np.column_stack([prefers_track, np.zeros(len(pool), dtype=bool)])
+
+        self._assignments: dict[str, dict[str, None]] = {email: {} for email in reviewers_df[Col.email]}
+        for email, codes in zip(assign_df[Col.email], assign_df[Col.curr_assignments], strict=True):
+            self._assignments.setdefault(email, {}).update(dict.fromkeys(codes))
+        self._assigned: dict[str, set[str]] = {}  # emails of reviewers assigned to a submission
+        for email, codes in self._assignments.items():
+            for code in codes:
+                self._assigned.setdefault(code, set()).add(email)
+        self._reviewed: dict[str, set[str]] = {}  # emails or users of reviewers with a score for a submission
+        self._load = np.array([len(self._assignments[email]) for email in self._emails], dtype=float)
+        self._lacking: set[str] = set(self._codes)  # submissions whose assignments need to be checked
+
+    @property
+    def assignments(self) -> pd.DataFrame:
+        """Current assignment with the columns `Col.email` and `Col.curr_assignments`"""
+        return pd.DataFrame({
+            Col.email: list(self._assignments),
+            Col.curr_assignments: pd.Series([list(codes) for codes in self._assignments.values()], dtype=object),
+        })
+
+    def update(self, revs_df: pd.DataFrame) -> AssignmentDiff:
+        """Update the assignment with new or updated reviews and return the changes
+
+        Reviews are identified by their reviewer and submission, so passing a review again has no effect.
+
+        Args:
+            revs_df: reviews like the output of `reviews_as_df`
+
+        Returns:
+            the assignments added to and removed from reviewers
+        """
+        added: dict[str, dict[str, None]] = {}
+        removed: dict[str, dict[str, None]] = {}
+
+        def assign(email: str, code: str):
+            if code in removed.get(email, ()):
+                del removed[email][code]
+            else:
+                added.setdefault(email, {})[code] = None
+            self._assignments.setdefault(email, {})[code] = None
+            self._assigned.setdefault(code, set()).add(email)
+            if (idx := self._reviewer_idx.get(email)) is not None:
+                self._load[idx] += 1
+
+        def unassign(email: str, code: str):
+            if code in added.get(email, ()):
+                del added[email][code]
+            else:
+                removed.setdefault(email, {})[code] = None
+            del self._assignments[email][code]
+            self._assigned[code].discard(email)
+            self._load[self._reviewer_idx[email]] -= 1
+
+        touched = self._lacking
+        for user, code, score in zip(
+            revs_df[Col.pretalx_user], revs_df[Col.submission], revs_df[Col.review_score], strict=True
+        ):
+            reviewer = self._users.get(user, user)
+            reviewed = self._reviewed.setdefault(code, set())
+            if pd.isna(score) == (reviewer not in reviewed):
+                continue  # nothing changed
+            touched.add(code)
+            idx = self._reviewer_idx.get(reviewer)
+            if pd.isna(score):  # score was removed, so the assignment is open again
+                reviewed.discard(reviewer)
+                if idx is not None and code in self._assignments[reviewer]:
+                    self._load[idx] += 1
+                continue
+            reviewed.add(reviewer)
+            if reviewer in self._assignments and code not in self._assignments[reviewer]:
+                assign(reviewer, code)  # keep the reviews done without an assignment
+            if idx is not None:
+                self._load[idx] -= 1
+
+        self._lacking = set()
+        subs = self._codes.get_indexer(list(touched))
+        subs = subs[subs >= 0]
+        rem = np.array([max(self._targets[sub] - len(self._reviewed.get(self._codes[sub], ())), 0) for sub in subs])
+        for sub in subs[rem == 0]:  # free the open assignments of completely reviewed submissions
+            code = self._codes[sub]
+            for email in sorted(self._assigned.get(code, set()) - self._reviewed.get(code, set())):
+                if email in self._reviewer_idx:
+                    unassign(email, code)
+
+        subs, rem = subs[rem > 0], rem[rem > 0]
+        nassigned = np.array([len(self._assigned.get(self._codes[sub], ())) for sub in subs], dtype=int)
+        need = (rem + self.buffer - nassigned).clip(min=0)
+        cost = np.where(self._prefers_track[:, self._tracks[subs]].T, 0.0, _NO_PREFERENCE_COST)
+        for row, sub in enumerate(subs):
+            for email in self._assigned.get(self._codes[sub], ()):
+                if (idx := self._reviewer_idx.get(email)) is not None:
+                    cost[row, idx] = np.inf
+        # the load is updated by `assign` below instead of `_assign_greedily`
+        new = _assign_greedily(cost, self._load.copy(), need.copy(), np.argsort(-rem, kind='stable'), self._codes[subs])
+        for row, idx in zip(*np.nonzero(new), strict=True):
+            assign(self._emails[idx], self._codes[subs[row]])
+        self._lacking.update(self._codes[subs[new.sum(axis=1) < need]])
+
+        return AssignmentDiff(
+            added={email: list(codes) for email, codes in added.items() if codes},
+            removed={email: list(codes) for email, codes in removed.items() if codes},
+        )
+
+
+class SeenReview(NamedTuple):
+    """State of a review when it was last seen by a `ReviewMonitor`"""
+
+    updated: str
+    submission: str
+    user: str
+    scored: bool
+
+
+def _seen_review(review: JSONObj) -> tuple[int, SeenReview]:
+    """Id and state of a review given as raw JSON"""
+    scored = review['score'] is not None
+    return review['id'], SeenReview(review['updated'], review['submission'], review['user'], scored)
+
+
+class ReviewProgress(BaseModel):
+    """Checkpoint of the reviews seen by a `ReviewMonitor` and the numbers of reviews with a score derived from them"""
+
+    event_slug: str
+    since: str | None = None  # latest `updated` of the seen reviews
+    reviews: dict[int, SeenReview] = {}
+    done_per_submission: dict[str, int] = {}
+    done_per_reviewer: dict[str, int] = {}
+
+
+class ReviewMonitor:
+    """Monitor of the review progress of an event that only processes new and updated reviews on each poll
+
+    Reviews are requested with `fetch_since` of the Pretalx mirror, i.e. page by page ordered by `updated` descending
+    and only until reviews older than the latest one seen before show up, even if the client is blocking. Reviews with
+    the same timestamp are requested again, as others might have been saved with it after the last poll, and skipped
+    if they are unchanged. The numbers of reviews with a
+    score per submission and reviewer are updated with the changed reviews and persisted with the checkpoint of the
+    seen reviews after each poll, e.g.:
+
+    ```
+    targets = dict(zip(subs_df[Col.submission], subs_df[Col.target_nreviews]))
+    monitor = ReviewMonitor(PretalxClient(), event_slug, 'review-progress.json', targets=targets)
+    monitor.run(interval=3600, callback=lambda monitor, changed: print(monitor.per_submission))
+    ```
+
+    Deleted reviews are not detected. Delete the checkpoint file to start from scratch.
+
+    Args:
+        client: client used for polling
+        event_slug: slug of the event
+        path: path of the checkpoint, which is loaded if it exists, or `None` to keep it only in memory
+        targets: number of reviews a submission needs, either per submission code or for all submissions
+        assignments: submission codes assigned to reviewers identified by their Pretalx user name
+    """
+
+    def __init__(
+        self,
+        client: PretalxClient,
+        event_slug: str,
+        path: Path | str | None = None,
+        *,
+        targets: Mapping[str, int] | int = 3,
+        assignments: Assignments | None = None,
+    ):
+        self.client = client
+        self.path = None if path is None else Path(path)
+        self.targets = targets
+        self.assignments = {user: set(codes) for user, codes in (assignments or {}).items()}
+        if self.path is not None and self.path.exists():
+            self.progress = ReviewProgress.model_validate_json(self.path.read_text(encoding='utf8'))
+            if self.progress.event_slug != event_slug:
+                msg = f'Checkpoint {self.path} is of event {self.progress.event_slug}, not {event_slug}'
+                raise ValueError(msg)
+        else:
+            self.progress = ReviewProgress(event_slug=event_slug)
+        self._open = {user: len(codes) for user, codes in self.assignments.items()}  # assignments without score
+        for review in self.progress.reviews.values():
+            if review.scored and review.submission in self.assignments.get(review.user, ()):
+                self._open[review.user] -= 1
+
+    @property
+    def event_slug(self) -> str:
+        return self.progress.event_slug
+
+    def _count(self, review: SeenReview, inc: int):
+        if not review.scored:
+            return
+        done_per_sub, done_per_reviewer = self.progress.done_per_submission, self.progress.done_per_reviewer
+        done_per_sub[review.submission] = done_per_sub.get(review.submission, 0) + inc
+        done_per_reviewer[review.user] = done_per_reviewer.get(review.user, 0) + inc
+        if review.submission in self.assignments.get(review.user, ()):
+            self._open[review.user] -= inc
+
+    def poll(self) -> list[int]:
+        """Process the new and updated reviews, save the checkpoint and return the ids of these reviews"""
+        results = fetch_since(self.client, self.event_slug, 'reviews', 'updated', self.progress.since)
+        changed = []
+        for result in results:
+            review_id, review = _seen_review(result)
+            old = self.progress.reviews.get(review_id)
+            if old is not None and parse_timestamp(old.updated) == parse_timestamp(review.updated):
+                continue
+            if old is not None:
+                self._count(old, -1)
+            self._count(review, 1)
+            self.progress.reviews[review_id] = review
+            changed.append(review_id)
+        self.progress.since = results.latest
+        self.save()
+        _logger.info('polled reviews', event_slug=self.event_slug, changed=len(changed))
+        return changed
+
+    def run(
+        self,
+        interval: float = 3600,
+        *,
+        polls: int | None = None,
+        callback: Callable[['ReviewMonitor', list[int]], Any] | None = None,
+    ):
+        """Poll periodically
+
+        Args:
+            interval: seconds between the start of two polls
+            polls: number of polls, infinitely many if `None`
+            callback: called with the monitor and the ids of the changed reviews after each poll
+        """
+        n_polls = 0
+        while polls is None or n_polls < polls:
+            start = time.monotonic()
+            changed = self.poll()
+            if callback is not None:
+                callback(self, changed)
+            n_polls += 1
+            if polls is None or n_polls < polls:
+                time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+    def save(self):
+        """Save the checkpoint if the monitor has a path"""
+        if self.path is None:
+            return
+        tmp_path = self.path.with_name(f'{self.path.name}.tmp')
+        tmp_path.write_text(self.progress.model_dump_json(), encoding='utf8')
+        tmp_path.replace(self.path)  # atomically, so an interrupted save does not corrupt the checkpoint
+
+    @property
+    def per_submission(self) -> pd.DataFrame:
+        """Number of target, done and remaining reviews per submission with targets or reviews"""
+        done = self.progress.done_per_submission
+        if isinstance(self.targets, Mapping):
+            codes = [*self.targets, *(code for code in done if code not in self.targets)]
+            targets = [self.targets.get(code, 0) for code in codes]
+        else:
+            codes, targets = list(done), [self.targets] * len(done)
+        df = pd.DataFrame({
+            Col.submission: pd.Series(codes, dtype=object),
+            Col.target_nreviews: pd.Series(targets, dtype=int),
+            Col.done_nreviews: pd.Series([done.get(code, 0) for code in codes], dtype=int),
+        })
+        df[Col.rem_nreviews] = (df[Col.target_nreviews] - df[Col.done_nreviews]).clip(lower=0)
+        return df
+
+    @property
+    def per_reviewer(self) -> pd.DataFrame:
+        """Number of done reviews per reviewer and, if assignments are given, of remaining assigned reviews"""
+        done = self.progress.done_per_reviewer
+        users = [*self.assignments, *(user for user in done if user not in self.assignments)]
+        df = pd.DataFrame({
+            Col.pretalx_user: pd.Series(users, dtype=object),
+            Col.done_nreviews: pd.Series([done.get(user, 0) for user in users], dtype=int),
+        })
+        if self.assignments:
+            df[Col.rem_nreviews] = pd.Series([self._open.get(user, 0) for user in users], dtype=int)
+        return df
@@ -0,0 +1,632 @@
+"""Building and solving the mixed-integer program (MIP) of a conference schedule directly with HiGHS
+
+A schedule assigns talks to room slots of a blank timetable, i.e. a dataframe with one row per day, session, slot and
+room holding the length of the slot as duration, e.g.:
+
+```
+model = ScheduleModel(talks_df, slots_df, capacities=capacities, parallel=parallel_penalty(votes_df, talks_df))
+result = model.solve(time_limit=600)
+schedule_df = model.schedule()
+```
+
+In contrast to formulating the model with Pyomo as in the notebooks, the constraint matrix is assembled with numpy
+from joins of dataframes, and only combinations of a talk and a room slot that the talk fits, i.e. the slot has the
+duration of the talk and the speakers are available, get a variable at all. A model can also be written to a file for
+the `highs` command line tool, whose solution file is read with `pytanis.highs.read_sol_columns` and passed to
+`ScheduleModel.schedule`.
+
+The constraints are that each talk is scheduled exactly once and each room slot holds at most one talk. The objective
+is maximized and weighs, in decreasing importance, see `Weights`:
+
+ 1. the preferred days and sessions of talks,
+ 2. the fit of the popularity of a talk and the capacity of its room,
+ 3. the penalty of talks in parallel, i.e. at the same day, session and slot, e.g. from the public votes,
+ 4. the number of different tracks within a session of a room.
+
+We follow the convention over configuration principle here and thus check out the `Col` class for the naming of
+columns.
+
+`highspy` and `pyomo` need to be installed, consider `pip install 'pytanis[all]'`.
+"""
+
+import multiprocessing
+import re
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import highspy
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+from structlog import get_logger
+
+from pytanis.highs import read_sol_columns
+from pytanis.review import Col as ReviewCol
+
+_logger = get_logger()
+
+
+class Col(ReviewCol):
+    """Additional conventions used for scheduling"""
+
+    day = 'Day'
+    session = 'Session'
+    slot = 'Slot'
+    room = 'Room'
+    voter = 'Voter'
+    popularity = 'Popularity'
+
+    scenario = 'Scenario'
+    status = 'Status'
+    objective = 'Objective'
+    gap = 'Gap'
+    build_secs = 'Build seconds'
+    solve_secs = 'Solve seconds'
+    ncols = '#Columns'
+    nrows = '#Rows'
+    sol_file = 'Solution file'
+    error = 'Error'
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+SLOT_COLS = [Col.day, Col.session, Col.slot, Col.room]
+"""Columns identifying a room slot of the timetable"""
+
+RESCHEDULE_SCOPES = (tuple(SLOT_COLS), (Col.day, Col.session), (Col.day,), ())
+"""Scopes of talks to move in `ScheduleModel.reschedule`, i.e. the room slot, the session, the day or all talks"""
+
+COMPARISON_COLS = [
+    Col.scenario,
+    Col.status,
+    Col.objective,
+    Col.gap,
+    Col.build_secs,
+    Col.solve_secs,
+    Col.ncols,
+    Col.nrows,
+    Col.sol_file,
+    Col.error,
+]
+"""Columns of the comparison of scenarios returned by `ScenarioRunner.run`"""
+
+
+class Weights(BaseModel):
+    """Weights of the terms of the objective, by default with the magnitudes of the notebooks"""
+
+    preference: float = 1e8
+    room_capacity: float = 1e6
+    parallel: float = 1e4
+    tracks: dict[str, float] = Field(default_factory=lambda: {Col.track: 100.0})
+    """Weight of each column of the talks whose values should be the same within a session of a room"""
+
+
+class SolveResult(NamedTuple):
+    status: str
+    objective: float | None
+    gap: float | None
+    runtime: float
+
+
+class _Matrix:
+    """Collects the entries of the constraint matrix as well as the columns and rows of the model"""
+
+    def __init__(self) -> None:
+        self.ncols = self.nrows = 0
+        self.entries: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []  # rows, cols, values
+        self.cols: list[tuple[np.ndarray, np.ndarray, bool, list[str]]] = []  # cost, upper, integer, names
+        self.rows: list[tuple[np.ndarray, np.ndarray]] = []  # lower, upper
+
+    def add_cols(self, cost: np.ndarray, names: list[str], *, upper: float = 1.0, integer: bool = True) -> np.ndarray:
+        idxs = np.arange(self.ncols, self.ncols + len(cost))
+        self.cols.append((np.asarray(cost, dtype=float), np.full(len(cost), upper), integer, names))
+        self.ncols += len(cost)
+        return idxs
+
+    def add_rows(self, n: int, lower: float, upper: float) -> np.ndarray:
+        idxs = np.arange(self.nrows, self.nrows + n)
+        self.rows.append((np.full(n, lower), np.full(n, upper)))
+        self.nrows += n
+        return idxs
+
+    def add_entries(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray | float):
+        self.entries.append((rows, cols, np.broadcast_to(np.asarray(values, dtype=float), rows.shape)))
+
+    def as_lp(self) -> highspy.HighsLp:
+        if not any(len(rows) for rows, _, _ in self.entries):
+            msg = 'The constraint matrix has no entries, e.g. as there are no talks to schedule'
+            raise ValueError(msg)
+        rows, cols, values = (np.concatenate(arrs) for arrs in zip(*self.entries, strict=True))
+        order = np.lexsort((rows, cols))
+        lp = highspy.HighsLp()
+        lp.num_col_, lp.num_row_ = self.ncols, self.nrows
+        lp.sense_ = highspy.ObjSense.kMaximize
+        lp.col_cost_ = np.concatenate([cost for cost, _, _, _ in self.cols])
+        lp.col_lower_ = np.zeros(self.ncols)
+        lp.col_upper_ = np.concatenate([upper for _, upper, _, _ in self.cols])
+        lp.integrality_ = [
+            var_type
+            for cost, _, integer, _ in self.cols
+            for var_type in [highspy.HighsVarType.kInteger if integer else highspy.HighsVarType.kContinuous] * len(cost)
+        ]
+        lp.col_names_ = [name for _, _, _, names in self.cols for name in names]
+        lp.row_lower_ = np.concatenate([lower for lower, _ in self.rows])
+        lp.row_upper_ = np.concatenate([upper for _, upper in self.rows])
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = np.concatenate([[0], np.cumsum(np.bincount(cols, minlength=self.ncols))])
+        lp.a_matrix_.index_ = rows[order]
+        lp.a_matrix_.value_ = values[order]
+        return lp
+
+
+def _names(prefix: str, df: pd.DataFrame) -> list[str]:
+    """Names of columns like `x[T1,Monday,Morning]` from the values of each row of a dataframe without whitespace"""
+    parts = []
+    for col in df.columns:
+        codes, uniques = pd.factorize(df[col])
+        parts.append(np.array([_WHITESPACE.sub('_', str(value)) for value in uniques], dtype=object)[codes].tolist())
+    return [f'{prefix}[{",".join(values)}]' for values in zip(*parts, strict=True)]
+
+
+def _minmax(values: np.ndarray) -> np.ndarray:
+    """Scale values to [0, 1]"""
+    span = np.ptp(values) if len(values) else 0.0
+    return (values - values.min()) / span if span > 0 else np.zeros_like(values, dtype=float)
+
+
+def _members(group_of: np.ndarray, ngroups: int, groups: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the pairs of the positions in `groups` and the indices of all elements of the respective group"""
+    order = np.argsort(group_of, kind='stable')
+    counts = np.bincount(group_of, minlength=ngroups)
+    starts = np.cumsum(counts) - counts
+    n = counts[groups]
+    pos = np.repeat(np.arange(len(groups)), n)
+    offsets = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+    return pos, order[starts[groups][pos] + offsets]
+
+
+def _isin(df: pd.DataFrame, other: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    """Returns if the values of the columns of each row of a dataframe are a row of the other dataframe"""
+    return pd.MultiIndex.from_frame(df[cols]).isin(pd.MultiIndex.from_frame(other[cols]))
+
+
+def _matches(cands: pd.DataFrame, df: pd.DataFrame | None) -> tuple[np.ndarray, np.ndarray]:
+    """Returns if the talk of a candidate has rows of days, and optionally sessions, and if the candidate matches"""
+    if df is None:
+        return np.zeros(len(cands), dtype=bool), np.zeros(len(cands), dtype=bool)
+    cols = [Col.submission, Col.day] + ([Col.session] if Col.session in df.columns else [])
+    return cands[Col.submission].isin(df[Col.submission].unique()), _isin(cands, df, cols)
+
+
+def parallel_penalty(votes_df: pd.DataFrame, talks_df: pd.DataFrame, *, threshold: float = 0.0) -> np.ndarray:
+    """Penalty of scheduling two talks in parallel as the normalized co-occurrence of their votes
+
+    Args:
+        votes_df: votes with columns `Col.voter`, `Col.submission` and `Col.vote_score`
+        talks_df: talks with column `Col.submission`
+        threshold: penalties not above the threshold are set to 0, so that no variables are created for these pairs
+
+    Returns:
+        the symmetric penalty matrix aligned with the rows of the talks with values in [0, 1] and a diagonal of 0
+    """
+    talk_idx = pd.Index(talks_df[Col.submission]).get_indexer(votes_df[Col.submission])
+    known = talk_idx >= 0
+    voters, voter_idx = np.unique(votes_df[Col.voter].to_numpy()[known], return_inverse=True)
+    votes = np.zeros((len(voters), len(talks_df)))
+    np.add.at(votes, (voter_idx, talk_idx[known]), votes_df[Col.vote_score].to_numpy(dtype=float)[known])
+    penalty = votes.T @ votes
+    np.fill_diagonal(penalty, 0.0)
+    if (max_penalty := penalty.max(initial=0.0)) > 0:
+        penalty /= max_penalty
+    penalty[penalty <= threshold] = 0.0
+    return penalty
+
+
+class ScheduleModel:
+    """Scheduling MIP of talks and room slots, built directly as HiGHS model
+
+    Args:
+        talks_df: talks with columns `Col.submission` and `Col.duration`, `Col.popularity` for the fit with the room
+                  capacities and the columns of `Weights.tracks` it has, where missing values are ignored
+        slots_df: blank timetable with columns `Col.day`, `Col.session`, `Col.slot`, `Col.room` and `Col.duration`,
+                  where room slots with a duration of 0 are ignored. The order of the rows determines the order of the
+                  schedule.
+        capacities: capacity of each room, e.g. from `Room.capacity`
+        availabilities: rows of talks with the `Col.day` and optionally `Col.session` they can be scheduled in.
+                        Talks without a row can be scheduled anytime.
+        preferences: rows of talks with the `Col.day` and optionally `Col.session` they should be scheduled in
+        parallel: penalty of two talks in parallel aligned with the rows of the talks, see `parallel_penalty`
+        weights: weights of the terms of the objective
+    """
+
+    def __init__(
+        self,
+        talks_df: pd.DataFrame,
+        slots_df: pd.DataFrame,
+        *,
+        capacities: Mapping[str, float] | None = None,
+        availabilities: pd.DataFrame | None = None,
+        preferences: pd.DataFrame | None = None,
+        parallel: np.ndarray | None = None,
+        weights: Weights | None = None,
+    ):
+        self.weights = weights or Weights()
+        self.talks = talks_df.reset_index(drop=True)
+        self.slots = slots_df.loc[slots_df[Col.duration] > 0, [*SLOT_COLS, Col.duration]].reset_index(drop=True)
+        self.columns = self._candidates(availabilities)
+        """Talk and room slot of each variable `x` at the same index, which are the first columns of the model"""
+
+        matrix = _Matrix()
+        xs = matrix.add_cols(
+            self._x_cost(capacities, preferences), _names('x', self.columns[[Col.submission, *SLOT_COLS]])
+        )
+        self._add_assignment_rows(matrix, xs)
+        if parallel is not None:
+            self._add_parallel(matrix, xs, parallel)
+        for col, weight in self.weights.tracks.items():
+            if col in self.talks.columns:
+                self._add_tracks(matrix, xs, col, weight)
+
+        self.lp = matrix.as_lp()
+        self.highs = highspy.Highs()
+        self.highs.silent()
+        self.highs.passModel(self.lp)
+
+    def __repr__(self) -> str:
+        return f'ScheduleModel(talks={len(self.talks)}, cols={self.lp.num_col_}, rows={self.lp.num_row_})'
+
+    def _candidates(self, availabilities: pd.DataFrame | None) -> pd.DataFrame:
+        """Returns all fitting combinations of talks and room slots"""
+        talks = self.talks[[Col.submission, Col.duration]].assign(_talk=np.arange(len(self.talks)))
+        slots = self.slots.assign(_slot=np.arange(len(self.slots)))
+        cands = talks.merge(slots, on=Col.duration).sort_values(['_talk', '_slot'], ignore_index=True)
+        restricted, available = _matches(cands, availabilities)
+        cands = cands.loc[~restricted | available].reset_index(drop=True)
+        if missing := sorted(set(talks[Col.submission]) - set(cands[Col.submission])):
+            msg = f'No room slot fits the talks {missing}'
+            raise ValueError(msg)
+        return cands[[Col.submission, *SLOT_COLS, '_talk', '_slot']]
+
+    def _x_cost(self, capacities: Mapping[str, float] | None, preferences: pd.DataFrame | None) -> np.ndarray:
+        cost = self.weights.preference * _matches(self.columns, preferences)[1].astype(float)
+        if capacities is not None and Col.popularity in self.talks.columns:
+            rooms = pd.Series(capacities, dtype=float)
+            rooms[:] = _minmax(rooms.to_numpy())
+            popularity = _minmax(self.talks[Col.popularity].fillna(self.talks[Col.popularity].median()).to_numpy())
+            room_cap = rooms.reindex(self.columns[Col.room]).fillna(0.0).to_numpy()
+            cost -= self.weights.room_capacity * (popularity[self.columns['_talk'].to_numpy()] - room_cap) ** 2
+        return cost
+
+    def _add_assignment_rows(self, matrix: _Matrix, xs: np.ndarray):
+        """Each talk is scheduled exactly once and each room slot holds at most one talk"""
+        talk_rows = matrix.add_rows(len(self.talks), 1.0, 1.0)
+        matrix.add_entries(talk_rows[self.columns['_talk'].to_numpy()], xs, 1.0)
+        slot_rows = matrix.add_rows(len(self.slots), -np.inf, 1.0)
+        matrix.add_entries(slot_rows[self.columns['_slot'].to_numpy()], xs, 1.0)
+
+    def _add_parallel(self, matrix: _Matrix, xs: np.ndarray, penalty: np.ndarray):
+        """Indicator `z` of two talks with a penalty at the same time, i.e. day, session and slot"""
+        time_ids = self.columns.groupby([Col.day, Col.session, Col.slot], sort=False).ngroup().to_numpy()
+        talk_times = pd.DataFrame({'_talk': self.columns['_talk'], '_time': time_ids}).drop_duplicates()
+        talk_times['_tt'] = np.arange(len(talk_times))
+        tt_of_x = talk_times.set_index(['_talk', '_time'])['_tt'].reindex(
+            pd.MultiIndex.from_arrays([self.columns['_talk'], time_ids])
+        )
+        pairs = talk_times.merge(talk_times, on='_time', suffixes=('_1', '_2'))
+        pairs = pairs.loc[pairs['_talk_1'] < pairs['_talk_2']]
+        weight = penalty[pairs['_talk_1'].to_numpy(), pairs['_talk_2'].to_numpy()]
+        pairs, weight = pairs.loc[weight > 0], weight[weight > 0]
+
+        codes = self.talks[Col.submission].to_numpy()
+        times = self.columns.iloc[np.unique(time_ids, return_index=True)[1]][[Col.day, Col.session, Col.slot]]
+        names = times.iloc[pairs['_time'].to_numpy()].assign(
+            t1=codes[pairs['_talk_1'].to_numpy()], t2=codes[pairs['_talk_2'].to_numpy()]
+        )[['t1', 't2', Col.day, Col.session, Col.slot]]
+        zs = matrix.add_cols(-self.weights.parallel * weight, _names('z', names), integer=False)
+        rows = matrix.add_rows(len(zs), -np.inf, 1.0)
+        matrix.add_entries(rows, zs, -1.0)
+        for tt in (pairs['_tt_1'].to_numpy(), pairs['_tt_2'].to_numpy()):
+            pos, members = _members(tt_of_x.to_numpy(), len(talk_times), tt)
+            matrix.add_entries(rows[pos], xs[members], 1.0)
+
+    def _add_tracks(self, matrix: _Matrix, xs: np.ndarray, col: str, weight: float):
+        """Indicator `y` of a track in a session of a room"""
+        track_codes, tracks = pd.factorize(self.talks[col])
+        track = track_codes[self.columns['_talk'].to_numpy()]
+        with_track = track >= 0
+        block_keys = [Col.day, Col.session, Col.room]
+        block = self.columns.groupby(block_keys, sort=False).ngroup().to_numpy()
+        nslots = self.slots.groupby(block_keys, sort=False)[Col.slot].transform('size')
+        nslots_of_x = nslots.to_numpy()[self.columns['_slot'].to_numpy()]
+        groups = pd.DataFrame({'_block': block[with_track], '_track': track[with_track]})
+        group = groups.groupby(['_block', '_track'], sort=False).ngroup().to_numpy()
+        firsts = np.unique(group, return_index=True)[1]
+        names = (
+            self.columns.loc[with_track, block_keys]
+            .iloc[firsts]
+            .assign(_track=tracks[groups['_track'].to_numpy()[firsts]])
+        )
+        ys = matrix.add_cols(np.full(len(firsts), -weight), _names(f'y_{col}', names[['_track', *block_keys]]))
+        rows = matrix.add_rows(len(ys), -np.inf, 0.0)
+        matrix.add_entries(rows[group], xs[with_track], 1.0)
+        matrix.add_entries(rows, ys, -nslots_of_x[with_track][firsts])
+
+    def solve(
+        self,
+        *,
+        time_limit: float | None = None,
+        threads: int | None = None,
+        mip_rel_gap: float | None = None,
+        log: bool = False,
+    ) -> SolveResult:
+        """Solve the model with HiGHS
+
+        Args:
+            time_limit: maximum time in seconds
+            threads: number of threads of HiGHS
+            mip_rel_gap: relative gap between the best solution and bound to stop at
+            log: show the output of HiGHS
+
+        Returns:
+            the status, objective value, relative gap and runtime in seconds
+        """
+        self.highs.setOptionValue('output_flag', log)
+        for option, value in (('time_limit', time_limit), ('threads', threads), ('mip_rel_gap', mip_rel_gap)):
+            if value is not None:
+                self.highs.setOptionValue(option, value)
+        start = time.perf_counter()
+        self.highs.run()
+        return self.result()._replace(runtime=time.perf_counter() - start)
+
+    def result(self) -> SolveResult:
+        """Returns the result of the last solve with the total runtime of HiGHS for the model so far"""
+        info = self.highs.getInfo()
+        has_sol = info.primal_solution_status == highspy.SolutionStatus.kSolutionStatusFeasible
+        return SolveResult(
+            status=self.highs.modelStatusToString(self.highs.getModelStatus()),
+            objective=info.objective_function_value if has_sol else None,
+            gap=info.mip_gap if has_sol else None,
+            runtime=self.highs.getRunTime(),
+        )
+
+    def reschedule(
+        self,
+        previous: pd.DataFrame,
+        *,
+        free: Iterable[str] = (),
+        stability: float = 1e7,
+        scopes: Sequence[Sequence[str]] = RESCHEDULE_SCOPES,
+        **kwargs: Any,
+    ) -> SolveResult:
+        """Solve the model again after a change, e.g. of a cancelled talk, a changed room or availability, with
+        a previous schedule as start and most of the previous schedule fixed
+
+        The model is built with the changed talks, slots etc. and the talks whose room slot of the previous schedule
+        is no longer a variable of the model, e.g. as a speaker is no longer available then, are affected by the
+        change, as well as new talks, talks of `free` and talks that were cancelled. Only the affected talks and the
+        talks in the same scope, e.g. the same day and session, as a room slot of an affected talk in the previous
+        schedule or a room slot an affected talk fits are free, all others stay in their room slots. If no schedule
+        is found this way, the next wider scope is tried. A free talk is moved only if it improves the objective by
+        more than `stability`.
+
+        Args:
+            previous: previous schedule, e.g. `model.schedule(read_sol_columns(file_name).values)` of the old model
+            free: codes of further talks to move if it improves the schedule
+            stability: bonus for each talk that stays in its room slot of the previous schedule
+            scopes: columns of the room slots defining the scopes, the next is tried if no schedule is found,
+                    where no columns mean that all talks are free
+            **kwargs: options of `solve`, e.g. `time_limit`
+
+        Returns:
+            the result of the last solve with the objective value excluding the bonus of `stability`
+        """
+        if not scopes:
+            msg = 'At least one scope is needed'
+            raise ValueError(msg)
+        keys = [Col.submission, *SLOT_COLS]
+        prev = previous[keys].merge(self.columns[keys].reset_index(names='_col'), on=keys, how='left')
+        kept = prev.loc[prev['_col'].notna()]
+        kept_cols = kept['_col'].to_numpy(dtype=np.int32)
+        affected = set(self.talks[Col.submission]) - set(kept[Col.submission]) | set(free)
+        # room slots of affected talks in the previous schedule and the ones they fit now
+        touched = pd.concat([
+            prev.loc[prev['_col'].isna() | prev[Col.submission].isin(affected), SLOT_COLS],
+            self.columns.loc[self.columns[Col.submission].isin(affected), SLOT_COLS],
+        ])
+
+        cost = self.lp.col_cost_[kept_cols]
+        start = np.ones(len(kept_cols))
+        runtime = 0.0
+        self.highs.changeColsCost(len(kept_cols), kept_cols, cost + stability)
+        try:
+            for scope in scopes:
+                in_scope = _isin(kept, touched, list(scope)) if scope else np.ones(len(kept), dtype=bool)
+                fixed = kept_cols[~in_scope & ~kept[Col.submission].isin(affected).to_numpy()]
+                self.highs.changeColsBounds(len(fixed), fixed, np.ones(len(fixed)), np.ones(len(fixed)))
+                try:
+                    self.highs.setSolution(len(kept_cols), kept_cols, start)
+                    result = self.solve(**kwargs)
+                finally:
+                    self.highs.changeColsBounds(len(fixed), fixed, np.zeros(len(fixed)), np.ones(len(fixed)))
+                runtime += result.runtime
+                _logger.info('rescheduled', scope=list(scope), free=len(kept) - len(fixed), status=result.status)
+                if result.objective is not None:
+                    break
+        finally:
+            self.highs.changeColsCost(len(kept_cols), kept_cols, cost)
+        if result.objective is not None:
+            bonus = stability * self.values[kept_cols].round().sum()
+            result = result._replace(objective=result.objective - float(bonus))
+        return result._replace(runtime=runtime)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Values of all columns of the current solution"""
+        return np.asarray(self.highs.getSolution().col_value)
+
+    def write(self, file_name: str | Path):
+        """Write the model to a file, e.g. `schedule.mps` for the `highs` command line tool"""
+        self.highs.writeModel(str(file_name))
+
+    def write_solution(self, file_name: str | Path):
+        """Write the current solution to a file in the default style of HiGHS, see `pytanis.highs.read_sol_columns`"""
+        self.highs.writeSolution(str(file_name), 0)
+
+    def schedule(self, values: np.ndarray | None = None) -> pd.DataFrame:
+        """Returns the talk of each scheduled room slot
+
+        Args:
+            values: values of the columns, e.g. `read_sol_columns(file_name).values`, the current solution if `None`
+
+        Returns:
+            the schedule with the columns of a room slot and `Col.submission` in the order of the timetable
+        """
+        values = self.values if values is None else values
+        chosen = self.columns.loc[values[: len(self.columns)] > 0.5]  # noqa: PLR2004
+        return chosen.sort_values('_slot')[[*SLOT_COLS, Col.submission]].reset_index(drop=True)
+
+
+class Scenario(BaseModel):
+    """Variant of a schedule, whose arguments of `ScheduleModel` replace the ones of the `ScenarioRunner` if given"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    capacities: dict[str, float] | None = None
+    availabilities: pd.DataFrame | None = None
+    preferences: pd.DataFrame | None = None
+    parallel: np.ndarray | None = None
+    weights: Weights | None = None
+    time_limit: float | None = None
+    threads: int | None = 1
+    mip_rel_gap: float | None = None
+
+    def model_kwargs(self) -> dict[str, Any]:
+        """Returns the given arguments of `ScheduleModel`"""
+        fields = ('capacities', 'availabilities', 'preferences', 'parallel', 'weights')
+        return {field: value for field in fields if (value := getattr(self, field)) is not None}
+
+
+def _solve_scenario(
+    talks_df: pd.DataFrame, slots_df: pd.DataFrame, kwargs: dict[str, Any], scenario: Scenario, sol_file: Path
+) -> dict[str, Any]:
+    """Build and solve the model of a scenario in a worker process and write its solution"""
+    sol_file.unlink(missing_ok=True)  # a solution of an earlier run must not be taken for one of this run
+    start = time.perf_counter()
+    model = ScheduleModel(talks_df, slots_df, **{**kwargs, **scenario.model_kwargs()})
+    build_secs = time.perf_counter() - start
+    result = model.solve(time_limit=scenario.time_limit, threads=scenario.threads, mip_rel_gap=scenario.mip_rel_gap)
+    if result.objective is not None:
+        model.write_solution(sol_file)
+    return {
+        Col.scenario: scenario.name,
+        Col.status: result.status,
+        Col.objective: result.objective,
+        Col.gap: result.gap,
+        Col.build_secs: build_secs,
+        Col.solve_secs: result.runtime,
+        Col.ncols: model.lp.num_col_,
+        Col.nrows: model.lp.num_row_,
+        Col.sol_file: str(sol_file) if result.objective is not None else None,
+        Col.error: None,
+    }
+
+
+def _scenario_row(scenario: Scenario, future: Future[dict[str, Any]]) -> dict[str, Any]:
+    """Returns the row of a scenario in the comparison, also if solving it failed"""
+    try:
+        return future.result()
+    except Exception as exc:
+        _logger.warning('scenario failed', scenario=scenario.name, error=repr(exc))
+        return {Col.scenario: scenario.name, Col.status: 'Error', Col.sol_file: None, Col.error: repr(exc)}
+
+
+class ScenarioRunner:
+    """Build and solve variants of a schedule in parallel processes and compare them
+
+    Each scenario is solved in its own process with its time limit and number of threads of HiGHS and its solution
+    is written as `<name>.sol` into a directory. A scenario that fails, e.g. as a talk fits no room slot, is
+    reported with the status `Error` and its exception without stopping the other scenarios. The schedule of a
+    scenario is only loaded from the solution file of the last run when it is requested, e.g.:
+
+    ```
+    runner = ScenarioRunner(talks_df, slots_df, 'scenarios', parallel=parallel, max_workers=4)
+    comparison_df = runner.run([
+        Scenario(name='base', time_limit=600),
+        Scenario(name='tracks', weights=Weights(tracks={Col.track: 1_000}), time_limit=600),
+    ])
+    schedule_df = runner.schedule('tracks')
+    ```
+
+    Args:
+        talks_df: talks of all scenarios, see `ScheduleModel`
+        slots_df: blank timetable of all scenarios, see `ScheduleModel`
+        directory: directory of the solution files, created if it does not exist
+        max_workers: maximum number of processes, by default the number of CPUs
+        **kwargs: arguments of `ScheduleModel` used unless a scenario replaces them
+    """
+
+    def __init__(
+        self,
+        talks_df: pd.DataFrame,
+        slots_df: pd.DataFrame,
+        directory: str | Path,
+        *,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ):
+        self.talks_df = talks_df
+        self.slots_df = slots_df
+        self.directory = Path(directory)
+        self.max_workers = max_workers
+        self.kwargs = kwargs
+        self.scenarios: dict[str, Scenario] = {}
+        self.sol_files: dict[str, str | None] = {}  # solution file of each scenario of the last run, if any
+
+    def run(self, scenarios: Iterable[Scenario]) -> pd.DataFrame:
+        """Solve the scenarios in parallel
+
+        Returns:
+            the comparison of the scenarios with the columns `COMPARISON_COLS`, i.e. their status, objective value,
+            gap, times, size, solution file and error if they failed
+        """
+        scenarios = list(scenarios)
+        if len(names := {scenario.name for scenario in scenarios}) < len(scenarios):
+            msg = 'The names of the scenarios must be unique'
+            raise ValueError(msg)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # spawn instead of fork as the thread pool of HiGHS may not survive forking
+        context = multiprocessing.get_context('spawn')
+        max_workers = min(self.max_workers or multiprocessing.cpu_count(), len(scenarios)) or None
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    _solve_scenario,
+                    self.talks_df,
+                    self.slots_df,
+                    self.kwargs,
+                    scenario,
+                    self.directory / f'{scenario.name}.sol',
+                )
+                for scenario in scenarios
+            ]
+            rows = [_scenario_row(scenario, future) for scenario, future in zip(scenarios, futures, strict=True)]
+        self.scenarios.update((scenario.name, scenario) for scenario in scenarios)
+        self.sol_files.update((row[Col.scenario], row[Col.sol_file]) for row in rows)
+        _logger.info('solved scenarios', scenarios=sorted(names))
+        return pd.DataFrame(rows, columns=COMPARISON_COLS).set_index(Col.scenario)
+
+    def model(self, name: str) -> ScheduleModel:
+        """Returns the model of a scenario, e.g. to reschedule it"""
+        scenario = self.scenarios[name]
+        return ScheduleModel(self.talks_df, self.slots_df, **{**self.kwargs, **scenario.model_kwargs()})
+
+    def schedule(self, name: str) -> pd.DataFrame:
+        """Returns the schedule of a scenario from the solution file of its last run"""
+        if (sol_file := self.sol_files[name]) is None:
+            msg = f'No solution of scenario {name} was found in its last run'
+            raise FileNotFoundError(msg)
+        return self.model(name).schedule(read_sol_columns(sol_file, names=False).values)
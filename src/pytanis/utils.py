@@ -1,14 +1,25 @@
 """Additional utilities"""
 
+import asyncio
 import functools
+import itertools
+import random
 import threading
 import time
-from collections.abc import Callable
-from typing import Any, TypeVar
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar, cast
 
+import httpx
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel, ConfigDict
 from structlog import get_logger
 
+_logger = get_logger()
+
 RT = TypeVar('RT')  # return type
 
 
@@ -46,9 +57,213 @@ def pretty_timedelta(seconds: int) -> str:
         return f'{sign}{seconds}s'
 
 
+def _check_throttle_args(calls: int, seconds: int):
+    """Check the arguments of the throttle decorators"""
+    if not isinstance(calls, int):
+        msg = 'number of calls must be integer'
+        raise ValueError(msg)
+    if not isinstance(seconds, int):
+        msg = 'number of seconds must be integer'
+        raise ValueError(msg)
+
+
+class RateLimiter(ABC):
+    """Base class of rate limiters deciding when a call to an API may start
+
+    A rate limiter can be shared by several threads or tasks. The start of each call is reserved under a lock
+    and the caller waits outside of it, so concurrent calls do not exceed the rate. After each call,
+    the response can be passed to `update` so that the rate limiter can adapt to what the server says.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    @abstractmethod
+    def rate(self) -> float:
+        """Current rate in calls per second"""
+
+    @abstractmethod
+    def _reserve(self, curr_time: float) -> float:
+        """Reserve the start time of a call, called with the lock held"""
+
+    def delay(self) -> float:
+        """Reserve the next possible start time of a call and return the seconds to wait for it"""
+        with self._lock:
+            curr_time = time.time()
+            return self._reserve(curr_time) - curr_time
+
+    def acquire(self):
+        """Block until a call may start"""
+        if (sleep_time := self.delay()) > 0:
+            _logger.debug('stalling call', secs=sleep_time)
+            time.sleep(sleep_time)
+
+    async def aacquire(self):
+        """Wait asynchronously until a call may start"""
+        if (sleep_time := self.delay()) > 0:
+            _logger.debug('stalling call', secs=sleep_time)
+            await asyncio.sleep(sleep_time)
+
+    def update(self, resp: httpx.Response):
+        """Adapt to the response of a call, does nothing by default"""
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """Allows a fixed number of calls within a sliding window of seconds
+
+    Args:
+        calls: number of calls per interval
+        seconds: number of seconds in interval
+    """
+
+    def __init__(self, calls: int, seconds: int = 1):
+        super().__init__()
+        _check_throttle_args(calls, seconds)
+        self.seconds = seconds
+        # start times of the last calls, including reserved ones in the future
+        self._last_calls: deque[float] = deque(maxlen=calls)
+
+    @property
+    def rate(self) -> float:
+        return cast(int, self._last_calls.maxlen) / self.seconds
+
+    def _reserve(self, curr_time: float) -> float:
+        start_time = curr_time
+        if len(self._last_calls) == self._last_calls.maxlen:
+            start_time = max(curr_time, self._last_calls[0] + self.seconds)
+        self._last_calls.append(start_time)
+        return start_time
+
+
+RESET_EPOCH_THRESHOLD: float = 1e9
+"""Values of a rate limit reset header larger than this are interpreted as epoch time, not seconds"""
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds to wait according to the `Retry-After` or `X-RateLimit-*` headers of a response"""
+    if (retry_after := resp.headers.get('Retry-After')) is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:  # HTTP date
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+    remaining = resp.headers.get('X-RateLimit-Remaining', resp.headers.get('RateLimit-Remaining'))
+    reset = resp.headers.get('X-RateLimit-Reset', resp.headers.get('RateLimit-Reset'))
+    if remaining is not None and reset is not None:
+        try:
+            remaining, reset = float(remaining), float(reset)
+        except ValueError:
+            return None
+        if remaining <= 0:
+            # some APIs state the epoch time of the reset, others the seconds until it
+            return max(0.0, reset - time.time()) if reset > RESET_EPOCH_THRESHOLD else reset
+    return None
+
+
+class TokenBucketLimiter(RateLimiter):
+    """Adaptive token bucket that honors rate limiting of the server
+
+    Up to `burst` calls may start at once, afterward calls start at the current `rate`. If the server answers
+    with `429 Too Many Requests` or signals an exhausted rate limit via `Retry-After` or `X-RateLimit-*` headers,
+    all calls are paused accordingly and the rate is decreased by `decrease`. After `recovery` seconds without
+    being rate limited, the rate is increased again by `increase` calls per second up to `max_rate`.
+
+    Args:
+        rate: initial rate in calls per second
+        burst: number of calls that may start at once
+        min_rate: lower bound of the rate, `rate / 8` if `None`
+        max_rate: upper bound of the rate, `rate` if `None`
+        decrease: factor applied to the rate when being rate limited
+        increase: calls per second added to the rate after `recovery` seconds without being rate limited,
+            `rate / 4` if `None`
+        recovery: seconds without being rate limited before the rate is increased
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        decrease: float = 0.5,
+        increase: float | None = None,
+        recovery: float = 30.0,
+    ):
+        super().__init__()
+        if rate <= 0 or burst < 1:
+            msg = 'rate must be positive and burst at least 1'
+            raise ValueError(msg)
+        self._rate = rate
+        self.burst = burst
+        self.min_rate = rate / 8 if min_rate is None else min_rate
+        self.max_rate = rate if max_rate is None else max_rate
+        self.decrease = decrease
+        self.increase = rate / 4 if increase is None else increase
+        self.recovery = recovery
+        self._tat = 0.0  # theoretical arrival time of the next call
+        self._last_change = time.time()  # last time the rate was changed or we were rate limited
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _reserve(self, curr_time: float) -> float:
+        interval = 1 / self._rate
+        tat = max(self._tat, curr_time)
+        start_time = max(curr_time, tat - (self.burst - 1) * interval)
+        self._tat = tat + interval
+        return start_time
+
+    def update(self, resp: httpx.Response):
+        curr_time = time.time()
+        retry_after = _retry_after(resp)
+        with self._lock:
+            if resp.status_code == httpx.codes.TOO_MANY_REQUESTS or retry_after is not None:
+                if resp.status_code == httpx.codes.TOO_MANY_REQUESTS:
+                    self._rate = max(self.min_rate, self._rate * self.decrease)
+                pause = 1 / self._rate if retry_after is None else retry_after
+                # no call may start before the pause is over, burst included
+                self._tat = max(self._tat, curr_time + pause + (self.burst - 1) / self._rate)
+                self._last_change = curr_time
+                _logger.info('rate limited by server', rate=self._rate, pause=pause)
+            elif curr_time - self._last_change >= self.recovery and self._rate < self.max_rate:
+                self._rate = min(self.max_rate, self._rate + self.increase)
+                self._last_change = curr_time
+                _logger.debug('increasing rate', rate=self._rate)
+
+
+class RetryPolicy(BaseModel):
+    """Retrying of idempotent requests with exponential backoff and full jitter
+
+    Attributes:
+        retries: maximum number of retries of a request, 0 disables retrying
+        backoff: seconds of the first backoff, doubled for each further retry
+        max_backoff: upper bound of the backoff in seconds
+        statuses: HTTP status codes of responses considered transient errors
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    retries: int = 3
+    backoff: float = 1.0
+    max_backoff: float = 30.0
+    statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+
+    def wait(self, attempt: int) -> float:
+        """Seconds to wait before the retry `attempt`, starting at 0, randomized to spread concurrent retries"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))  # noqa: S311
+
+
 def throttle(calls: int, seconds: int = 1) -> Callable[[Callable[..., RT]], Callable[..., RT]]:
     """Decorator for throttling a function to number of calls per seconds
 
+    Only the start of a call is delayed, so calls from several threads can run concurrently
+    without exceeding the number of calls per interval.
+
     Args:
         calls: number of calls per interval
         seconds: number of seconds in interval
@@ -56,48 +271,84 @@ def throttle(calls: int, seconds: int = 1) -> Callable[[Callable[..., RT]], Call
     Returns:
         wrapped function
     """
-    if not isinstance(calls, int):
-        msg = 'number of calls must be integer'
-        raise ValueError(msg)
-    if not isinstance(seconds, int):
-        msg = 'number of seconds must be integer'
-        raise ValueError(msg)
+    _check_throttle_args(calls, seconds)
 
     def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
-        # keeps track of the last calls
-        last_calls: list[float] = []
-        lock = threading.Lock()
+        limiter = SlidingWindowLimiter(calls, seconds)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> RT:
-            nonlocal last_calls
-            with lock:
-                curr_time = time.time()
-                # Remove old calls
-                last_calls = [call for call in last_calls if call > curr_time - seconds]
-
-                if len(last_calls) >= calls:
-                    sleep_time = last_calls[0] + seconds - curr_time
-                    logger = get_logger()
-                    logger.debug('stalling call', func=func.__name__, secs=sleep_time)
-                    time.sleep(sleep_time)
-
-                resp = func(*args, **kwargs)
-                last_calls.append(time.time())
-                return resp
+            limiter.acquire()
+            return func(*args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
-def implode(df: pd.DataFrame, cols: str | list[str]) -> pd.DataFrame:
-    """The inverse of Pandas' explode"""
+def athrottle(calls: int, seconds: int = 1) -> Callable[[Callable[..., Awaitable[RT]]], Callable[..., Awaitable[RT]]]:
+    """Decorator for throttling a coroutine function to number of calls per seconds
+
+    Like `throttle`, only the start of a call is delayed, so several calls can be awaited
+    concurrently without exceeding the number of calls per interval.
+
+    Args:
+        calls: number of calls per interval
+        seconds: number of seconds in interval
+
+    Returns:
+        wrapped coroutine function
+    """
+    _check_throttle_args(calls, seconds)
+
+    def decorator(func: Callable[..., Awaitable[RT]]) -> Callable[..., Awaitable[RT]]:
+        limiter = SlidingWindowLimiter(calls, seconds)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> RT:
+            await limiter.aacquire()
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def implode(df: pd.DataFrame, cols: str | list[str], *, key: str | list[str] | None = None) -> pd.DataFrame:
+    """The inverse of Pandas' explode
+
+    The values of `cols` are collected as lists per group of rows. Specify a `key`, e.g. the column of submission
+    codes after exploding and merging speakers, to group by it and take the other columns from the first row of
+    each group in order of appearance. This is much faster than grouping by all other columns, which is done if
+    `key` is `None`, sorting the result by them.
+
+    Args:
+        df: dataframe to implode
+        cols: column(s) whose values are collected as lists
+        key: column(s) identifying the rows to implode, all other columns if `None`
+
+    Returns:
+        imploded dataframe with the same columns
+    """
     if not isinstance(cols, list):
         cols = [cols]
-    orig_cols = df.columns
-    grp_cols = [col for col in df.columns if col not in cols]
-    df = df.groupby(grp_cols, group_keys=True, dropna=False).aggregate({col: lambda x: x.tolist() for col in cols})
-    df.reset_index(inplace=True)
-    df = df.loc[:, orig_cols]
-    return df
+    if key is None:
+        grp_cols = [col for col in df.columns if col not in cols]
+        group_ids = df.groupby(grp_cols, sort=True, dropna=False).ngroup().to_numpy()
+    elif isinstance(key, list):
+        group_ids = df.groupby(key, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        group_ids = pd.factorize(df[key], use_na_sentinel=False)[0]
+
+    # sort rows by group to collect the values of a group by slicing instead of calling a function per group
+    order = np.argsort(group_ids, kind='stable')
+    sorted_ids = group_ids[order]
+    starts = np.flatnonzero(np.diff(sorted_ids, prepend=-1))
+    bounds = [*starts.tolist(), len(order)]
+    result = df.iloc[order[starts]].reset_index(drop=True)
+    for col in cols:
+        values = df[col].take(order).tolist()
+        lists = np.empty(len(starts), dtype=object)
+        lists[:] = [values[start:end] for start, end in itertools.pairwise(bounds)]
+        result[col] = lists
+    return result
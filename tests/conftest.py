@@ -1,13 +1,14 @@
-"""Fixtures for the unit tests of Pytanis"""
+"""Fixtures for the unit tests of Pytanis, e.g. a small fake event as returned by the Pretalx API"""
 
 import os
 from pathlib import Path
 from shutil import copy
 
+import httpx
 import pytest
 
 from pytanis.config import PYTANIS_CFG_PATH, PYTANIS_ENV
-from pytanis.pretalx.client import PretalxClient
+from pytanis.pretalx.client import BASE_URL, PretalxClient
 
 __location__ = Path(__file__).parent
 
@@ -32,3 +33,151 @@ def tmp_config(tmp_path):
 @pytest.fixture
 def pretalx_client():
     return PretalxClient()
+
+
+@pytest.fixture
+def mock_pretalx_client(tmp_config):
+    """Factory for Pretalx clients with requests answered by a `handler` function instead of the Pretalx API"""
+    clients = []
+
+    def factory(handler, **kwargs):
+        client = PretalxClient(**kwargs)
+        client.set_throttling(calls=1000, seconds=1)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler), base_url=BASE_URL)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+def _answer(id: int, question_id: int, answer: str, *, submission: str | None = None, person: str | None = None):  # noqa: A002
+    return {
+        'id': id,
+        'answer': answer,
+        'answer_file': None,
+        'question': {'id': question_id, 'question': {'en': f'Question {question_id}'}},
+        'submission': submission,
+        'review': None,
+        'person': person,
+        'options': [],
+    }
+
+
+def _submission(code: str, speakers: list[tuple[str, str]], track: str | None, answers: list[dict], tag_ids: list[int]):
+    return {
+        'code': code,
+        'speakers': [{'code': s_code, 'name': name, 'biography': None, 'avatar': None} for s_code, name in speakers],
+        'created': '2023-01-01T10:00:00+00:00',
+        'title': f'Title of {code}',
+        'submission_type': {'en': 'Talk'},
+        'submission_type_id': 1,
+        'track': None if track is None else {'en': track},
+        'track_id': None if track is None else len(track),
+        'state': 'submitted',
+        'pending_state': None,
+        'abstract': 'Abstract',
+        'description': 'Description',
+        'duration': 30,
+        'do_not_record': False,
+        'is_featured': False,
+        'content_locale': 'en',
+        'slot': None,
+        'slot_count': 1,
+        'image': None,
+        'answers': answers,
+        'resources': [],
+        'tags': [f'tag{tag_id}' for tag_id in tag_ids],
+        'tag_ids': tag_ids,
+    }
+
+
+def _speaker(code: str, name: str, submissions: list[str], answers: list[dict]):
+    return {
+        'code': code,
+        'name': name,
+        'biography': f'Bio of {name}',
+        'avatar': None,
+        'email': f'{code.lower()}@host.com',
+        'submissions': submissions,
+        'availabilities': None,
+        'answers': answers,
+    }
+
+
+def _review(id: int, submission: str, user: str, score: float | None):  # noqa: A002
+    return {
+        'id': id,
+        'submission': submission,
+        'user': user,
+        'text': None,
+        'score': score,
+        'created': '2023-02-01T10:00:00+00:00',
+        'updated': f'2023-02-{id:02}T10:00:00+00:00',
+        'answers': [],
+    }
+
+
+def _question(id: int, target: str):  # noqa: A002
+    return {
+        'id': id,
+        'variant': 'string',
+        'target': target,
+        'question': {'en': f'Question {id}'},
+        'help_text': {'en': ''},
+        'question_required': 'optional',
+        'required': False,
+        'options': [],
+        'contains_personal_data': False,
+        'is_public': False,
+        'is_visible_to_reviewers': True,
+    }
+
+
+@pytest.fixture
+def pretalx_data() -> dict[str, list[dict]]:
+    """Raw JSON results of a small event per resource"""
+    return {
+        'submissions': [
+            _submission(
+                'SUB1',
+                [('SPK1', 'Ada'), ('SPK2', 'Bob')],
+                'PyData',
+                [_answer(1, 10, 'Expert', submission='SUB1'), _answer(2, 11, 'Yes', submission='SUB1')],
+                [1],
+            ),
+            _submission('SUB2', [('SPK1', 'Ada')], 'PyCon', [_answer(3, 11, 'No', submission='SUB2')], [1, 2]),
+            _submission('SUB3', [('SPK3', 'Cleo')], None, [], []),
+        ],
+        'speakers': [
+            _speaker('SPK1', 'Ada', ['SUB1', 'SUB2'], [_answer(4, 20, 'ACME', person='SPK1')]),
+            _speaker('SPK2', 'Bob', ['SUB1'], [_answer(5, 10, 'Expert', submission='SUB1')]),
+            _speaker('SPK3', 'Cleo', ['SUB3'], []),
+        ],
+        'reviews': [
+            _review(1, 'SUB1', 'rev1', 4.0),
+            _review(2, 'SUB1', 'rev2', 2.0),
+            _review(3, 'SUB2', 'rev1', 3.0),
+            _review(4, 'SUB3', 'rev2', None),
+        ],
+        'questions': [_question(10, 'submission'), _question(11, 'submission'), _question(20, 'speaker')],
+    }
+
+
+@pytest.fixture
+def pretalx_handler(pretalx_data):
+    """Handler of a mocked Pretalx API serving `pretalx_data` with pages of two results"""
+    page_size = 2
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rstrip('/').rsplit('/', 1)[-1]
+        results = pretalx_data[resource]
+        offset = int(request.url.params.get('offset', 0))
+        next_url = None
+        if offset + page_size < len(results):
+            next_url = str(request.url.copy_merge_params({'limit': page_size, 'offset': offset + page_size}))
+        page = {'count': len(results), 'next': next_url, 'results': results[offset : offset + page_size]}
+        return httpx.Response(200, json=page)
+
+    return handler
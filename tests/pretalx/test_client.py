@@ -1,10 +1,22 @@
 """These tests will only run if you have set up an Pretalx Account"""
 
+import asyncio
+import math
 import os
+import threading
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+import httpx
 import pytest
 
+from pytanis.pretalx.async_client import AsyncPretalxClient
+from pytanis.pretalx.cache import HTTPCache
+from pytanis.pretalx.client import PaginationError, PretalxClient
+from pytanis.pretalx.types import Tag
+from pytanis.utils import RetryPolicy
+
 EVENT_SLUG = 'pyconde-pydata-berlin-2023'
 
 
@@ -102,3 +114,174 @@ def test_tags_endpoint(pretalx_client):
 
 
 # ToDo: Add check for single tag too
+
+
+ME = {'name': 'Pytanis', 'email': 'pytanis@host.com', 'timezone': 'UTC'}
+
+
+def test_http_session(mock_pretalx_client):
+    client = mock_pretalx_client(lambda request: httpx.Response(200, json=ME))
+    with client:
+        session = client.http_client
+        assert client.me().name == 'Pytanis'
+        assert client.me().name == 'Pytanis'
+        assert client.http_client is session
+    assert client._client is None
+    assert session.is_closed
+
+
+def test_http_session_auth(tmp_config):
+    with PretalxClient() as client:
+        assert client.http_client.auth.api_key == '932ndsf9uk32nf9sdkn3454532nj32jn'
+
+
+def test_http_session_is_shared_by_threads(tmp_config):
+    with PretalxClient() as client, ThreadPoolExecutor(max_workers=8) as executor:
+        barrier = threading.Barrier(8)
+
+        def get_session():
+            barrier.wait()
+            return client.http_client
+
+        sessions = list(executor.map(lambda _: get_session(), range(8)))
+        assert all(session is client._client for session in sessions)
+
+
+def _paginated_handler(n_results: int, page_size: int):
+    """Handler of a mocked Pretalx API returning `n_results` tags on pages of size `page_size`"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get('offset', 0))
+        results = [
+            {'tag': f'tag{i}', 'description': {'en': f'Tag {i}'}, 'color': '#000000'}
+            for i in range(offset, min(offset + page_size, n_results))
+        ]
+        next_offset = offset + page_size
+        next_url = None
+        if next_offset < n_results:
+            next_url = str(request.url.copy_merge_params({'limit': page_size, 'offset': next_offset}))
+        return httpx.Response(200, json={'count': n_results, 'next': next_url, 'previous': None, 'results': results})
+
+    return handler
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_pagination(mock_pretalx_client, concurrency):
+    client = mock_pretalx_client(_paginated_handler(11, 2), concurrency=concurrency)
+    count, tags = client.tags(EVENT_SLUG)
+    assert count == 11
+    assert [tag.tag for tag in tags] == [f'tag{i}' for i in range(11)]
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_async_client_pagination(tmp_config, concurrency):
+    async def get_tags(*, blocking: bool, stream: bool = False) -> tuple[int, list[str]]:
+        async with AsyncPretalxClient(blocking=blocking, concurrency=concurrency, stream=stream) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(_paginated_handler(7, 3)))
+            client.set_throttling(calls=1000, seconds=1)
+            count, tags = await client.tags(EVENT_SLUG)
+            return count, [tag.tag async for tag in tags if isinstance(tag, Tag)]
+
+    expected = [f'tag{i}' for i in range(7)]
+    assert asyncio.run(get_tags(blocking=False)) == (7, expected)
+    assert asyncio.run(get_tags(blocking=True)) == (7, expected)
+    assert asyncio.run(get_tags(blocking=False, stream=True)) == (7, expected)
+    assert asyncio.run(get_tags(blocking=True, stream=True)) == (7, expected)
+
+
+def test_async_prefetching_stops_when_closed(tmp_config):
+    paginated_handler = _paginated_handler(20, page_size=2)
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if int(request.url.params.get('offset', 0)) > 2:
+            await asyncio.sleep(10)
+        return paginated_handler(request)
+
+    async def close_after_first_pages() -> set[asyncio.Task]:
+        async with AsyncPretalxClient(concurrency=3) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(slow_handler))
+            client.set_throttling(calls=1000, seconds=1)
+            _, tags = await client.tags(EVENT_SLUG)
+            assert isinstance(tags, AsyncGenerator)
+            assert [(await anext(tags)).tag for _ in range(4)] == [f'tag{i}' for i in range(4)]
+            await tags.aclose()
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(close_after_first_pages()) == set()
+
+
+def test_http_cache(mock_pretalx_client, tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=ME, headers={'ETag': '"v1"'})
+
+    client = mock_pretalx_client(handler, cache=HTTPCache(tmp_path))
+    assert client.me().name == 'Pytanis'
+    assert client.me().name == 'Pytanis'
+    assert [resp.headers.get('If-None-Match') for resp in requests] == [None, '"v1"']
+
+    client.cache = HTTPCache(tmp_path, ttl=math.inf)
+    assert client.me().name == 'Pytanis'
+    assert len(requests) == 2
+
+
+def test_rate_limited_request_is_repeated(mock_pretalx_client):
+    responses = [httpx.Response(429, headers={'Retry-After': '0'}), httpx.Response(200, json=ME)]
+    client = mock_pretalx_client(lambda request: responses.pop(0))
+    rate = client.rate_limiter.rate
+    assert client.me().name == 'Pytanis'
+    assert client.rate_limiter.rate == rate / 2
+
+
+def test_transient_errors_are_retried(mock_pretalx_client):
+    responses = [httpx.ConnectError('connection reset'), httpx.Response(502), httpx.Response(200, json=ME)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resp = responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+    client = mock_pretalx_client(handler, retry=RetryPolicy(backoff=0.0))
+    assert client.me().name == 'Pytanis'
+    assert not responses
+
+
+@pytest.mark.parametrize('blocking', [False, True])
+def test_resume_failed_pagination(mock_pretalx_client, blocking):
+    paginated_handler = _paginated_handler(10, page_size=3)
+    outage = {'active': True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if outage['active'] and request.url.params.get('offset') == '6':
+            return httpx.Response(503)
+        return paginated_handler(request)
+
+    client = mock_pretalx_client(handler, blocking=blocking, retry=RetryPolicy(retries=1, backoff=0.0))
+    tags = []
+    with pytest.raises(PaginationError) as exc_info:
+        _, results = client.tags('event')
+        tags.extend(results)
+    err = exc_info.value
+    tags.extend(err.results)
+    assert [tag.tag for tag in tags] == [f'tag{i}' for i in range(6)]
+    assert err.cursor.model is Tag
+
+    outage['active'] = False
+    count, results = client.resume(err.cursor)
+    assert count == 10
+    assert [tag.tag for tag in results] == [f'tag{i}' for i in range(6, 10)]
+
+
+@pytest.mark.parametrize('validation', ['batch', 'raw'])
+def test_validation_modes(mock_pretalx_client, pretalx_handler, pretalx_data, validation):
+    _, subs = mock_pretalx_client(pretalx_handler).submissions('event')
+    _, fast_subs = mock_pretalx_client(pretalx_handler, validation=validation).submissions('event')
+    if validation == 'raw':
+        assert list(fast_subs) == pretalx_data['submissions']
+    else:
+        assert list(fast_subs) == list(subs)
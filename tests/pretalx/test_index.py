@@ -0,0 +1,31 @@
+from pytanis.pretalx.index import EventIndex
+from pytanis.pretalx.types import Review, Speaker, Submission
+
+
+def test_event_index(pretalx_data):
+    subs = [Submission.model_validate(sub) for sub in pretalx_data['submissions']]
+    speakers = [Speaker.model_validate(speaker) for speaker in pretalx_data['speakers']]
+    reviews = [Review.model_validate(review) for review in pretalx_data['reviews']]
+    index = EventIndex(subs, speakers, reviews)
+
+    assert [sub.code for sub in index.submissions_of('SPK1')] == ['SUB1', 'SUB2']
+    assert [sub.code for sub in index.submissions_tagged(2)] == ['SUB2']
+    assert [review.id for review in index.reviews_of('SUB1')] == [1, 2]
+    assert [sub.code for sub in index.submissions_reviewed_by('rev1')] == ['SUB1', 'SUB2']
+    assert [answer.id for answer in index.answers_to(10)] == [1, 5]
+    assert index.submissions_of('UNKNOWN') == ()
+
+    # incremental updates replace objects and their links
+    sub2 = subs[1].model_copy(update={'speakers': subs[2].speakers, 'tag_ids': [3], 'answers': []})
+    index.add_submissions([sub2])
+    assert [sub.code for sub in index.submissions_of('SPK1')] == ['SUB1']
+    assert [sub.code for sub in index.submissions_of('SPK3')] == ['SUB3', 'SUB2']
+    assert index.submissions_tagged(2) == ()
+    assert [answer.id for answer in index.answers_to(11)] == [2]
+
+    index.add_reviews([reviews[0].model_copy(update={'user': 'rev3'})])
+    assert [sub.code for sub in index.submissions_reviewed_by('rev1')] == ['SUB2']
+    assert [review.id for review in index.reviews_by('rev3')] == [1]
+
+    index.remove_speaker('SPK1')
+    assert index.answers_to(20) == ()
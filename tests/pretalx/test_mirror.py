@@ -0,0 +1,86 @@
+import httpx
+
+from pytanis.pretalx.mirror import EventMirror
+
+EVENT_SLUG = 'pyconde-pydata-berlin-2023'
+
+
+def _review(id: int, updated: str, score: float = 1.0) -> dict:  # noqa: A002
+    return {
+        'id': id,
+        'submission': f'SUB{id}',
+        'user': 'reviewer',
+        'text': None,
+        'score': score,
+        'created': '2023-01-01T00:00:00+00:00',
+        'updated': updated,
+        'answers': [],
+    }
+
+
+def test_incremental_review_sync(mock_pretalx_client, tmp_path):
+    reviews = [_review(i, f'2023-01-{i + 1:02}T00:00:00+00:00') for i in range(5)]
+    requested_offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = sorted(reviews, key=lambda r: r['updated'], reverse=request.url.params.get('ordering') == '-updated')
+        offset = int(request.url.params.get('offset', 0))
+        requested_offsets.append(offset)
+        next_url = None
+        if offset + 2 < len(results):
+            next_url = str(request.url.copy_merge_params({'limit': 2, 'offset': offset + 2}))
+        return httpx.Response(
+            200, json={'count': len(results), 'next': next_url, 'results': results[offset : offset + 2]}
+        )
+
+    mirror = EventMirror(mock_pretalx_client(handler), EVENT_SLUG, tmp_path / 'mirror.sqlite')
+    (stats,) = mirror.sync(['reviews'])
+    assert (stats.inserted, stats.incremental) == (5, False)
+
+    reviews[1] = _review(1, '2023-02-01T00:00:00+00:00', score=2.0)
+    requested_offsets.clear()
+    (stats,) = mirror.sync(['reviews'])
+    # the review at the checkpoint is fetched again but not rewritten, it ends the first page
+    assert (stats.fetched, stats.updated, stats.changed, stats.incremental) == (2, 1, ['1'], True)
+    assert requested_offsets == [0, 2]
+    assert {review.id: review.score for review in mirror.reviews()}[1] == 2.0
+
+    df = mirror.query('SELECT submission, score FROM reviews WHERE score > 1')
+    assert df.to_dict('records') == [{'submission': 'SUB1', 'score': 2.0}]
+
+    # a review saved with the same timestamp as the checkpoint after the last sync
+    reviews.append(_review(5, '2023-02-01T00:00:00+00:00'))
+    (stats,) = mirror.sync(['reviews'])
+    assert (stats.inserted, stats.changed) == (1, ['5'])
+
+    del reviews[0]
+    (stats,) = mirror.sync(['reviews'], full=True)
+    assert stats.deleted == 1
+    mirror.close()
+
+
+def test_sync_continues_if_order_breaks(mock_pretalx_client, tmp_path):
+    reviews = [_review(i, f'2023-01-{i + 1:02}T00:00:00+00:00') for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = sorted(reviews, key=lambda r: r['id'], reverse=True)  # ignores the requested ordering
+        offset = int(request.url.params.get('offset', 0))
+        next_url = None
+        if offset + 2 < len(results):
+            next_url = str(request.url.copy_merge_params({'limit': 2, 'offset': offset + 2}))
+        return httpx.Response(
+            200, json={'count': len(results), 'next': next_url, 'results': results[offset : offset + 2]}
+        )
+
+    mirror = EventMirror(mock_pretalx_client(handler), EVENT_SLUG, tmp_path / 'mirror.sqlite')
+    mirror.sync(['reviews'])
+    assert mirror.checkpoint('reviews')[0] == '2023-01-05T00:00:00+00:00'
+
+    # the first page is still in order, the second one is not
+    for i, day in [(4, 2), (3, 1), (1, 3)]:
+        reviews[i] = _review(i, f'2023-02-{day:02}T00:00:00+00:00', score=2.0)
+    (stats,) = mirror.sync(['reviews'])
+    assert (stats.fetched, stats.updated, stats.incremental) == (5, 3, False)
+    assert mirror.checkpoint('reviews')[0] == '2023-02-03T00:00:00+00:00'
+    assert {review.id for review in mirror.reviews() if review.score == 2.0} == {1, 3, 4}
+    mirror.close()
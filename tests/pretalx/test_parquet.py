@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from pytanis.pretalx.snapshot import EventSnapshot
+from pytanis.pretalx.types import Speaker, Submission
+from pytanis.pretalx.utils import Col, subs_as_df
+
+pytest.importorskip('pyarrow')
+
+from pytanis.pretalx.parquet import (  # noqa: E402
+    load_df,
+    load_models,
+    load_snapshot,
+    load_table,
+    save_df,
+    save_models,
+    save_snapshot,
+)
+
+EVENT_SLUG = 'pyconde-pydata-berlin-2023'
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow'])
+def test_models_roundtrip(tmp_path, pretalx_data, suffix):
+    subs = [Submission.model_validate(sub) for sub in pretalx_data['submissions']]
+    path = tmp_path / f'subs{suffix}'
+    save_models(subs, path)
+
+    assert load_models(Submission, path) == subs
+    assert load_models(Submission, path, memory_map=False) == subs
+    table = load_table(path, columns=['code', 'speakers'])
+    assert table.column_names == ['code', 'speakers']
+    assert table.column('speakers').to_pylist()[0][1]['name'] == 'Bob'
+
+
+def test_df_roundtrip(tmp_path, pretalx_data):
+    df = subs_as_df([Submission.model_validate(sub) for sub in pretalx_data['submissions']], with_questions=True)
+    path = tmp_path / 'subs.parquet'
+    save_df(df, path)
+
+    df[Col.created] = df[Col.created].dt.tz_convert('UTC')  # the time zone of pydantic is stored as UTC
+    pd.testing.assert_frame_equal(load_df(path), df)
+    assert load_df(path, columns=[Col.submission, Col.speaker_code])[Col.speaker_code].tolist() == [
+        ['SPK1', 'SPK2'],
+        ['SPK1'],
+        ['SPK3'],
+    ]
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_snapshot_roundtrip(tmp_path, mock_pretalx_client, pretalx_handler, suffix):
+    snapshot = EventSnapshot.fetch(mock_pretalx_client(pretalx_handler), EVENT_SLUG)
+    save_snapshot(snapshot, tmp_path / 'snapshot', suffix=suffix)
+
+    loaded = load_snapshot(tmp_path / 'snapshot')
+    assert dict(loaded) == dict(snapshot)
+    assert [sub.code for sub in loaded.submissions_of('SPK1')] == ['SUB1', 'SUB2']
+    assert isinstance(loaded.speakers[0], Speaker)
+
+    with pytest.raises(FileNotFoundError):
+        load_snapshot(tmp_path)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from pytanis.pretalx.types import Speaker, Submission
+from pytanis.pretalx.utils import Col, speakers_as_df, subs_as_df
+
+
+def test_subs_as_df(pretalx_data):
+    subs = [Submission.model_validate(sub) for sub in pretalx_data['submissions']]
+    df = subs_as_df(subs, with_questions=True)
+
+    assert list(df.columns[-2:]) == ['Q: Question 10', 'Q: Question 11']
+    assert df[Col.speaker_code].tolist() == [['SPK1', 'SPK2'], ['SPK1'], ['SPK3']]
+    assert df[Col.duration].dtype == np.int64
+    assert df['Q: Question 11'].tolist()[:2] == ['Yes', 'No']
+    assert pd.isna(df.loc[2, 'Q: Question 11'])
+    pd.testing.assert_frame_equal(subs_as_df(subs), df.iloc[:, :-2])
+    assert subs_as_df([]).empty
+
+
+def test_speakers_as_df(pretalx_data):
+    speakers = [Speaker.model_validate(speaker) for speaker in pretalx_data['speakers']]
+    df = speakers_as_df(speakers, with_questions=True)
+
+    # answers to submission questions are left out
+    assert list(df.columns) == [
+        Col.speaker_code,
+        Col.speaker_name,
+        Col.email,
+        Col.biography,
+        Col.submission,
+        'Q: Question 20',
+    ]
+    assert df['Q: Question 20'].tolist()[0] == 'ACME'
+    assert df[Col.submission].tolist() == [['SUB1', 'SUB2'], ['SUB1'], ['SUB3']]
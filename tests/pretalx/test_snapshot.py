@@ -0,0 +1,66 @@
+import httpx
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from pytanis.pretalx.client import PretalxClient
+from pytanis.pretalx.snapshot import EventSnapshot
+from pytanis.pretalx.utils import Col
+
+EVENT_SLUG = 'pyconde-pydata-berlin-2023'
+
+
+def test_fetch_snapshot(mock_pretalx_client, pretalx_handler):
+    snapshot = EventSnapshot.fetch(mock_pretalx_client(pretalx_handler), EVENT_SLUG)
+
+    assert [sub.code for sub in snapshot.submissions] == ['SUB1', 'SUB2', 'SUB3']
+    assert len(snapshot.reviews) == 4
+    assert snapshot.speaker('SPK3').name == 'Cleo'
+    assert [sub.code for sub in snapshot.submissions_of('SPK1')] == ['SUB1', 'SUB2']
+    assert [review.user for review in snapshot.reviews_of('SUB1')] == ['rev1', 'rev2']
+    assert snapshot.reviews_of('UNKNOWN') == ()
+    assert [answer.id for answer in snapshot.answers_to(10)] == [1, 5]
+    assert snapshot.question(20).target == 'speaker'
+
+    with pytest.raises(ValidationError):
+        snapshot.event_slug = 'other'
+
+
+def test_fetch_snapshot_opens_one_session(tmp_config, monkeypatch, pretalx_handler):
+    sessions = []
+    http_client = httpx.Client
+
+    def mock_http_client(**kwargs) -> httpx.Client:
+        sessions.append(http_client(**kwargs, transport=httpx.MockTransport(pretalx_handler)))
+        return sessions[-1]
+
+    monkeypatch.setattr(httpx, 'Client', mock_http_client)
+    with PretalxClient() as client:
+        client.set_throttling(calls=1000, seconds=1)
+        assert client._client is None
+        snapshot = EventSnapshot.fetch(client, EVENT_SLUG)
+        assert sessions == [client._client]
+    assert len(snapshot.submissions) == 3
+
+
+def test_snapshot_as_tables(mock_pretalx_client, pretalx_handler):
+    tables = EventSnapshot.fetch(mock_pretalx_client(pretalx_handler), EVENT_SLUG).as_tables()
+
+    df = tables.submission_speakers.merge(tables.speakers, on=Col.speaker_id)
+    df = df.merge(tables.submissions, on=Col.submission_id)
+    assert sorted(zip(df[Col.submission], df[Col.speaker_name], strict=True)) == [
+        ('SUB1', 'Ada'),
+        ('SUB1', 'Bob'),
+        ('SUB2', 'Ada'),
+        ('SUB3', 'Cleo'),
+    ]
+    assert isinstance(tables.submissions[Col.track].dtype, pd.CategoricalDtype)
+
+    assert tables.answers[Col.answer_id].tolist() == [1, 2, 3, 4, 5]
+    answers = tables.answers.merge(tables.speakers, on=Col.speaker_id)
+    assert answers[[Col.speaker_code, Col.question_id, Col.answer]].values.tolist() == [['SPK1', 20, 'ACME']]
+
+    reviews = tables.reviews.merge(tables.submissions, on=Col.submission_id)
+    assert reviews.groupby(Col.submission, observed=True)[Col.review_score].mean().to_dict() == pytest.approx(
+        {'SUB1': 3.0, 'SUB2': 3.0, 'SUB3': float('nan')}, nan_ok=True
+    )
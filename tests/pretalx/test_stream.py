@@ -0,0 +1,48 @@
+import json
+
+import httpx
+import pytest
+
+from pytanis.pretalx.stream import PageDecoder
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 10_000])
+def test_page_decoder(chunk_size):
+    results = [{'id': i, 'score': 12345.5, 'text': 'Grüße, "Pytanis" 🐍', 'answers': [[], {}]} for i in range(5)]
+    text = json.dumps({'count': 5, 'next': None, 'previous': None, 'results': results}, indent=1, ensure_ascii=False)
+    decoder = PageDecoder()
+    decoded = []
+    for i in range(0, len(text), chunk_size):
+        decoded.extend(decoder.feed(text[i : i + chunk_size]))
+        assert decoded == results[: len(decoded)]
+    decoded.extend(decoder.close())
+    assert decoded == results
+    assert decoder.meta == {'count': 5, 'next': None, 'previous': None}
+
+
+def test_page_decoder_value_at_chunk_end():
+    decoder = PageDecoder()
+    assert decoder.feed('[{"id": 1}') == [{'id': 1}]  # complete without waiting for the next chunk
+    assert decoder.feed(', {"text": "a\\') == []
+    assert decoder.feed('"}"}, 2') == [{'text': 'a"}'}]  # escaped quote split across chunks
+    assert decoder.feed(']') == [2]
+    assert decoder.close() == []
+
+
+def test_page_decoder_truncated():
+    decoder = PageDecoder()
+    assert decoder.feed('[{"id": 1}, {"id"') == [{'id': 1}]
+    with pytest.raises(json.JSONDecodeError):
+        decoder.close()
+
+
+@pytest.mark.parametrize('blocking', [False, True])
+def test_streamed_pagination(mock_pretalx_client, pretalx_handler, pretalx_data, blocking):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = pretalx_handler(request).content
+        return httpx.Response(200, content=(body[i : i + 16] for i in range(0, len(body), 16)))
+
+    client = mock_pretalx_client(handler, blocking=blocking, stream=True, validation='raw')
+    count, subs = client.submissions('event')
+    assert count == 3
+    assert list(subs) == pretalx_data['submissions']
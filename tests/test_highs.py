@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+pyo = pytest.importorskip('pyomo.environ')
+highspy = pytest.importorskip('highspy')
+
+from pytanis.highs import column_vars, read_sol_columns, read_sol_file, set_solution_from_file  # noqa: E402
+
+SOL_FILE = """Model status
+Optimal
+
+# Primal solution values
+Feasible
+Objective 5
+# Columns 5
+x(a_1) 1
+x(a_2) 0
+x(b-c_1) -0
+vbSchedule(T1_Monday)_binary_indicator_var 1e-09
+y 2.5
+# Rows 1
+c_u_c_ 2.5
+
+# Dual solution values
+None
+"""
+
+
+@pytest.fixture
+def sol_file(tmp_path):
+    file_name = tmp_path / 'model.sol'
+    file_name.write_text(SOL_FILE, encoding='utf8')
+    return file_name
+
+
+def test_read_sol_columns(sol_file):
+    sol = read_sol_columns(sol_file)
+
+    assert sol.names == ['x(a_1)', 'x(a_2)', 'x(b-c_1)', 'vbSchedule(T1_Monday)_binary_indicator_var', 'y']
+    np.testing.assert_array_equal(sol.values, [1.0, 0.0, 0.0, 1e-09, 2.5])
+    assert sol.objective == 5.0
+    assert sol.as_dict()['y'] == 2.5
+
+    sol = read_sol_columns(sol_file, names=False)
+    assert sol.names is None
+    assert len(sol.values) == 5
+
+
+def test_read_sol_file(sol_file, tmp_path):
+    sol_file.write_text(SOL_FILE.replace('x(b-c_1)', 'x(b_c_1)'), encoding='utf8')
+    assert dict(read_sol_file(sol_file)) == {
+        'x[a,1]': 1.0,
+        'x[a,2]': 0.0,
+        'x[b,c,1]': 0.0,
+        'vbSchedule[T1,Monday].binary_indicator_var': 1e-09,
+        'y': 2.5,
+    }
+
+    file_name = tmp_path / 'infeasible.sol'
+    file_name.write_text('Model status\nInfeasible\n\n# Primal solution values\nNone\n', encoding='utf8')
+    with pytest.raises(ValueError, match='No primal column values.*None.*Infeasible'):
+        read_sol_columns(file_name)
+
+
+def test_read_sol_columns_without_feasible_primal(sol_file):
+    # the columns of the dual solution must not be taken for the primal ones
+    dual_only = '# Primal solution values\nNone\n\n# Dual solution values\nFeasible\n# Columns 1\nx(a_1) 0\n'
+    sol_file.write_text(f'Model status\nUnbounded\n\n{dual_only}', encoding='utf8')
+    with pytest.raises(ValueError, match='primal solution is None, model status is Unbounded'):
+        read_sol_columns(sol_file)
+
+    sol_file.write_text(SOL_FILE.replace('# Primal solution values', '# Other values'), encoding='utf8')
+    with pytest.raises(ValueError, match='primal solution is missing'):
+        read_sol_columns(sol_file)
+
+
+def build_model():
+    model = pyo.ConcreteModel()
+    model.sTalks = pyo.Set(initialize=['T1', 'T2', 'T3'], ordered=True)
+    model.sSlots = pyo.Set(initialize=['Mon-1', 'Mon-2', 'Tue-1'], ordered=True)
+    model.vbSchedule = pyo.Var(model.sTalks, model.sSlots, domain=pyo.Binary)
+    model.ctTalk = pyo.Constraint(model.sTalks, rule=lambda m, t: sum(m.vbSchedule[t, :]) == 1)
+    model.ctSlot = pyo.Constraint(model.sSlots, rule=lambda m, s: sum(m.vbSchedule[:, s]) <= 1)
+    prefs = {('T1', 'Tue-1'): 3, ('T2', 'Mon-1'): 2, ('T3', 'Mon-2'): 1}
+    model.obj = pyo.Objective(
+        expr=sum(prefs.get(idx, 0) * var for idx, var in model.vbSchedule.items()), sense=pyo.maximize
+    )
+    return model
+
+
+@pytest.fixture
+def solved_model(tmp_path):
+    model = build_model()
+    model.write(str(tmp_path / 'model.mps'), io_options={'symbolic_solver_labels': True})
+    highs = highspy.Highs()
+    highs.silent()
+    highs.readModel(str(tmp_path / 'model.mps'))
+    highs.run()
+    highs.writeSolution(str(tmp_path / 'model.sol'), 0)
+    return model, tmp_path / 'model.sol'
+
+
+def test_set_solution_from_file(solved_model):
+    model, sol_file = solved_model
+    assert len(set_solution_from_file(model, sol_file)) == 9
+    assert {idx for idx, var in model.vbSchedule.items() if var.value > 0.5} == {
+        ('T1', 'Tue-1'),
+        ('T2', 'Mon-1'),
+        ('T3', 'Mon-2'),
+    }
+    assert column_vars(model, sol_file) is column_vars(model, sol_file)  # cached on the model
+    # writing the model again creates a new symbol map, so the mapping is determined again
+    cached = column_vars(model, sol_file)
+    model.write(str(sol_file.with_suffix('.mps')), io_options={'symbolic_solver_labels': True})
+    assert column_vars(model, sol_file) is not cached
+
+    # the model written again as LP has another order of the columns
+    model.write(str(sol_file.with_suffix('.lp')), io_options={'symbolic_solver_labels': True})
+    highs = highspy.Highs()
+    highs.silent()
+    highs.readModel(str(sol_file.with_suffix('.lp')))
+    highs.run()
+    highs.writeSolution(str(sol_file.with_name('lp.sol')), 0)
+    assert read_sol_columns(sol_file.with_name('lp.sol')).names != read_sol_columns(sol_file).names
+    for var in model.vbSchedule.values():
+        var.set_value(None)
+    set_solution_from_file(model, sol_file.with_name('lp.sol'))
+    assert {idx for idx, var in model.vbSchedule.items() if var.value > 0.5} == {
+        ('T1', 'Tue-1'),
+        ('T2', 'Mon-1'),
+        ('T3', 'Mon-2'),
+    }
+
+    # a model built again is matched by the labels of its variables
+    model = build_model()
+    chosen = set_solution_from_file(model, sol_file, nonzero=True)
+    assert sorted(var.index() for var in chosen) == [('T1', 'Tue-1'), ('T2', 'Mon-1'), ('T3', 'Mon-2')]
+    assert model.vbSchedule['T1', 'Mon-1'].value is None
+
+    other = pyo.ConcreteModel()
+    other.x = pyo.Var()
+    with pytest.raises(ValueError, match='9 columns'):
+        set_solution_from_file(other, sol_file)
@@ -0,0 +1,275 @@
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+
+from pytanis.review import (
+    AssignmentDiff,
+    Col,
+    Reassignment,
+    ReviewMonitor,
+    ReviewScores,
+    aggregate_scores,
+    assign_reviews,
+    diff_assignments,
+    normalize_scores,
+    preference_matrix,
+    read_assignment_as_df,
+    read_assignments,
+    reviewer_stats,
+    save_assignments,
+    save_assignments_as_json,
+)
+
+
+@pytest.fixture
+def revs_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Id': [1, 2, 3, 4, 5, 6],
+        Col.submission: ['SUB1', 'SUB1', 'SUB2', 'SUB2', 'SUB3', 'SUB3'],
+        Col.pretalx_user: ['rev1', 'rev2', 'rev1', 'rev2', 'rev1', 'rev3'],
+        Col.review_score: [4.0, 2.0, 2.0, 2.0, np.nan, 1.0],
+    })
+
+
+def test_normalize_scores(revs_df):
+    df = normalize_scores(revs_df)
+
+    assert df[Col.debiased_review_score].tolist() == pytest.approx([1.0, 0.0, -1.0, 0.0, np.nan, 0.0], nan_ok=True)
+    assert df[Col.z_review_score].tolist() == pytest.approx([1.0, 0.0, -1.0, 0.0, np.nan, 0.0], nan_ok=True)
+    assert df[Col.rank_review_score].tolist() == pytest.approx([1.0, 0.75, 0.5, 0.75, np.nan, 1.0], nan_ok=True)
+
+    stats = reviewer_stats(revs_df).set_index(Col.pretalx_user)
+    assert stats[Col.nreviews].to_dict() == {'rev1': 2, 'rev2': 2, 'rev3': 1}
+    assert stats.loc['rev1', Col.reviewer_mean_score] == 3.0
+
+
+def test_aggregate_scores(revs_df):
+    df = aggregate_scores(revs_df).set_index(Col.submission)
+
+    assert df.loc['SUB1', Col.review_score] == [4.0, 2.0]
+    assert df[Col.avg_review_score].to_dict() == {'SUB1': 3.0, 'SUB2': 2.0, 'SUB3': 1.0}
+    assert df[Col.avg_debiased_review_score].to_dict() == {'SUB1': 0.5, 'SUB2': -0.5, 'SUB3': 0.0}
+    assert df[Col.nreviews].to_dict() == {'SUB1': 2, 'SUB2': 2, 'SUB3': 1}
+
+
+def test_incremental_review_scores(revs_df):
+    scores = ReviewScores(revs_df.iloc[:4])
+    scores.update(revs_df.iloc[4:])
+    scores.update(revs_df.iloc[[2]].assign(**{Col.review_score: 3.0}))
+
+    full = ReviewScores(revs_df.assign(**{Col.review_score: [4.0, 2.0, 3.0, 2.0, np.nan, 1.0]}))
+    pd.testing.assert_frame_equal(scores.reviews, full.reviews)
+    pd.testing.assert_frame_equal(scores.per_submission, full.per_submission)
+    assert scores.per_submission[Col.avg_review_score].tolist() == [3.0, 2.5, 1.0]
+
+
+def test_assign_reviews():
+    subs_df = pd.DataFrame({
+        Col.submission: ['SUB1', 'SUB2', 'SUB3', 'SUB4'],
+        Col.track: ['PyData', 'PyData', 'PyCon', None],
+        Col.rem_nreviews: [2, 1, 1, 0],
+    })
+    reviewers_df = pd.DataFrame({
+        Col.email: ['rev1@host.com', 'rev2@host.com', 'rev3@host.com', 'rev4@host.com'],
+        Col.track_prefs: [['PyData'], ['PyData', 'PyCon'], ['PyCon'], []],
+        Col.curr_assignments: [['SUB1'], [], [], []],
+        Col.all_proposals: [None, None, None, 'x'],
+    })
+    assert preference_matrix(subs_df, reviewers_df).tolist() == [
+        [True, True, False, False],
+        [True, True, True, False],
+        [False, False, True, False],
+        [False, False, False, False],
+    ]
+
+    df = assign_reviews(subs_df, reviewers_df, buffer=1, seed=42).set_index(Col.email)
+    assignments = df[Col.curr_assignments].to_dict()
+    assert assignments['rev4@host.com'] == ['SUB1', 'SUB2', 'SUB3', 'SUB4']
+    assert assignments['rev1@host.com'][0] == 'SUB1'
+    # SUB1 needs 3 reviewers but only rev1 and rev2 prefer PyData, so rev3 is assigned without preference
+    for sub, nreviewers in {'SUB1': 3, 'SUB2': 2, 'SUB3': 2, 'SUB4': 0}.items():
+        reviewers = [email for email, subs in assignments.items() if sub in subs and email != 'rev4@host.com']
+        assert len(reviewers) == nreviewers
+    assert sorted(assignments['rev3@host.com']) == ['SUB1', 'SUB3']
+    assert df[Col.nassignments].to_dict() == {
+        'rev1@host.com': 2,
+        'rev2@host.com': 3,
+        'rev3@host.com': 2,
+        'rev4@host.com': 4,
+    }
+
+
+def test_reassignment():
+    subs_df = pd.DataFrame({
+        Col.submission: ['SUB1', 'SUB2', 'SUB3'],
+        Col.track: ['PyData', 'PyData', 'PyCon'],
+        Col.target_nreviews: [2, 2, 1],
+    })
+    reviewers_df = pd.DataFrame({
+        Col.email: ['rev1@host.com', 'rev2@host.com', 'rev3@host.com'],
+        Col.pretalx_user: ['rev1', 'rev2', 'rev3'],
+        Col.track_prefs: [['PyData'], ['PyData', 'PyCon'], ['PyData', 'PyCon']],
+    })
+    assign_df = pd.DataFrame({
+        Col.email: ['rev1@host.com', 'rev2@host.com', 'rev3@host.com'],
+        Col.curr_assignments: [['SUB1', 'SUB2'], ['SUB1', 'SUB2'], ['SUB3']],
+    })
+    reassignment = Reassignment(assign_df, subs_df, reviewers_df)
+
+    assert reassignment.update(pd.DataFrame(columns=[Col.pretalx_user, Col.submission, Col.review_score])).nchanges == 0
+
+    revs_df = pd.DataFrame({
+        Col.pretalx_user: ['rev1', 'rev2', 'rev3'],
+        Col.submission: ['SUB1', 'SUB1', 'SUB2'],
+        Col.review_score: [2.0, 3.0, np.nan],
+    })
+    assert reassignment.update(revs_df).nchanges == 0  # SUB1 is done, SUB2 needs the assigned reviews
+
+    # rev3 reviews SUB2 without assignment, so the open assignment of rev2 is freed
+    diff = reassignment.update(revs_df.iloc[[2]].assign(**{Col.review_score: 1.0}))
+    assert diff == AssignmentDiff(added={'rev3@host.com': ['SUB2']}, removed={})
+    diff = reassignment.update(
+        pd.DataFrame({Col.pretalx_user: ['rev1'], Col.submission: ['SUB2'], Col.review_score: [4.0]})
+    )
+    assert diff == AssignmentDiff(added={}, removed={'rev2@host.com': ['SUB2']})
+    assert reassignment.assignments[Col.curr_assignments].tolist() == [['SUB1', 'SUB2'], ['SUB1'], ['SUB3', 'SUB2']]
+
+
+def test_reassignment_covers_new_targets():
+    subs_df = pd.DataFrame({Col.submission: ['SUB1'], Col.track: ['PyData'], Col.target_nreviews: [2]})
+    reviewers_df = pd.DataFrame({
+        Col.email: ['rev1@host.com', 'rev2@host.com', 'rev3@host.com'],
+        Col.pretalx_user: ['rev1', 'rev2', 'rev3'],
+        Col.track_prefs: [['PyData'], ['PyCon'], ['PyData']],
+    })
+    assign_df = pd.DataFrame({Col.email: ['rev1@host.com'], Col.curr_assignments: [['SUB1']]})
+    reassignment = Reassignment(assign_df, subs_df, reviewers_df, buffer=2)
+
+    revs_df = pd.DataFrame({Col.pretalx_user: ['rev1'], Col.submission: ['SUB1'], Col.review_score: [3.0]})
+    diff = reassignment.update(revs_df)
+    # one more review is needed, with the buffer two more reviewers, the one with preference first
+    assert diff.added == {'rev3@host.com': ['SUB1'], 'rev2@host.com': ['SUB1']}
+    assert diff.nchanges == 2
+
+
+def test_reassignment_zero_target():
+    subs_df = pd.DataFrame({
+        Col.submission: ['SUB1', 'SUB2'],
+        Col.track: ['PyData', 'PyData'],
+        Col.target_nreviews: [1, 0],
+    })
+    reviewers_df = pd.DataFrame({
+        Col.email: ['rev1@host.com'],
+        Col.pretalx_user: ['rev1'],
+        Col.track_prefs: [['PyData']],
+    })
+    assign_df = pd.DataFrame({Col.email: ['rev1@host.com'], Col.curr_assignments: [['SUB1', 'SUB2']]})
+    reassignment = Reassignment(assign_df, subs_df, reviewers_df)
+
+    # SUB2 needs no reviews, so its assignment is freed although it has none yet
+    diff = reassignment.update(pd.DataFrame(columns=[Col.pretalx_user, Col.submission, Col.review_score]))
+    assert diff == AssignmentDiff(added={}, removed={'rev1@host.com': ['SUB2']})
+
+
+def test_assignment_files(tmp_path):
+    path = tmp_path / 'assignments.json'
+    df = pd.DataFrame({Col.email: ['ada@host.com', 'bob/x@host.com'], Col.curr_assignments: [['SUB1', 'SUB2'], []]})
+    save_assignments_as_json(df, path)
+
+    assert path.read_text() == '{\n"ada@host.com": ["SUB1", "SUB2"],\n"bob/x@host.com": []\n}'
+    pd.testing.assert_frame_equal(read_assignment_as_df(path), df)
+
+    new = {'ada@host.com': ['SUB2', 'SUB3'], 'cleo@host.com': ['SUB1']}
+    diff = save_assignments(new.items(), path, previous=path)
+    assert diff == AssignmentDiff(
+        added={'ada@host.com': ['SUB3'], 'cleo@host.com': ['SUB1']}, removed={'ada@host.com': ['SUB1']}
+    )
+    assert read_assignments(path) == new
+    assert diff_assignments(new, new).nchanges == 0
+
+
+def test_review_monitor(mock_pretalx_client, tmp_path):
+    def review(id: int, submission: str, user: str, score: float | None, day: int) -> dict:  # noqa: A002
+        return {
+            'id': id,
+            'submission': submission,
+            'user': user,
+            'text': None,
+            'score': score,
+            'created': '2023-02-01T00:00:00+00:00',
+            'updated': f'2023-02-{day:02}T00:00:00+00:00',
+            'answers': [],
+        }
+
+    reviews = [review(1, 'SUB1', 'rev1', 3.0, 1), review(2, 'SUB1', 'rev2', None, 2), review(3, 'SUB2', 'rev1', 1.0, 3)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = sorted(reviews, key=lambda r: r['updated'], reverse=request.url.params.get('ordering') == '-updated')
+        return httpx.Response(200, json={'count': len(results), 'next': None, 'results': results})
+
+    targets = {'SUB1': 2, 'SUB2': 1, 'SUB3': 2}
+    assignments = {'rev1': ['SUB1', 'SUB2'], 'rev2': ['SUB1', 'SUB3']}
+    path = tmp_path / 'progress.json'
+    monitor = ReviewMonitor(mock_pretalx_client(handler), 'event', path, targets=targets, assignments=assignments)
+    assert sorted(monitor.poll()) == [1, 2, 3]
+    assert monitor.per_submission[Col.rem_nreviews].tolist() == [1, 0, 2]
+
+    reviews[1] = review(2, 'SUB1', 'rev2', 4.0, 4)
+    reviews.append(review(4, 'SUB3', 'rev3', 2.0, 5))
+    monitor = ReviewMonitor(mock_pretalx_client(handler), 'event', path, targets=targets, assignments=assignments)
+    changes = []
+    monitor.run(interval=0, polls=2, callback=lambda _, changed: changes.append(sorted(changed)))
+    assert changes == [[2, 4], []]
+    assert monitor.per_submission.set_index(Col.submission)[Col.done_nreviews].to_dict() == {
+        'SUB1': 2,
+        'SUB2': 1,
+        'SUB3': 1,
+    }
+    assert monitor.per_reviewer.values.tolist() == [['rev1', 2, 0], ['rev2', 1, 1], ['rev3', 1, 0]]
+
+    # a review saved with the same timestamp as the checkpoint after the last poll
+    reviews.append(review(5, 'SUB3', 'rev2', 3.0, 5))
+    assert monitor.poll() == [5]
+
+    with pytest.raises(ValueError):
+        ReviewMonitor(mock_pretalx_client(handler), 'other', path)
+
+
+def test_review_monitor_stops_at_checkpoint(mock_pretalx_client):
+    reviews = [
+        {
+            'id': i,
+            'submission': f'SUB{i}',
+            'user': 'rev1',
+            'text': None,
+            'score': 1.0,
+            'created': '2023-02-01T00:00:00+00:00',
+            'updated': f'2023-02-{i:02}T00:00:00+00:00',
+            'answers': [],
+        }
+        for i in range(1, 7)
+    ]
+    requested_offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = sorted(reviews, key=lambda r: r['updated'], reverse=request.url.params.get('ordering') == '-updated')
+        offset = int(request.url.params.get('offset', 0))
+        requested_offsets.append(offset)
+        next_url = None
+        if offset + 2 < len(results):
+            next_url = str(request.url.copy_merge_params({'limit': 2, 'offset': offset + 2}))
+        return httpx.Response(
+            200, json={'count': len(results), 'next': next_url, 'results': results[offset : offset + 2]}
+        )
+
+    monitor = ReviewMonitor(mock_pretalx_client(handler, blocking=True), 'event', targets=1)
+    assert sorted(monitor.poll()) == [1, 2, 3, 4, 5, 6]
+    assert requested_offsets == [0, 2, 4]
+
+    reviews[0] = {**reviews[0], 'score': 2.0, 'updated': '2023-02-07T00:00:00+00:00'}
+    requested_offsets.clear()
+    assert monitor.poll() == [1]
+    # the second page is needed to see that the reviews are older than the checkpoint, the third is not requested
+    assert requested_offsets == [0, 2]
+    assert monitor.progress.since == '2023-02-07T00:00:00+00:00'
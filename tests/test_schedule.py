@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+highspy = pytest.importorskip('highspy')
+
+from pytanis.highs import read_sol_columns  # noqa: E402
+from pytanis.schedule import (  # noqa: E402
+    COMPARISON_COLS,
+    Col,
+    Scenario,
+    ScenarioRunner,
+    ScheduleModel,
+    Weights,
+    parallel_penalty,
+)
+
+SLOT = [Col.day, Col.session, Col.slot]
+
+
+@pytest.fixture
+def slots_df():
+    return pd.DataFrame(
+        [
+            (day, 'Morning', slot, room, 45 if slot == 'First' else 30)
+            for day in ('Monday', 'Tuesday')
+            for slot in ('First', 'Second')
+            for room in ('Room A', 'Room B')
+        ],
+        columns=[Col.day, Col.session, Col.slot, Col.room, Col.duration],
+    )
+
+
+@pytest.fixture
+def talks_df():
+    return pd.DataFrame({
+        Col.submission: ['T1', 'T2', 'T3', 'T4', 'T5', 'T6'],
+        Col.duration: [45, 45, 30, 30, 30, 45],
+        Col.track: ['PyData', 'PyCon', 'PyData', 'PyCon', 'PyData', None],
+        Col.popularity: [1.0, 0.0, 0.5, 0.5, 0.5, 0.5],
+    })
+
+
+def test_schedule_model(talks_df, slots_df):
+    votes_df = pd.DataFrame({
+        Col.voter: ['v1', 'v1', 'v2', 'v2', 'v3'],
+        Col.submission: ['T1', 'T2', 'T1', 'T2', 'T3'],
+        Col.vote_score: [1, 1, 1, 1, 1],
+    })
+    parallel = parallel_penalty(votes_df, talks_df)
+    assert parallel[0, 1] == parallel[1, 0] == 1.0
+    assert parallel[0, 2] == 0.0
+
+    model = ScheduleModel(
+        talks_df,
+        slots_df,
+        capacities={'Room A': 500, 'Room B': 100},
+        availabilities=pd.DataFrame({Col.submission: ['T6'], Col.day: ['Tuesday']}),
+        preferences=pd.DataFrame({Col.submission: ['T3'], Col.day: ['Monday'], Col.session: ['Morning']}),
+        parallel=parallel,
+    )
+    # only slots with the duration of a talk and on the days the talk is available get variables
+    assert len(model.columns) == 2 * 4 + 3 * 4 + 2
+    result = model.solve()
+    assert result.status == 'Optimal'
+    assert result.gap == pytest.approx(0.0, abs=1e-4)
+
+    schedule = model.schedule().set_index(Col.submission)
+    assert sorted(schedule.index) == ['T1', 'T2', 'T3', 'T4', 'T5', 'T6']
+    assert schedule.loc['T6', Col.day] == 'Tuesday'
+    assert schedule.loc['T3', Col.day] == 'Monday'
+    assert schedule.loc['T1', Col.room] == 'Room A'  # most popular talk in the largest room
+    assert tuple(schedule.loc['T1', SLOT]) != tuple(schedule.loc['T2', SLOT])  # never in parallel
+
+
+def test_schedule_tracks(talks_df, slots_df):
+    talks_df = talks_df.iloc[:4]
+    model = ScheduleModel(talks_df, slots_df, weights=Weights(tracks={Col.track: 1.0}))
+    assert model.solve().objective == pytest.approx(-2.0)
+
+    schedule = model.schedule().merge(talks_df, on=Col.submission)
+    assert (schedule.groupby([Col.day, Col.session, Col.room])[Col.track].nunique() == 1).all()
+
+
+def test_reschedule(talks_df, slots_df):
+    weights = Weights(tracks={})
+    availabilities = pd.DataFrame({Col.submission: ['T6'], Col.day: ['Tuesday']})
+    model = ScheduleModel(talks_df, slots_df, availabilities=availabilities, weights=weights)
+    model.solve()
+    previous = model.schedule()
+
+    # T5 is cancelled and T6 can only be scheduled on Monday now
+    talks_df = talks_df.loc[talks_df[Col.submission] != 'T5']
+    availabilities = pd.DataFrame({Col.submission: ['T6'], Col.day: ['Monday']})
+    model = ScheduleModel(talks_df, slots_df, availabilities=availabilities, weights=weights)
+    with pytest.raises(TypeError):
+        model.reschedule(previous, unknown_option=1)
+    lp = model.highs.getLp()  # costs and bounds are restored after a failing solve
+    np.testing.assert_array_equal(lp.col_cost_, model.lp.col_cost_)
+    np.testing.assert_array_equal(lp.col_lower_, model.lp.col_lower_)
+    assert model.result().objective is None
+
+    result = model.reschedule(previous)
+    assert result.status == 'Optimal'
+    assert result.objective == pytest.approx(0.0)
+
+    schedule = model.schedule()
+    assert schedule.set_index(Col.submission).loc['T6', Col.day] == 'Monday'
+    stayed = previous.merge(schedule)[Col.submission]
+    assert len(stayed) >= 3  # at most one talk of T1 to T4 is swapped with T6
+
+
+def test_schedule_solution_file(talks_df, slots_df, tmp_path):
+    model = ScheduleModel(talks_df, slots_df)
+    model.write(tmp_path / 'schedule.mps')
+    highs = highspy.Highs()
+    highs.silent()
+    highs.readModel(str(tmp_path / 'schedule.mps'))
+    highs.run()
+    highs.writeSolution(str(tmp_path / 'schedule.sol'), 0)
+
+    sol = read_sol_columns(tmp_path / 'schedule.sol')
+    assert sol.names == model.lp.col_names_
+    schedule = model.schedule(sol.values)
+    assert len(schedule) == len(talks_df)
+    np.testing.assert_array_equal(schedule[Col.submission].sort_values(), talks_df[Col.submission])
+
+
+def test_scenario_runner(talks_df, slots_df, tmp_path):
+    runner = ScenarioRunner(talks_df, slots_df, tmp_path, max_workers=2, weights=Weights(tracks={}))
+    comparison = runner.run([
+        Scenario(name='base', time_limit=10),
+        Scenario(name='tracks', weights=Weights(tracks={Col.track: 1.0}), threads=1),
+        # three talks of 45 minutes but only two such slots on Monday
+        Scenario(
+            name='infeasible', availabilities=pd.DataFrame({Col.submission: ['T1', 'T2', 'T6'], Col.day: 'Monday'})
+        ),
+    ])
+
+    assert comparison.index.tolist() == ['base', 'tracks', 'infeasible']
+    assert comparison[Col.status].tolist() == ['Optimal', 'Optimal', 'Infeasible']
+    assert comparison.loc['base', Col.objective] == pytest.approx(0.0)
+    assert comparison.loc['tracks', Col.objective] < 0
+    assert pd.isna(comparison.loc['infeasible', Col.sol_file])
+
+    schedule = runner.schedule('tracks')
+    assert sorted(schedule[Col.submission]) == sorted(talks_df[Col.submission])
+    with pytest.raises(FileNotFoundError):
+        runner.schedule('infeasible')
+
+    # a failing scenario doesn't stop the others and the solution of an earlier run is not used
+    comparison = runner.run([
+        Scenario(name='tracks', availabilities=pd.DataFrame({Col.submission: ['T1', 'T2', 'T6'], Col.day: 'Monday'})),
+        Scenario(name='error', availabilities=pd.DataFrame({Col.submission: ['T1'], Col.day: ['Friday']})),
+    ])
+    assert comparison[Col.status].tolist() == ['Infeasible', 'Error']
+    assert 'T1' in comparison.loc['error', Col.error]
+    assert not (tmp_path / 'tracks.sol').exists()
+    with pytest.raises(FileNotFoundError):
+        runner.schedule('tracks')
+
+    comparison = runner.run([])
+    assert comparison.empty
+    assert [comparison.index.name, *comparison.columns] == COMPARISON_COLS
+
+
+def test_schedule_unfit_talk(talks_df, slots_df):
+    talks_df.loc[0, Col.duration] = 90
+    with pytest.raises(ValueError, match=r"\['T1'\]"):
+        ScheduleModel(talks_df, slots_df)
+
+
+def test_schedule_without_talks(talks_df, slots_df):
+    with pytest.raises(ValueError, match='no talks'):
+        ScheduleModel(talks_df.iloc[:0], slots_df)
@@ -0,0 +1,52 @@
+import httpx
+import pandas as pd
+import pytest
+
+from pytanis.utils import RateLimiter, SlidingWindowLimiter, TokenBucketLimiter, implode
+
+
+def test_sliding_window_limiter():
+    limiter = SlidingWindowLimiter(calls=2, seconds=10)
+    assert limiter.rate == 0.2
+    assert limiter.delay() == 0
+    assert limiter.delay() == 0
+    assert limiter.delay() == pytest.approx(10, abs=0.1)
+    with pytest.raises(TypeError):
+        RateLimiter()
+
+
+def test_token_bucket_limiter():
+    limiter = TokenBucketLimiter(4, burst=2, max_rate=8, increase=4, recovery=0)
+    assert [round(limiter.delay(), 1) for _ in range(4)] == [0, 0, 0.2, 0.5]
+
+    limiter.update(httpx.Response(429, headers={'Retry-After': '3'}))
+    assert limiter.rate == 2
+    assert limiter.delay() == pytest.approx(3, abs=0.1)
+
+    limiter.update(httpx.Response(200))
+    assert limiter.rate == 6
+    limiter.update(httpx.Response(200))
+    assert limiter.rate == 8
+
+    limiter.update(httpx.Response(200, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '60'}))
+    assert limiter.rate == 8
+    assert limiter.delay() == pytest.approx(60, abs=0.1)
+
+
+@pytest.mark.parametrize('key', [None, 'code', ['code', 'title']])
+def test_implode(key):
+    df = pd.DataFrame({
+        'code': ['B', 'A', 'B', 'C'],
+        'title': ['Beta', 'Alpha', 'Beta', None],
+        'speaker': ['Bob', 'Ada', 'Cleo', 'Dan'],
+        'duration': [30, 45, 30, 30],
+    })
+    imploded = implode(df, ['speaker', 'duration'], key=key)
+
+    assert list(imploded.columns) == list(df.columns)
+    rows = {row.code: (row.title, row.speaker, row.duration) for row in imploded.itertuples()}
+    assert rows['A'] == ('Alpha', ['Ada'], [45])
+    assert rows['B'] == ('Beta', ['Bob', 'Cleo'], [30, 30])
+    assert pd.isna(rows['C'][0])
+    # sorted by the other columns without key, otherwise in order of appearance
+    assert imploded['code'].tolist() == (['A', 'B', 'C'] if key is None else ['B', 'A', 'C'])